@@ -34,8 +34,7 @@ def canonicalize_envelope(envelope: Dict[str, Any]) -> bytes:
 
 def compute_payload_hash(payload: Dict[str, Any]) -> str:
     """Compute hex-encoded SHA-256 of the canonicalized payload object."""
-    payload_bytes = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
-    return hashlib.sha256(payload_bytes).hexdigest()
+    return hashlib.sha256(canonicalize_envelope(payload)).hexdigest()
 
 
 def sign_hmac(secret: bytes, envelope: Dict[str, Any]) -> str:
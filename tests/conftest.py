@@ -0,0 +1,46 @@
+"""Shared fixtures: the VUA scripts have hyphenated names, so load them by path."""
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_script(filename: str, name: str):
+    """Import ``filename`` from the repo root as module ``name`` (once per session)."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, ROOT / filename)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def core():
+    return load_script("vua-core.py", "vua_core")
+
+
+@pytest.fixture(scope="session")
+def validator():
+    return load_script("vua-manifest-validator.py", "vua_manifest_validator")
+
+
+@pytest.fixture(scope="session")
+def attest():
+    return load_script("vua-attestation-gen.py", "vua_attestation_gen")
+
+
+@pytest.fixture(scope="session")
+def daemon():
+    return load_script("vua-daemon.py", "vua_daemon")
+
+
+@pytest.fixture(autouse=True)
+def no_checkpoint_key(monkeypatch):
+    """Tests pass checkpoint keys explicitly; ignore any set in the environment."""
+    monkeypatch.delenv("VUA_CHECKPOINT_KEY", raising=False)
+    monkeypatch.delenv("VUA_CHECKPOINT_KEY_FILE", raising=False)
@@ -0,0 +1,79 @@
+import hashlib
+import os
+
+import pytest
+
+
+@pytest.fixture
+def release(validator, tmp_path, monkeypatch):
+    (tmp_path / "bin").mkdir()
+    files = {"core": b"core" * 5000, "daemon": b"", "shell": os.urandom(70000)}
+    for name, data in files.items():
+        (tmp_path / "bin" / name).write_bytes(data)
+    # Manifests store artifact paths relative to themselves.
+    monkeypatch.chdir(tmp_path)
+    manifest = validator.ManifestGenerator.create(
+        "pkg", "1.0.0", list(files), artifacts={m: f"bin/{m}" for m in files})
+    path = tmp_path / "manifest.json"
+    validator.ManifestGenerator.save(manifest, str(path))
+    return path
+
+
+def validate(validator, path, cache=None):
+    checker = validator.ManifestValidator()
+    checker.artifact_cache = cache
+    assert checker.load(str(path))
+    return checker.full_validate()
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 4096, 1 << 20])
+def test_hash_file_matches_hashlib_for_any_chunk_size(validator, tmp_path, chunk):
+    data = os.urandom(10000)
+    (tmp_path / "f").write_bytes(data)
+    (tmp_path / "empty").write_bytes(b"")
+    assert validator.hash_file(str(tmp_path / "f"), chunk) == hashlib.sha256(data).hexdigest()
+    assert validator.hash_file(str(tmp_path / "empty"), chunk) == hashlib.sha256(b"").hexdigest()
+
+
+def test_generated_artifacts_verify(validator, release):
+    result = validate(validator, release)
+    assert result["valid"]
+    assert result["artifacts"] == {"core": "ok", "daemon": "ok", "shell": "ok"}
+
+
+def test_changed_missing_and_resized_artifacts(validator, release):
+    bin_dir = release.parent / "bin"
+    data = bytearray((bin_dir / "shell").read_bytes())
+    data[100] ^= 1
+    (bin_dir / "shell").write_bytes(bytes(data))
+    (bin_dir / "core").write_bytes(b"short")
+    (bin_dir / "daemon").unlink()
+    result = validate(validator, release)
+    assert not result["valid"]
+    assert result["artifacts"] == {"core": "size", "daemon": "missing", "shell": "mismatch"}
+
+
+def test_cached_artifact_digests_are_reused_until_the_file_changes(validator, release, monkeypatch):
+    cache = validator.ValidationCache(str(release.parent / "cache.db"))
+    first = validator.validate_cached(str(release), cache)
+    assert first["valid"]
+    cache.flush()
+
+    hashed = []
+    real = validator.hash_files
+    monkeypatch.setattr(validator, "hash_files",
+                        lambda paths, workers=None: hashed.extend(paths) or real(paths, workers))
+    checker = validator.ManifestValidator()
+    checker.artifact_cache = cache
+    checker.load(str(release))
+    assert checker.full_validate()["valid"] and hashed == []
+
+    shell = release.parent / "bin" / "shell"
+    st = os.stat(shell)
+    os.utime(shell, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert cache.lookup(str(release)) is None
+    checker = validator.ManifestValidator()
+    checker.artifact_cache = cache
+    checker.load(str(release))
+    assert checker.full_validate()["valid"] and hashed == [str(shell)]
+    cache.close()
@@ -0,0 +1,125 @@
+import json
+
+import pytest
+
+
+def test_chain_hash_follows_sealed_entries(attest):
+    gen = attest.AttestationGenerator()
+    for i in range(5):
+        gen.seal_state({"i": i})
+        assert gen.chain_hash() == gen._create_chain_hash(gen.attestations)
+
+    chain = gen.create_chain()
+    assert chain["count"] == 5
+    assert chain["chain_hash"] == gen._create_chain_hash(gen.attestations)
+    assert gen.check_chain(chain) is None
+
+
+def test_seal_many_extends_the_rolling_hash(attest):
+    gen = attest.AttestationGenerator()
+    gen.seal_build({"v": 0})
+    gen.seal_many("state", [{"i": i} for i in range(10)], batch_size=3)
+    assert gen._chain.count == 11
+    assert gen.chain_hash() == gen._create_chain_hash(gen.attestations)
+
+
+def test_chain_hash_catches_up_on_replaced_or_direct_lists(attest):
+    gen = attest.AttestationGenerator()
+    entries = [gen.seal_state({"i": i}) for i in range(4)]
+
+    gen.attestations = entries[:2]
+    assert gen.chain_hash() == gen._create_chain_hash(entries[:2])
+
+    gen.attestations.append(entries[3])
+    assert gen.chain_hash() == gen._create_chain_hash([entries[0], entries[1], entries[3]])
+
+
+def test_reset_chain_after_in_place_edit(attest):
+    gen = attest.AttestationGenerator()
+    for i in range(3):
+        gen.seal_state({"i": i})
+    gen.chain_hash()
+
+    gen.attestations[1] = gen.seal_build({"replacement": True})
+    gen.attestations.pop()
+    gen.reset_chain()
+    assert gen.chain_hash() == gen._create_chain_hash(gen.attestations)
+
+
+def test_check_chain_detects_tampered_member(attest):
+    gen = attest.AttestationGenerator()
+    gen.seal_state({"a": 1})
+    gen.seal_state({"b": 2})
+    chain = json.loads(json.dumps(gen.create_chain()))
+    chain["attestations"][0]["system"] = "OTHER"
+    assert gen.check_chain(chain).startswith("member 0")
+
+
+def test_chain_writer_matches_create_chain(attest, tmp_path):
+    gen = attest.AttestationGenerator()
+    entries = [gen.seal_state({"i": i}) for i in range(4)]
+
+    path = tmp_path / "chain.json"
+    with attest.ChainWriter(str(path)) as writer:
+        writer.extend(entries)
+    written = json.loads(path.read_text())
+    assert written["count"] == 4
+    assert written["chain_hash"] == gen.create_chain()["chain_hash"]
+    assert gen.check_chain(written) is None
+
+
+def test_chain_writer_refuses_an_empty_chain(attest, tmp_path):
+    path = tmp_path / "chain.json"
+    writer = attest.ChainWriter(str(path))
+    assert "error" in writer.close()
+    assert not path.exists()
+    assert not (tmp_path / "chain.json.tmp").exists()
+
+
+NOW = 1760000000.123456
+
+
+@pytest.fixture
+def frozen_clock(attest, monkeypatch):
+    class FrozenDatetime(attest.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return attest.datetime.fromtimestamp(NOW, tz)
+
+    monkeypatch.setattr(attest, "datetime", FrozenDatetime)
+    monkeypatch.setattr(attest.time, "time", lambda: NOW)
+
+
+def test_batch_sealing_matches_single_seals(attest, tmp_path, frozen_clock):
+    manifest = tmp_path / "m.json"
+    manifest.write_text(json.dumps({"sha256_manifest": "ab" * 32, "version": "2.0", "modules": [1, 2]}))
+    cases = {
+        "state": ([{"i": 1}, {"nested": {"é": [1, 2.5]}}], lambda g, p: g.seal_state(p)),
+        "execution": ([("ls -l", {"code": 0}), ("false", {"code": 1})],
+                      lambda g, p: g.seal_execution(*p)),
+        "build": ([{"target": "x", "flags": ["-O2"]}], lambda g, p: g.seal_build(p)),
+        "manifest": ([str(manifest)], lambda g, p: g.seal_manifest(p)),
+    }
+    for seal_type, (payloads, single) in cases.items():
+        expected = [single(attest.AttestationGenerator("SYS"), p) for p in payloads]
+        for workers in (1, 2):
+            batch = attest.AttestationGenerator("SYS").seal_many(seal_type, payloads, workers=workers)
+            assert batch == expected, (seal_type, workers)
+
+
+def test_batch_sealing_reports_missing_manifests_and_unknown_types(attest, tmp_path):
+    gen = attest.AttestationGenerator()
+    entries = gen.seal_many("manifest", [str(tmp_path / "missing.json")])
+    assert entries == [{"error": f"Manifest not found: {tmp_path / 'missing.json'}"}]
+    assert gen.attestations == []
+    with pytest.raises(ValueError):
+        gen.iter_seal_many("bogus", [])
+
+
+def test_seal_to_vault_streams_batches(attest, tmp_path):
+    gen = attest.AttestationGenerator()
+    vault = attest.LogAttestationVault(str(tmp_path / "v.vlog"))
+    stored = gen.seal_to_vault("state", ({"i": i} for i in range(25)), vault, batch_size=10)
+    assert stored == 25 and vault.count()["attestations"] == 25
+    assert gen.attestations == []
+    vault.close()
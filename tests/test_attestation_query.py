@@ -0,0 +1,103 @@
+def mixed(attest, count):
+    gen = attest.AttestationGenerator()
+    out = []
+    for i in range(count):
+        if i % 2:
+            out.append(gen.seal_execution("cmd %d" % i, {"code": i}))
+        else:
+            out.append(gen.seal_state({"i": i}))
+    return out
+
+
+def brute(entries, seal_type=None, seal=None):
+    return [e for e in entries
+            if (seal_type is None or e["type"] == seal_type)
+            and (seal is None or e["seal"] == seal)]
+
+
+def test_query_filters_and_pages(attest, tmp_path):
+    entries = mixed(attest, 9)
+    vault = attest.LogAttestationVault(str(tmp_path / "vault.vlog"))
+    vault.add_many(entries)
+
+    assert vault.query(seal_type="state_seal")["attestations"] == brute(entries, "state_seal")
+    target = entries[5]["seal"]
+    assert vault.query(seal=target)["attestations"] == [entries[5]]
+
+    pages, cursor = [], None
+    while True:
+        page = vault.query(limit=4, cursor=cursor)
+        pages.extend(page["attestations"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert pages == entries
+    vault.close()
+
+
+def test_stale_keys_from_another_log_are_rebuilt(attest, tmp_path):
+    path = tmp_path / "vault.vlog"
+    old = mixed(attest, 3)
+    vault = attest.LogAttestationVault(str(path))
+    vault.add_many(old)
+    vault.close()
+    keys = (tmp_path / "vault.vlog.keys").read_bytes()
+    names = (tmp_path / "vault.vlog.keys.names").read_bytes()
+
+    # Recreate the log with more, different entries; the old index is left behind.
+    path.unlink()
+    (tmp_path / "vault.vlog.idx").unlink()
+    new = mixed(attest, 6)[::-1]
+    vault = attest.LogAttestationVault(str(path))
+    vault.add_many(new)
+    vault.close()
+    (tmp_path / "vault.vlog.keys").write_bytes(keys)
+    (tmp_path / "vault.vlog.keys.names").write_bytes(names)
+
+    vault = attest.LogAttestationVault(str(path))
+    assert vault.query(seal_type="state_seal")["attestations"] == brute(new, "state_seal")
+    assert vault.query(seal=old[1]["seal"])["attestations"] == []
+    vault.close()
+
+
+def test_keys_out_of_step_with_the_same_log_are_rebuilt(attest, tmp_path):
+    path = tmp_path / "vault.vlog"
+    entries = mixed(attest, 4)
+    vault = attest.LogAttestationVault(str(path))
+    vault.add_many(entries[:2])
+    vault.close()
+    keys = (tmp_path / "vault.vlog.keys").read_bytes()
+
+    vault = attest.LogAttestationVault(str(path))
+    vault.add_many(entries[2:])
+    vault.close()
+    # Same stamp, but the saved index describes entries that are now elsewhere.
+    index = attest.AttestationIndex(str(tmp_path / "other.keys"))
+    for e in entries[2:]:
+        index.add(e)
+    index.close()
+    record = attest.AttestationIndex.RECORD.size
+    (tmp_path / "vault.vlog.keys").write_bytes(keys[:-2 * record] + (tmp_path / "other.keys").read_bytes()[-2 * record:])
+
+    vault = attest.LogAttestationVault(str(path))
+    assert vault.query(seal=entries[1]["seal"])["attestations"] == [entries[1]]
+    assert vault.query()["attestations"] == entries
+    vault.close()
+
+
+def test_compaction_keeps_the_index_stamp(attest, tmp_path):
+    path = tmp_path / "vault.vlog"
+    entries = mixed(attest, 5)
+    vault = attest.LogAttestationVault(str(path))
+    vault.add_many(entries)
+    log_id = vault.log_id
+    vault.compact()
+    assert vault.log_id == log_id
+    vault.close()
+    keys = tmp_path / "vault.vlog.keys"
+    before = keys.read_bytes()
+
+    vault = attest.LogAttestationVault(str(path))
+    assert vault.query(seal_type="execution_seal")["attestations"] == brute(entries, "execution_seal")
+    vault.close()
+    assert keys.read_bytes() == before
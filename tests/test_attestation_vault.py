@@ -0,0 +1,190 @@
+import json
+
+
+def sealed(attest, count, start=0):
+    gen = attest.AttestationGenerator()
+    return [gen.seal_state({"i": i}) for i in range(start, start + count)]
+
+
+def test_log_vault_round_trip_and_reopen(attest, tmp_path):
+    path = tmp_path / "vault.vlog"
+    entries = sealed(attest, 5)
+    vault = attest.LogAttestationVault(str(path))
+    assert vault.add_many(entries) == 5
+    vault.set_meta("owner", "tests")
+    vault.close()
+
+    vault = attest.LogAttestationVault(str(path))
+    assert vault.get_attestations() == entries
+    assert vault.meta == {"owner": "tests"}
+    assert vault.count() == {"attestations": 5, "chains": 0}
+    vault.close()
+
+
+def test_reopen_leaves_an_intact_index_untouched(attest, tmp_path):
+    path = tmp_path / "vault.vlog"
+    vault = attest.LogAttestationVault(str(path))
+    vault.add_many(sealed(attest, 3))
+    vault.close()
+    idx = tmp_path / "vault.vlog.idx"
+    before = idx.stat().st_mtime_ns, idx.read_bytes()
+
+    attest.LogAttestationVault(str(path)).close()
+    assert (idx.stat().st_mtime_ns, idx.read_bytes()) == before
+
+
+def test_torn_tail_behind_a_persisted_index_entry(attest, tmp_path):
+    path = tmp_path / "vault.vlog"
+    entries = sealed(attest, 4)
+    vault = attest.LogAttestationVault(str(path))
+    vault.add_many(entries)
+    vault.close()
+
+    # The last record's line lost its end, but its .idx entry survived.
+    data = path.read_bytes()
+    path.write_bytes(data[:-20])
+
+    vault = attest.LogAttestationVault(str(path))
+    assert vault.get_attestations() == entries[:3]
+    vault.add_attestation(entries[3])
+    vault.close()
+
+    vault = attest.LogAttestationVault(str(path))
+    assert vault.get_attestations() == entries
+    vault.close()
+
+
+def test_corrupt_tail_record_is_dropped(attest, tmp_path):
+    path = tmp_path / "vault.vlog"
+    entries = sealed(attest, 3)
+    vault = attest.LogAttestationVault(str(path))
+    vault.add_many(entries)
+    vault.close()
+
+    lines = path.read_bytes().split(b"\n")
+    lines[-2] = b"x" * len(lines[-2])
+    path.write_bytes(b"\n".join(lines))
+
+    vault = attest.LogAttestationVault(str(path))
+    assert vault.get_attestations() == entries[:2]
+    vault.close()
+
+
+def test_unindexed_records_and_missing_index_are_recovered(attest, tmp_path):
+    path = tmp_path / "vault.vlog"
+    entries = sealed(attest, 3)
+    vault = attest.LogAttestationVault(str(path))
+    vault.add_many(entries)
+    vault.close()
+
+    idx = tmp_path / "vault.vlog.idx"
+    idx.write_bytes(idx.read_bytes()[:-8 - 3])  # last entry lost, plus a torn one
+    vault = attest.LogAttestationVault(str(path))
+    assert vault.get_attestations() == entries
+    vault.close()
+
+    idx.unlink()
+    vault = attest.LogAttestationVault(str(path))
+    assert vault.get_attestations() == entries
+    vault.close()
+
+
+def test_compaction_references_members_unambiguously(attest, tmp_path):
+    path = tmp_path / "vault.vlog"
+    entries = sealed(attest, 3)
+    lookalike = {"$ref": 0, "note": "a real member, not a reference"}
+    chain = {"type": "attestation_chain", "attestations": [entries[1], lookalike, entries[2]],
+             "chain_hash": "x"}
+    vault = attest.LogAttestationVault(str(path))
+    vault.add_many(entries)
+    vault.add_chain(chain)
+    vault.set_meta("owner", "a")
+    vault.set_meta("owner", "b")
+    vault.compact()
+    assert vault.get_chains() == [chain]
+    assert vault.meta == {"owner": "b"}
+
+    # Compacting again keeps existing references as references.
+    vault.compact()
+    vault.close()
+    vault = attest.LogAttestationVault(str(path))
+    assert vault.get_chains() == [chain]
+    assert vault.get_attestations() == entries
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r["r"] for r in records if r["k"] == "c"] == [[0, 2]]
+    vault.close()
+
+
+def test_import_json(attest, tmp_path):
+    entries = sealed(attest, 2)
+    legacy = tmp_path / "attestations.json"
+    legacy.write_text(json.dumps({"attestations": entries, "chains": [], "created": "then"}))
+    vault = attest.LogAttestationVault.import_json(str(legacy), str(tmp_path / "vault.vlog"))
+    assert vault.get_attestations() == entries
+    assert vault.meta == {"created": "then"}
+    vault.close()
+
+
+def audit_fixture(attest, tmp_path):
+    gen = attest.AttestationGenerator()
+    entries = [gen.seal_state({"i": i}) for i in range(6)]
+    tampered = dict(entries[2], system="FORGED")
+    vault = attest.LogAttestationVault(str(tmp_path / "vault.vlog"))
+    vault.add_many(entries[:2] + [tampered] + entries[3:])
+    vault.add_chain(gen.create_chain())
+    vault.add_chain(gen.create_chain(include_attestations=False))
+    return vault
+
+
+def test_audit_reports_bad_seals_and_memberless_chains(attest, tmp_path):
+    vault = audit_fixture(attest, tmp_path)
+    report = tmp_path / "audit.ndjson"
+    summary = attest.audit_vault(vault, str(report), str(tmp_path / "audit.json"),
+                                 workers=1, batch_size=4)
+    assert summary["attestations"] == 6
+    assert summary["chains"] == 2
+    failures = [json.loads(line) for line in report.read_text().splitlines()]
+    assert [(f["kind"], f["n"]) for f in failures] == [("attestation", 2), ("chain", 1)]
+    assert failures[0]["reason"] == "seal mismatch"
+    assert not (tmp_path / "audit.json").exists()
+    vault.close()
+
+
+def test_audit_resumes_from_its_checkpoint(attest, tmp_path):
+    vault = audit_fixture(attest, tmp_path)
+    report = tmp_path / "audit.ndjson"
+    checkpoint = tmp_path / "audit.json"
+    # As left by an audit interrupted after the first four attestations,
+    # with a report line written past the checkpoint.
+    line = json.dumps({"kind": "attestation", "n": 2, "reason": "seal mismatch"}) + "\n"
+    report.write_text(line + "stale line\n")
+    checkpoint.write_text(json.dumps({"vault": str(vault.vault_path), "attestations": 4,
+                                      "chains": 0, "failures": 1, "report_bytes": len(line)}))
+
+    summary = attest.audit_vault(vault, str(report), str(checkpoint), workers=1, batch_size=4)
+    assert summary["resumed"]
+    assert summary["failures"] == 2
+    lines = report.read_text().splitlines()
+    assert len(lines) == 2 and "stale" not in report.read_text()
+    vault.close()
+
+
+def test_audit_sqlite_and_legacy_vaults(attest, tmp_path):
+    gen = attest.AttestationGenerator()
+    entries = [gen.seal_state({"i": i}) for i in range(3)]
+    entries[1] = dict(entries[1], checksum="0" * 16)
+    for vault in (attest.SQLiteAttestationVault(str(tmp_path / "v.db")),
+                  attest.AttestationVault(str(tmp_path / "v.json"))):
+        vault.add_many(entries)
+        report = tmp_path / "report.ndjson"
+        summary = attest.audit_vault(vault, str(report), workers=1)
+        assert summary["failures"] == 1
+        assert json.loads(report.read_text())["reason"] == "checksum mismatch"
+
+
+def test_check_seal_is_deterministic(attest):
+    gen = attest.AttestationGenerator()
+    entry = gen.seal_state({"a": 1})
+    assert gen.check_seal(entry) is None
+    assert gen.check_seal(dict(entry, timestamp="not a time")) == "missing or unreadable timestamp"
+    assert gen.check_seal(dict(entry, timestamp="2000-01-01T00:00:00+00:00")) == "seal mismatch"
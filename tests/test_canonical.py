@@ -0,0 +1,83 @@
+import hashlib
+import json
+
+import pytest
+
+
+def legacy(obj):
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
+
+
+DOCUMENTS = [
+    {},
+    [],
+    {"b": 1, "a": [1, 2.5, None, True], "c": {"z": "ü☃", "y": {}}},
+    {2: "int keys", 1: "sort numerically"},
+    ["x" * 100, {"nested": [[1], [2, [3]]]}],
+    "plain string",
+    12345,
+]
+
+
+@pytest.mark.parametrize("doc", DOCUMENTS)
+def test_encode_matches_json_dumps(core, doc):
+    assert core.CANONICAL.encode(doc) == legacy(doc)
+    assert core.CANONICAL.dumps(doc) == legacy(doc).decode()
+    assert core.CANONICAL.hexdigest(doc) == hashlib.sha256(legacy(doc)).hexdigest()
+
+
+def test_frozen_subtrees_are_spliced_in(core):
+    inner = {"k": list(range(20)), "s": "value"}
+    frozen = core.CANONICAL.freeze(inner)
+    assert frozen.canonical == legacy(inner)
+    assert frozen.digest == hashlib.sha256(legacy(inner)).hexdigest()
+
+    outer = {"a": frozen, "b": [frozen, 1]}
+    plain = {"a": inner, "b": [inner, 1]}
+    assert core.CANONICAL.encode(outer) == legacy(plain)
+    assert core.CANONICAL.hexdigest(outer) == hashlib.sha256(legacy(plain)).hexdigest()
+    assert core.CANONICAL.hexdigest(frozen) == frozen.digest
+
+
+def test_large_trees_stream_with_identical_digest(core):
+    doc = {"rows": [{"id": i, "name": f"row {i}", "tags": ["a", "b"]} for i in range(20000)]}
+    assert not core.CANONICAL._small(doc)
+
+    class Recorder:
+        def __init__(self):
+            self.hasher = hashlib.sha256()
+            self.largest = 0
+
+        def update(self, data):
+            self.largest = max(self.largest, len(data))
+            self.hasher.update(data)
+
+    recorder = Recorder()
+    core.CANONICAL.update(recorder, doc)
+    assert recorder.hasher.hexdigest() == hashlib.sha256(legacy(doc)).hexdigest()
+    assert recorder.largest < len(legacy(doc)) // 4
+
+
+def test_unserialisable_values_raise(core):
+    with pytest.raises(TypeError):
+        core.CANONICAL.encode({"x": object()})
+
+
+def test_hash_object_and_hash_objects_agree(core):
+    docs = [{"i": i, "v": [i] * 3} for i in range(50)]
+    expected = [hashlib.sha256(legacy(d)).hexdigest() for d in docs]
+    assert [core.CryptoEngine.hash_object(d) for d in docs] == expected
+    assert list(core.CryptoEngine.hash_objects(docs)) == expected
+
+
+def test_scripts_share_the_core_engine(core, validator, attest):
+    assert validator.CANONICAL is core.CANONICAL
+    assert attest.CANONICAL is core.CANONICAL
+
+    manifest = validator.ManifestGenerator.create("pkg", "1.0", ["a", "b", "c"],
+                                                  timestamp="2026-01-01T00:00:00+00:00")
+    body = {k: v for k, v in manifest.items() if k != "sha256_manifest"}
+    assert manifest["sha256_manifest"] == hashlib.sha256(legacy(body)).hexdigest()
+
+    gen = attest.AttestationGenerator()
+    assert gen._hash_object({"b": 2, "a": 1}) == hashlib.sha256(b'{"a":1,"b":2}').hexdigest()
@@ -0,0 +1,81 @@
+import threading
+
+import pytest
+
+
+def test_concurrent_submits_form_one_valid_chain(core):
+    log = core.EventLog("GROUP")
+    futures = []
+    lock = threading.Lock()
+
+    def producer(n):
+        for i in range(50):
+            future = log.submit("tick", f"{n}:{i}", {"n": n, "i": i})
+            with lock:
+                futures.append(future)
+
+    threads = [threading.Thread(target=producer, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    hashes = {f.result(timeout=10) for f in futures}
+    log.stop_committer()
+
+    assert len(log.events) == 200
+    assert hashes == {e["hash"] for e in log.events}
+    assert log.verify_chain(full=True)
+    # Each producer's events keep their submission order.
+    for n in range(4):
+        assert [e["data"]["i"] for e in log.events if e["data"]["n"] == n] == list(range(50))
+
+
+def test_committed_hash_matches_the_plain_append_hash(core):
+    log = core.EventLog("GROUP")
+    log.append("tick", "plain", {"b": [1, 2], "a": "x"})
+    log.submit("tick", "grouped", {"b": [1, 2], "a": "x"}).result(timeout=10)
+    log.stop_committer()
+    for event in log.events:
+        body = {k: v for k, v in event.items() if k != "hash"}
+        assert core.CryptoEngine.hash_object(body) == event["hash"]
+
+
+def test_a_bad_event_fails_only_its_own_future(core):
+    log = core.EventLog("GROUP")
+    log.start_committer(batch_size=8)
+    good = log.submit("tick", "ok", {"i": 1})
+    bad = log.submit("tick", "bad", {"i": object()})
+    after = log.submit("tick", "ok", {"i": 2})
+    log.stop_committer()
+    assert good.result() and after.result()
+    with pytest.raises(TypeError):
+        bad.result()
+    assert [e["message"] for e in log.events] == ["ok", "ok"]
+    assert log.verify_chain(full=True)
+
+
+def test_submit_after_stop_needs_a_restart(core):
+    log = core.EventLog("GROUP")
+    log.submit("tick", "one").result(timeout=10)
+    log.stop_committer()
+    with pytest.raises(RuntimeError):
+        log.submit("tick", "two")
+    log.start_committer()
+    log.submit("tick", "two").result(timeout=10)
+    log.stop_committer()
+    assert [e["message"] for e in log.events] == ["one", "two"]
+
+
+def test_group_commit_on_a_segmented_store(core, tmp_path):
+    store = core.SegmentedEventStore(str(tmp_path))
+    log = core.EventLog("GROUP", storage=store)
+    futures = [log.submit("tick", f"event {i}", {"i": i}) for i in range(30)]
+    log.append("tick", "direct")
+    log.stop_committer()
+    assert all(f.done() for f in futures)
+    store.close()
+
+    store = core.SegmentedEventStore(str(tmp_path))
+    reopened = core.EventLog("GROUP", storage=store)
+    assert len(store) == 31 and reopened.verify_chain(full=True)
+    store.close()
@@ -0,0 +1,108 @@
+import json
+import os
+import socket
+import stat
+import tempfile
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def server(daemon, tmp_path, monkeypatch):
+    # Unix socket paths are short; keep this one out of the deep pytest tree.
+    directory = tempfile.mkdtemp(prefix="vua-")
+    path = os.path.join(directory, "d.sock")
+    monkeypatch.chdir(tmp_path)
+    instance = daemon.VUADaemon(path)
+    thread = threading.Thread(target=instance.serve, daemon=True)
+    thread.start()
+    for _ in range(200):
+        if daemon.ping(path):
+            break
+        time.sleep(0.01)
+    yield instance
+    daemon.call({"op": "shutdown"}, path)
+    thread.join(5)
+    os.rmdir(directory)
+
+
+def roundtrip(daemon, path, body: bytes) -> bytes:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(10)
+        sock.connect(path)
+        daemon.write_frame(sock, body)
+        return daemon.read_frame(sock)
+
+
+def test_socket_is_owner_only(daemon, server):
+    assert stat.S_IMODE(os.stat(server.socket_path).st_mode) == 0o600
+    assert stat.S_ISSOCK(os.stat(server.socket_path).st_mode)
+
+
+def test_json_ops_keep_state_between_calls(daemon, server):
+    path = server.socket_path
+    assert daemon.call({"op": "ping"}, path)["result"]["pid"] == os.getpid()
+    first = daemon.call({"op": "state.update", "data": {"a": 1}}, path)
+    second = daemon.call({"op": "state.update", "data": {"b": 2}}, path)
+    assert second["result"]["cycle"] == first["result"]["cycle"] + 1
+    assert daemon.call({"op": "state.get"}, path)["result"]["data"] == {"a": 1, "b": 2}
+
+    for i in range(3):
+        response = daemon.call({"op": "log.append", "type": "tick", "data": {"i": i}}, path)
+    assert response["result"]["count"] == 3
+    export = daemon.call({"op": "log.export"}, path)["result"]
+    assert export["count"] == 3 and export["verified"]
+
+    seal = daemon.call({"op": "seal.state", "data": {"x": 1}}, path)
+    assert seal["ok"] and seal["result"]["type"] == "state_seal"
+
+
+def test_errors_and_unknown_ops(daemon, server):
+    path = server.socket_path
+    unknown = daemon.call({"op": "nope"}, path)
+    assert (unknown["ok"], unknown["exit_code"]) == (False, 2)
+    failed = daemon.call({"op": "state.update"}, path)
+    assert (failed["ok"], failed["exit_code"]) == (False, 1) and "KeyError" in failed["error"]
+    bad = json.loads(roundtrip(daemon, path, b"{not json"))
+    assert (bad["ok"], bad["exit_code"]) == (False, 2)
+
+
+def test_text_mode_frames(daemon, server):
+    path = server.socket_path
+    reply = roundtrip(daemon, path, json.dumps(
+        {"op": "run", "script": "vua-manifest-validator.py", "args": [], "mode": "text"}).encode())
+    status, _, text = reply.decode().partition("\n")
+    assert status == "0" and "validate MANIFEST" in text
+
+    reply = roundtrip(daemon, path, json.dumps({"op": "nope", "mode": "text"}).encode()).decode()
+    assert reply == "2\nError: unknown op: nope\n"
+
+
+def test_relative_paths_resolve_against_the_request_cwd(daemon, server, tmp_path):
+    manifest = {"package": "demo", "credit": "tests", "version": "1.0.0",
+                "modules": ["core"], "sha256_manifest": "0" * 64}
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "m.json").write_text(json.dumps(manifest))
+    response = daemon.call({"op": "validate", "path": "m.json", "cwd": str(tmp_path / "sub")},
+                           server.socket_path)
+    # Only a manifest that loaded gets as far as the individual checks.
+    assert "checks" in response["result"]
+    # The daemon's own cwd is restored after a CLI run in another directory.
+    daemon.call({"op": "run", "script": "vua-core.py", "args": [], "cwd": str(tmp_path / "sub")},
+                server.socket_path)
+    assert os.getcwd() == server.cwd == str(tmp_path)
+    assert daemon.call({"op": "run", "script": "other.py"}, server.socket_path)["exit_code"] == 2
+
+
+def test_oversized_and_truncated_frames(daemon):
+    left, right = socket.socketpair()
+    with left, right:
+        left.sendall(daemon.FRAME.pack(daemon.MAX_FRAME + 1))
+        with pytest.raises(ValueError):
+            daemon.read_frame(right)
+        left.sendall(daemon.FRAME.pack(10) + b"abc")
+        left.shutdown(socket.SHUT_WR)
+        with pytest.raises(ConnectionError):
+            daemon.read_frame(right)
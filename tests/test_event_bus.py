@@ -0,0 +1,114 @@
+import asyncio
+import threading
+
+import pytest
+
+
+def test_topics_patterns_and_unknown_topics(core):
+    bus = core.EventBus()
+    everything = bus.subscribe("*")
+    state = bus.subscribe("state.*")
+    log = bus.subscribe("log.append")
+    assert bus.publish("state.update", {"n": 1}) == 2
+    assert bus.publish("log.append", {"n": 2}) == 2
+    assert [everything.get_nowait()["seq"], everything.get_nowait()["seq"]] == [1, 2]
+    assert state.get_nowait()["payload"] == {"n": 1} and state.get_nowait() is None
+    assert log.get_nowait()["payload"] == {"n": 2}
+    with pytest.raises(KeyError):
+        bus.publish("state.typo", {})
+    with pytest.raises(KeyError):
+        bus.subscribe("state.typo")
+    bus.register_topic("custom.topic")
+    assert bus.publish("custom.topic", {}) == 1
+
+
+def test_drop_oldest_bounds_the_queue(core):
+    bus = core.EventBus()
+    sub = bus.subscribe("*", maxsize=3)
+    for i in range(5):
+        bus.publish("log.append", {"i": i})
+    assert len(sub) == 3 and sub.dropped == 2
+    assert [sub.get_nowait()["payload"]["i"] for _ in range(3)] == [2, 3, 4]
+
+
+def test_coalesce_merges_deltas_per_key(core):
+    bus = core.EventBus()
+    sub = bus.subscribe("state.*", maxsize=2, policy="coalesce")
+    bus.publish("state.update", {"cycle": 1, "delta": {"a": 1}}, key="s1")
+    bus.publish("state.update", {"cycle": 2, "delta": {"b": 2}}, key="s1")
+    bus.publish("state.update", {"cycle": 1, "delta": {"x": 0}}, key="s2")
+    bus.publish("state.update", {"cycle": 1, "delta": {}}, key="s3")
+    assert sub.dropped == 1
+    message = sub.get_nowait()
+    assert message["key"] == "s2"
+    assert sub.get_nowait()["key"] == "s3"
+
+    bus.publish("state.update", {"cycle": 3, "delta": {"a": 1}}, key="s1")
+    bus.publish("state.update", {"cycle": 4, "delta": {"a": 5, "b": 2}}, key="s1")
+    merged = sub.get_nowait()
+    assert merged["payload"] == {"cycle": 4, "delta": {"a": 5, "b": 2}}
+    assert merged["coalesced"] == 2
+
+
+def test_block_policy_waits_for_the_consumer(core):
+    bus = core.EventBus()
+    sub = bus.subscribe("*", maxsize=1, policy="block", block_timeout=5)
+    bus.publish("log.append", {"i": 0})
+    published = threading.Event()
+
+    def publisher():
+        bus.publish("log.append", {"i": 1})
+        published.set()
+
+    thread = threading.Thread(target=publisher)
+    thread.start()
+    assert not published.wait(0.1)
+    assert sub.get(timeout=1)["payload"] == {"i": 0}
+    assert published.wait(5)
+    assert sub.get(timeout=1)["payload"] == {"i": 1}
+    thread.join()
+
+    sub.block_timeout = 0.01
+    bus.publish("log.append", {"i": 2})
+    bus.publish("log.append", {"i": 3})
+    assert sub.dropped == 1
+
+
+def test_close_wakes_consumers_and_unsubscribes(core):
+    bus = core.EventBus()
+    sub = bus.subscribe("*")
+    bus.publish("log.append", {"i": 0})
+    result = []
+    thread = threading.Thread(target=lambda: result.extend(sub))
+    thread.start()
+    sub.close()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert bus.publish("log.append", {"i": 1}) == 0
+
+
+def test_core_objects_publish_deltas(core):
+    bus = core.EventBus()
+    sub = bus.subscribe("*")
+    state = core.StateVector("BUS", bus=bus)
+    state.update({"a": 1})
+    log = core.EventLog("BUS", bus=bus)
+    log.append("tick", "hello")
+    core.MetricsCollector(bus=bus).record("cpu", 0.5)
+    topics = [sub.get_nowait()["topic"] for _ in range(len(sub))]
+    assert topics == ["state.update", "log.append", "metrics.record"]
+
+
+def test_async_subscription(core):
+    async def main():
+        bus = core.EventBus()
+        sub = bus.subscribe_async("log.*")
+        with pytest.raises(ValueError):
+            bus.subscribe_async("*", policy="block")
+        threading.Thread(target=lambda: [bus.publish("log.append", {"i": i}) for i in range(3)]).start()
+        got = [(await sub.get())["payload"]["i"] for _ in range(3)]
+        sub.close()
+        assert await sub.get() is None
+        return got
+
+    assert asyncio.run(main()) == [0, 1, 2]
@@ -0,0 +1,48 @@
+def make_log(core, count):
+    log = core.EventLog("QUERY")
+    for i in range(count):
+        log.append("even" if i % 2 == 0 else "odd", f"event {i}", {"i": i})
+    return log
+
+
+def test_get_events_by_type(core):
+    log = make_log(core, 9)
+    assert [e["data"]["i"] for e in log.get_events("odd")] == [1, 3, 5, 7]
+    assert log.get_events("missing") == []
+    assert len(log.get_events()) == 9
+
+
+def test_query_time_range_is_inclusive(core):
+    log = make_log(core, 10)
+    stamps = [e["timestamp"] for e in log.events]
+    got = [e["index"] for e in log.query(since=stamps[3], until=stamps[6])]
+    # Events sharing a timestamp with a bound are included too.
+    expected = [i for i, t in enumerate(stamps) if stamps[3] <= t <= stamps[6]]
+    assert got == expected and {3, 4, 5, 6} <= set(got)
+
+    evens = [e["index"] for e in log.query("even", since=stamps[3])]
+    assert evens == [i for i in range(10) if i % 2 == 0 and stamps[i] >= stamps[3]]
+    assert list(log.query("missing")) == []
+
+
+def test_query_pages_with_a_cursor(core):
+    log = make_log(core, 11)
+    seen, cursor = [], None
+    while True:
+        page = list(log.query("odd", limit=2, cursor=cursor))
+        if not page:
+            break
+        seen.extend(e["index"] for e in page)
+        cursor = page[-1]["index"]
+    assert seen == [1, 3, 5, 7, 9]
+
+
+def test_time_index_keeps_out_of_order_inserts_sorted(core):
+    index = core.TimeIndex()
+    for position, epoch in enumerate([5.0, 1.0, 3.0, 3.0, 9.0]):
+        index.add(epoch, position)
+    assert list(index.keys) == [1.0, 3.0, 3.0, 5.0, 9.0]
+    assert list(index.positions) == [1, 2, 3, 0, 4]
+    lo, hi = index.span(3.0, 5.0)
+    assert list(index.positions[lo:hi]) == [2, 3, 0]
+    assert index.after(3.0, 2) == 2
@@ -0,0 +1,69 @@
+import pytest
+
+
+KEY = "test-checkpoint-key"
+
+
+def make_log(core, count=0, **kwargs):
+    log = core.EventLog("TEST-LOG", **kwargs)
+    for i in range(count):
+        log.append("tick", f"event {i}", {"i": i})
+    return log
+
+
+def test_verify_chain_is_incremental(core):
+    log = make_log(core, 10)
+    assert log.verify_chain()
+    assert log.verified_count == 10
+    assert log.verified_hash == log.chain_hash
+
+    log.append("tick", "event 10", {"i": 10})
+    assert log.verify_chain()
+    assert log.verified_count == 11
+
+
+def test_incremental_verify_skips_checked_prefix_but_full_does_not(core):
+    log = make_log(core, 5)
+    assert log.verify_chain()
+
+    log.events[2]["message"] = "tampered"
+    assert log.verify_chain()
+    assert not log.verify_chain(full=True)
+
+
+def test_checkpoints_are_signed_every_interval(core):
+    log = make_log(core, 25, checkpoint_interval=10, checkpoint_key=KEY)
+    assert [cp["index"] for cp in log.checkpoints] == [10, 20]
+    assert all(log.verify_checkpoint(cp) for cp in log.checkpoints)
+
+    forged = dict(log.checkpoints[0], chain_hash="0" * 64)
+    assert not log.verify_checkpoint(forged)
+
+
+def test_full_verify_from_checkpoint(core):
+    log = make_log(core, 25, checkpoint_interval=10, checkpoint_key=KEY)
+    assert log.verify_chain(full=True, from_checkpoint=20)
+
+    log.events[22]["message"] = "tampered"
+    assert not log.verify_chain(full=True, from_checkpoint=20)
+    # An unknown checkpoint is a failure, not a silent fallback to genesis.
+    assert not log.verify_chain(full=True, from_checkpoint=15)
+
+
+def test_no_checkpoints_without_a_key(core):
+    log = make_log(core, 25, checkpoint_interval=10)
+    assert log.checkpoints == []
+    assert not log.verify_checkpoint({"index": 10, "chain_hash": "x", "signature": "y"})
+    with pytest.raises(ValueError):
+        log.checkpoint()
+
+
+def test_checkpoint_key_from_environment(core, monkeypatch, tmp_path):
+    monkeypatch.setenv("VUA_CHECKPOINT_KEY", KEY)
+    assert core.load_checkpoint_key() == KEY.encode()
+
+    monkeypatch.delenv("VUA_CHECKPOINT_KEY")
+    key_file = tmp_path / "key"
+    key_file.write_text("from-file\n")
+    monkeypatch.setenv("VUA_CHECKPOINT_KEY_FILE", str(key_file))
+    assert core.load_checkpoint_key() == b"from-file"
@@ -0,0 +1,29 @@
+import hashlib
+
+
+def test_hash_many_keeps_input_order_across_sizes(core):
+    big = core.CryptoEngine.PARALLEL_THRESHOLD
+    items = ["small", b"bytes", b"x" * big, "y" * (big + 1), b"", b"z" * (2 * big)] * 5
+    expected = [hashlib.sha256(i.encode() if isinstance(i, str) else i).hexdigest() for i in items]
+    assert core.CryptoEngine.hash_many(items) == expected
+
+
+def test_hash_many_streams_lazily(core):
+    consumed = []
+
+    def items():
+        for i in range(100):
+            consumed.append(i)
+            yield b"%d" % i
+
+    digests = core.CryptoEngine.hash_many(items(), stream=True)
+    assert not consumed
+    assert next(digests) == hashlib.sha256(b"0").hexdigest()
+    assert len(consumed) < 100
+    assert len(list(digests)) == 99
+
+
+def test_hash_many_other_algorithms(core):
+    items = [b"a", b"b" * core.CryptoEngine.PARALLEL_THRESHOLD]
+    assert core.CryptoEngine.hash_many(items, "sha512") == [hashlib.sha512(i).hexdigest() for i in items]
+    assert core.CryptoEngine.hash_many(items, "sha3_256") == [hashlib.sha3_256(i).hexdigest() for i in items]
@@ -0,0 +1,73 @@
+import hashlib
+
+import pytest
+
+
+def reference_root(hashes):
+    """RFC 6962 Merkle tree hash, computed recursively from scratch."""
+    if not hashes:
+        return hashlib.sha256(b"").digest()
+    if len(hashes) == 1:
+        return hashlib.sha256(b"\x00" + bytes.fromhex(hashes[0])).digest()
+    k = 1 << ((len(hashes) - 1).bit_length() - 1)
+    return hashlib.sha256(b"\x01" + reference_root(hashes[:k]) + reference_root(hashes[k:])).digest()
+
+
+def leaves(n):
+    return [hashlib.sha256(str(i).encode()).hexdigest() for i in range(n)]
+
+
+@pytest.fixture
+def tree(core):
+    tree = core.MerkleTree()
+    for h in leaves(33):
+        tree.append(h)
+    return tree
+
+
+def test_roots_match_the_reference_for_every_prefix(tree):
+    hashes = leaves(33)
+    for size in range(34):
+        assert tree.root(size) == reference_root(hashes[:size]).hex()
+
+
+def test_inclusion_proofs_verify_and_reject_tampering(core, tree):
+    hashes = leaves(33)
+    verify = core.MerkleTree.verify_inclusion
+    for size in (1, 2, 5, 16, 33):
+        root = tree.root(size)
+        for index in range(size):
+            proof = tree.inclusion_proof(index, size)
+            assert len(proof) <= size.bit_length()
+            assert verify(hashes[index], index, size, proof, root)
+            if size > 1:
+                assert not verify(hashes[index], (index + 1) % size, size, proof, root)
+            assert not verify(hashes[(index + 1) % 33], index, size, proof, root)
+    with pytest.raises(ValueError):
+        tree.inclusion_proof(33)
+
+
+def test_consistency_proofs_verify_and_reject_forged_roots(core, tree):
+    verify = core.MerkleTree.verify_consistency
+    for new in range(1, 34):
+        for old in range(0, new + 1):
+            proof = tree.consistency_proof(old, new)
+            old_root, new_root = tree.root(old), tree.root(new)
+            assert verify(old, new, old_root, new_root, proof)
+            if 0 < old < new:
+                assert not verify(old, new, tree.root(old - 1), new_root, proof)
+                assert not verify(old, new, old_root, tree.root(new - 1), proof)
+
+
+def test_event_log_proofs_cover_its_events(core):
+    log = core.EventLog("MERKLE")
+    for i in range(12):
+        log.append("tick", f"event {i}", {"i": i})
+    assert log.merkle_root() == reference_root([e["hash"] for e in log.events]).hex()
+
+    proof = log.inclusion_proof(7, 10)
+    assert core.MerkleTree.verify_inclusion(proof["entry_hash"], 7, 10, proof["proof"], proof["root"])
+    consistency = log.consistency_proof(5)
+    assert consistency["new_size"] == 12
+    assert core.MerkleTree.verify_consistency(5, 12, consistency["old_root"],
+                                              consistency["new_root"], consistency["proof"])
@@ -0,0 +1,117 @@
+import random
+
+import pytest
+
+
+def test_ring_stats_match_the_window(core):
+    ring = core.MetricRing(7)
+    rng = random.Random(3)
+    values = [rng.uniform(-50, 50) for _ in range(40)]
+    for n, value in enumerate(values, 1):
+        ring.add(value, float(n))
+        window = values[max(0, n - 7):n]
+        assert ring.count == len(window)
+        assert ring.min_queue[0][1] == min(window)
+        assert ring.max_queue[0][1] == max(window)
+        assert ring.total == pytest.approx(sum(window))
+        assert ring.latest() == value
+    assert [v for _, v, _ in ring.samples()] == values[-7:]
+
+
+def test_collector_stats_and_interned_tags(core):
+    metrics = core.MetricsCollector(window_size=3)
+    for value in (5, 1, 9, 4):
+        metrics.record("cpu", value, {"host": "a"})
+    assert metrics.get_stats("cpu") == {"count": 3, "min": 1, "max": 9,
+                                        "avg": pytest.approx(14 / 3), "latest": 4}
+    samples = metrics.get_metric("cpu")
+    assert [s["value"] for s in samples] == [1, 9, 4]
+    assert all(s["tags"] == {"host": "a"} for s in samples)
+    assert len(metrics._tags) == 2
+    assert metrics.get_stats("missing") == {} and metrics.get_metric("missing") == []
+
+
+def exact(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def test_sketch_quantiles_are_within_relative_accuracy(core):
+    rng = random.Random(7)
+    values = [rng.lognormvariate(0, 2) for _ in range(5000)]
+    values += [-v for v in values[:500]] + [0.0] * 50
+    one, batch = core.QuantileSketch(0.01), core.QuantileSketch(0.01)
+    for value in values:
+        one.add(value)
+    batch.add_many(values)
+    for q in (0, 0.01, 0.1, 0.25, 0.5, 0.9, 0.99, 1):
+        expected = exact(values, q)
+        for sketch in (one, batch):
+            assert sketch.quantile(q) == pytest.approx(expected, rel=0.01, abs=1e-12)
+    assert (batch.positive, batch.negative, batch.zero_count, batch.count) == \
+        (one.positive, one.negative, one.zero_count, one.count)
+
+
+def test_sketch_merge_and_round_trip(core):
+    rng = random.Random(11)
+    left = [rng.uniform(1, 1000) for _ in range(2000)]
+    right = [rng.uniform(500, 5000) for _ in range(2000)]
+    a, b = core.QuantileSketch(0.02), core.QuantileSketch(0.02)
+    a.add_many(left)
+    b.add_many(right)
+    a.merge(b)
+    assert a.count == 4000
+    assert a.quantile(0.5) == pytest.approx(exact(left + right, 0.5), rel=0.02)
+    clone = core.QuantileSketch.from_dict(a.to_dict())
+    assert clone.quantile(0.9) == a.quantile(0.9)
+    with pytest.raises(ValueError):
+        a.merge(core.QuantileSketch(0.05))
+
+
+def test_collapsed_sketch_keeps_upper_quantiles(core):
+    sketch = core.QuantileSketch(0.01, max_bins=64)
+    sketch.add_many([1.5 ** i for i in range(200)])
+    assert len(sketch.positive) <= 64
+    assert sketch.quantile(0.99) == pytest.approx(1.5 ** 197, rel=0.01)
+    assert sketch.quantile(1) == sketch.max
+
+
+def test_rollups_bucket_by_second_minute_and_hour(core):
+    rollups = core.MetricRollups()
+    base = 7200.0
+    for second in range(125):
+        for k in range(4):
+            rollups.add(float(second * 4 + k), base + second + k / 4)
+    seconds = rollups.buckets("1s")
+    minutes = rollups.buckets("1m")
+    hours = rollups.buckets("1h")
+    assert len(seconds) == 125 and all(b["count"] == 4 for b in seconds)
+    assert [b["start"] for b in minutes] == [7200, 7260, 7320]
+    assert [b["count"] for b in minutes] == [240, 240, 20]
+    assert [(b["start"], b["count"], b["min"], b["max"]) for b in hours] == [(7200, 500, 0.0, 499.0)]
+    assert rollups.sketch().count == 500
+
+
+def test_rollups_merge_combines_buckets_by_start(core):
+    a, b = core.MetricRollups(), core.MetricRollups()
+    for i in range(10):
+        a.add(1.0, 100.0 + i)
+        b.add(2.0, 105.0 + i)
+    a.merge(b)
+    seconds = {bucket["start"]: bucket["count"] for bucket in a.buckets("1s")}
+    assert seconds == {s: (2 if 105 <= s < 110 else 1) for s in range(100, 115)}
+    assert a.sketch().count == 20
+
+
+def test_collector_quantiles_rollups_and_merge(core):
+    left, right = core.MetricsCollector(), core.MetricsCollector()
+    for i in range(1, 101):
+        left.record("latency", float(i))
+        right.record("latency", float(i + 100))
+    assert left.get_quantiles("latency")["p50"] == pytest.approx(50, rel=0.01)
+    rollup = left.get_rollup("latency", "1h")
+    assert sum(b["count"] for b in rollup) == 100
+    left.merge(right)
+    assert left.get_quantiles("latency")["p50"] == pytest.approx(100, rel=0.01)
+    assert left.get_sketch("latency").count == 200
+    assert left.get_quantiles("missing") == {}
@@ -0,0 +1,57 @@
+import sys
+
+
+def fill(core, log, count):
+    for i in range(count):
+        log.append("tick", f"event {i}", {"i": i})
+    return log
+
+
+def test_parallel_verify_matches_serial(core):
+    log = fill(core, core.EventLog("PAR"), 50)
+    report = log.verify_chain_parallel(workers=2, chunk_size=7)
+    assert report["valid"] and report["first_failure"] is None
+    assert report["events"] == 50
+    assert (log.verified_count, log.verified_hash) == (50, log.chain_hash)
+
+
+def test_parallel_verify_reports_the_first_bad_event(core):
+    log = fill(core, core.EventLog("PAR"), 40)
+    log.events[23]["message"] = "tampered"
+    log.events[31]["message"] = "tampered"
+    report = log.verify_chain_parallel(workers=2, chunk_size=5)
+    assert not report["valid"]
+    assert (report["first_failure"], report["reason"]) == (23, "event hash mismatch")
+    assert log.verified_count == 20
+
+
+def test_parallel_verify_catches_a_broken_link_at_a_range_boundary(core):
+    log = fill(core, core.EventLog("PAR"), 20)
+    event = log.events[10]
+    event["previous_hash"] = "0" * 64
+    event["hash"] = core.CryptoEngine.hash_object({k: v for k, v in event.items() if k != "hash"})
+    report = log.verify_chain_parallel(workers=2, chunk_size=5)
+    assert (report["first_failure"], report["reason"]) == (10, "previous_hash mismatch")
+
+
+def test_parallel_verify_reads_segments_in_workers(core, tmp_path):
+    store = core.SegmentedEventStore(str(tmp_path / "events"), segment_size=2048)
+    log = fill(core, core.EventLog("SEG", storage=store), 60)
+    assert len(store.segments) > 1
+    report = log.verify_chain_parallel(workers=2, chunk_size=16)
+    assert report["valid"] and report["events"] == 60
+    store.close()
+
+
+def test_parallel_verify_falls_back_in_process_when_workers_cannot_import(core, monkeypatch):
+    log = fill(core, core.EventLog("PAR"), 30)
+    log.events[17]["message"] = "tampered"
+    # As if the script was loaded under a name missing from sys.modules.
+    monkeypatch.delitem(sys.modules, core.__name__)
+    report = log.verify_chain_parallel(workers=2, chunk_size=8)
+    assert (report["first_failure"], report["reason"]) == (17, "event hash mismatch")
+    assert report["events"] == 17
+    assert log.verified_count == 16
+
+    log.events[17]["message"] = "event 17"
+    assert log.verify_chain_parallel(workers=2, chunk_size=8, full=False)["valid"]
@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+
+def manager(core, tmp_path, **kwargs):
+    kwargs.setdefault("fsync", "never")
+    kwargs.setdefault("background", False)
+    return core.PersistenceManager(str(tmp_path), **kwargs)
+
+
+def test_state_replays_journal_onto_snapshot(core, tmp_path):
+    pm = manager(core, tmp_path, snapshot_every=4)
+    state = pm.load_state("S")
+    for i in range(10):
+        state.update({"k%d" % (i % 3): i})
+        if i == 5:
+            state.phi_rotate(30)
+    expected = (state.hash, dict(state.data), state.cycle, state.phi_phase)
+    pm.close()
+
+    snapshot = json.loads((tmp_path / "state-S.snapshot.json").read_text())
+    assert 0 < snapshot["seq"] < 11
+    recovered = manager(core, tmp_path).load_state("S")
+    assert (recovered.hash, dict(recovered.data), recovered.cycle, recovered.phi_phase) == expected
+
+
+def test_log_recovers_and_ignores_a_torn_journal_tail(core, tmp_path):
+    pm = manager(core, tmp_path, snapshot_every=100)
+    log = pm.load_log("L")
+    for i in range(5):
+        log.append("tick", f"event {i}", {"i": i})
+    events = list(log.events)
+    pm.close()
+
+    journal = tmp_path / "log-L.journal.ndjson"
+    journal.write_bytes(journal.read_bytes()[:-10])
+    pm = manager(core, tmp_path)
+    log = pm.load_log("L")
+    assert log.events == events[:4]
+    # The torn record is cut off, so new deltas replay after a reopen.
+    log.append("tick", "event 4", {"i": 4})
+    pm.close()
+    log = manager(core, tmp_path).load_log("L", bind=False)
+    assert len(log.events) == 5 and log.verify_chain(full=True)
+
+
+def test_compaction_folds_the_journal_into_the_snapshot(core, tmp_path):
+    pm = manager(core, tmp_path, snapshot_every=3)
+    log = pm.load_log("L")
+    for i in range(7):
+        log.append("tick", f"event {i}", {"i": i})
+    pm.close()
+
+    snapshot = json.loads((tmp_path / "log-L.snapshot.json").read_text())
+    assert len(snapshot["events"]) == snapshot["seq"] == 6
+    assert not (tmp_path / "log-L.journal.compacting").exists()
+    assert len((tmp_path / "log-L.journal.ndjson").read_text().splitlines()) == 1
+    assert manager(core, tmp_path).load_log("L", bind=False).chain_hash == log.chain_hash
+
+
+def test_unfinished_compaction_is_completed_on_load(core, tmp_path):
+    pm = manager(core, tmp_path, snapshot_every=100)
+    state = pm.load_state("S")
+    for i in range(4):
+        state.update({"i": i})
+    pm.close()
+    # Crash after the journal was moved aside but before the snapshot landed.
+    (tmp_path / "state-S.journal.ndjson").rename(tmp_path / "state-S.journal.compacting")
+
+    pm = manager(core, tmp_path)
+    recovered = pm.load_state("S")
+    assert recovered.hash == state.hash
+    assert not (tmp_path / "state-S.journal.compacting").exists()
+    assert json.loads((tmp_path / "state-S.snapshot.json").read_text())["seq"] == 4
+    pm.close()
+
+
+def test_diverging_journal_is_rejected(core, tmp_path):
+    pm = manager(core, tmp_path)
+    state = pm.load_state("S")
+    state.update({"a": 1})
+    pm.close()
+    journal = tmp_path / "state-S.journal.ndjson"
+    delta = json.loads(journal.read_text())
+    journal.write_text(json.dumps(dict(delta, hash="0" * 64)) + "\n")
+    with pytest.raises(ValueError):
+        manager(core, tmp_path).load_state("S")
+
+
+def test_unknown_fsync_policy(core, tmp_path):
+    with pytest.raises(ValueError):
+        core.PersistenceManager(str(tmp_path), fsync="sometimes")
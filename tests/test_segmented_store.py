@@ -0,0 +1,82 @@
+def fill(core, store, count, start=0):
+    log = core.EventLog("SEG", storage=store)
+    for i in range(start, start + count):
+        log.append("tick", f"event {i}", {"i": i})
+    return log
+
+
+def test_events_roll_across_segments_and_reopen(core, tmp_path):
+    store = core.SegmentedEventStore(str(tmp_path), segment_size=1024)
+    log = fill(core, store, 40)
+    events = list(store)
+    assert len(store.segments) > 2
+    assert [e["data"]["i"] for e in events] == list(range(40))
+    # Random access bisects to the right segment, including negative indexes.
+    for i in (0, 7, 19, 33, 39, -1):
+        assert store[i] == events[i]
+    assert list(store.iter_from(25)) == events[25:]
+    store.close()
+
+    store = core.SegmentedEventStore(str(tmp_path), segment_size=1024)
+    reopened = core.EventLog("SEG", storage=store)
+    assert list(store) == events
+    assert reopened.chain_hash == log.chain_hash
+    assert reopened.verify_chain(full=True)
+    store.close()
+
+
+def last_segment(tmp_path):
+    return sorted(tmp_path.glob("segment-*.log"))[-1]
+
+
+def test_torn_tail_record_is_dropped_and_the_log_continues(core, tmp_path):
+    store = core.SegmentedEventStore(str(tmp_path), segment_size=1024)
+    fill(core, store, 10)
+    events = list(store)
+    store.close()
+    log_path = last_segment(tmp_path)
+    log_path.write_bytes(log_path.read_bytes()[:-15])
+
+    store = core.SegmentedEventStore(str(tmp_path), segment_size=1024)
+    assert list(store) == events[:9]
+    log = core.EventLog("SEG", storage=store)
+    log.append("tick", "event 9", {"i": 9})
+    assert len(store) == 10 and log.verify_chain(full=True)
+    store.close()
+
+
+def test_corrupt_tail_and_unindexed_records_are_recovered(core, tmp_path):
+    store = core.SegmentedEventStore(str(tmp_path), segment_size=1 << 20)
+    fill(core, store, 6)
+    events = list(store)
+    store.close()
+    idx_path = tmp_path / "segment-000000.idx"
+    # A crash after writing two records but before indexing them ...
+    idx_path.write_bytes(idx_path.read_bytes()[:-16])
+    store = core.SegmentedEventStore(str(tmp_path))
+    assert list(store) == events
+    store.close()
+
+    # ... and a tail record whose bytes were damaged in place.
+    log_path = last_segment(tmp_path)
+    data = log_path.read_bytes()
+    log_path.write_bytes(data[:-10] + b"#" * 9 + b"\n")
+    store = core.SegmentedEventStore(str(tmp_path))
+    assert list(store) == events[:5]
+    assert len(idx_path.read_bytes()) == 5 * store.OFFSET.size
+    store.close()
+
+
+def test_readonly_reader_refreshes(core, tmp_path):
+    store = core.SegmentedEventStore(str(tmp_path), segment_size=512)
+    log = fill(core, store, 3)
+    reader = core.SegmentedEventStore(str(tmp_path), readonly=True)
+    assert len(reader) == 3
+
+    for i in range(3, 20):
+        log.append("tick", f"event {i}", {"i": i})
+    assert len(reader) == 3
+    reader.refresh()
+    assert list(reader) == list(store)
+    reader.close()
+    store.close()
@@ -0,0 +1,104 @@
+import json
+import multiprocessing
+
+import pytest
+
+
+def mixed(attest, count, system=None):
+    gen = attest.AttestationGenerator(system) if system else attest.AttestationGenerator()
+    return [gen.seal_state({"i": i}) if i % 3 else gen.seal_execution(f"cmd {i}", {"code": i})
+            for i in range(count)]
+
+
+def test_round_trip_and_reopen(attest, tmp_path):
+    path = str(tmp_path / "v.db")
+    entries = mixed(attest, 7)
+    vault = attest.SQLiteAttestationVault(path)
+    assert vault.add_many(entries) == 7
+    vault.add_chain({"chain_hash": "abc", "attestations": entries[:2]})
+    vault.set_meta("owner", "tests")
+    vault.close()
+
+    vault = attest.SQLiteAttestationVault(path)
+    assert vault.get_attestations() == entries
+    assert vault.get_attestation(3) == entries[3]
+    assert vault.count() == {"attestations": 7, "chains": 1}
+    assert vault.meta == {"owner": "tests"}
+    with pytest.raises(IndexError):
+        vault.get_attestation(7)
+    vault.close()
+
+
+def test_batch_is_one_transaction(attest, tmp_path):
+    vault = attest.SQLiteAttestationVault(str(tmp_path / "v.db"))
+    entries = mixed(attest, 4)
+    with pytest.raises(RuntimeError):
+        with vault.batch():
+            vault.add_attestation(entries[0])
+            with vault.batch():
+                vault.add_many(entries[1:3])
+            raise RuntimeError("abort")
+    assert vault.count()["attestations"] == 0
+    with vault.batch():
+        vault.add_many(entries)
+    assert vault.get_attestations() == entries
+    vault.close()
+
+
+def test_queries_match_the_log_vault(attest, tmp_path):
+    entries = mixed(attest, 30)
+    sqlite = attest.SQLiteAttestationVault(str(tmp_path / "v.db"))
+    log = attest.LogAttestationVault(str(tmp_path / "v.vlog"))
+    sqlite.add_many(entries)
+    log.add_many(entries)
+    since = entries[10]["timestamp"]
+    for kwargs in ({}, {"seal_type": "execution_seal"}, {"seal": entries[4]["seal"]},
+                   {"since": since}, {"until": since, "seal_type": "state_seal"},
+                   {"system": "nope"}):
+        pages = []
+        for vault in (sqlite, log):
+            got, cursor = [], None
+            while True:
+                page = vault.query(limit=4, cursor=cursor, **kwargs)
+                got.extend(page["attestations"])
+                cursor = page["next_cursor"]
+                if cursor is None:
+                    break
+            pages.append(got)
+        assert pages[0] == pages[1], kwargs
+    sqlite.close()
+    log.close()
+
+
+def _writer(args):
+    path, worker = args
+    module = __import__("vua_attestation_gen")
+    vault = module.SQLiteAttestationVault(path)
+    gen = module.AttestationGenerator(f"W{worker}")
+    for i in range(20):
+        vault.add_many([gen.seal_state({"w": worker, "i": i, "j": j}) for j in range(5)])
+    vault.close()
+
+
+def test_concurrent_writer_processes(attest, tmp_path):
+    path = str(tmp_path / "v.db")
+    attest.SQLiteAttestationVault(path).close()
+    with multiprocessing.get_context("fork").Pool(3) as pool:
+        pool.map(_writer, [(path, w) for w in range(3)])
+    vault = attest.SQLiteAttestationVault(path)
+    assert vault.count()["attestations"] == 300
+    for w in range(3):
+        assert len(vault.query(system=f"W{w}", limit=1000)["attestations"]) == 100
+    vault.close()
+
+
+def test_import_json(attest, tmp_path):
+    entries = mixed(attest, 3)
+    legacy = {"attestations": entries, "chains": [{"chain_hash": "x", "attestations": []}],
+              "version": 2}
+    (tmp_path / "legacy.json").write_text(json.dumps(legacy))
+    vault = attest.SQLiteAttestationVault.import_json(str(tmp_path / "legacy.json"), str(tmp_path / "v.db"))
+    assert vault.get_attestations() == entries
+    assert vault.get_chains() == legacy["chains"]
+    assert vault.meta == {"version": 2}
+    vault.close()
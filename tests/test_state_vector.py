@@ -0,0 +1,100 @@
+import hashlib
+import random
+
+
+def reference_root(core, data):
+    """The documented data root, computed from scratch."""
+    def key_hash(key):
+        return int.from_bytes(hashlib.sha256(b"\x02" + core.CANONICAL.encode(key)).digest(), "big")
+
+    items = sorted((key_hash(k), hashlib.sha256(b"\x00" + core.CANONICAL.encode([k, v])).digest())
+                   for k, v in data.items())
+
+    def node(items, depth):
+        if len(items) <= core.StateVector.BUCKET:
+            return hashlib.sha256(b"\x03" + b"".join(leaf for _, leaf in items)).digest()
+        left = [i for i in items if not i[0] >> (255 - depth) & 1]
+        right = [i for i in items if i[0] >> (255 - depth) & 1]
+        return hashlib.sha256(b"\x01" + node(left, depth + 1) + node(right, depth + 1)).digest()
+
+    return node(items, 0).hex()
+
+
+def test_data_root_matches_the_documented_tree(core):
+    rng = random.Random(6)
+    state = core.StateVector("TEST")
+    assert state.data_root() == hashlib.sha256(b"\x03").hexdigest()
+
+    for step in range(1500):
+        key = f"k{rng.randrange(200)}"
+        if rng.random() < 0.25:
+            state.data.pop(key, None)
+        else:
+            state.update({key: rng.random(), "step": step})
+        if step % 50 == 0:
+            assert state.data_root() == reference_root(core, state.data)
+    assert state.data_root() == reference_root(core, state.data)
+
+
+def test_data_root_is_independent_of_history(core):
+    a = core.StateVector("A")
+    for i in range(50):
+        a.update({f"k{i}": i})
+    a.data.pop("k7")
+    a.update({"k3": "changed"})
+
+    b = core.StateVector("B")
+    b.data = {**{f"k{i}": i for i in range(50) if i != 7}, "k3": "changed"}
+    assert a.data_root() == b.data_root()
+
+
+def test_direct_edits_change_the_hash(core):
+    state = core.StateVector("TEST")
+    state.update({"a": 1, "b": 2})
+    before = state.data_root()
+
+    state.data["a"] = 3
+    assert state.data_root() != before
+    del state.data["a"]
+    state.data["a"] = 1
+    assert state.data_root() == before
+
+
+def test_rehash_data_after_nested_mutation(core):
+    state = core.StateVector("TEST")
+    state.update({"nested": {"x": 1}})
+    before = state.hash
+
+    state.data["nested"]["x"] = 2
+    state.rehash_data()
+    assert state.hash != before
+    assert state.data_root() == reference_root(core, state.data)
+
+
+def test_update_chains_the_previous_hash(core):
+    state = core.StateVector("TEST")
+    state.update({"a": 1}, timestamp="2026-01-01T00:00:00+00:00")
+    first = state.hash
+    state.update({"a": 1}, timestamp="2026-01-01T00:00:00+00:00")
+    assert state.hash != first
+    assert state.to_dict()["data_root"] == state.data_root()
+
+
+def test_state_hash_is_the_canonical_header_hash(core):
+    state = core.StateVector("Zustand é☃ \"quoted\"")
+    state.update({"a": 1}, timestamp="2026-01-01T00:00:00+00:00")
+    state.phi_rotate(123.456)
+    previous = state.hash
+    state.update({"b": [1, 2]})
+
+    header = {
+        "name": state.name,
+        "timestamp": state.timestamp,
+        "cycle": state.cycle,
+        "phi_phase": state.phi_phase,
+        "stability": state.stability,
+        "data_root": state.data_root(),
+        "hash": previous,
+        "credit": core.CREDIT,
+    }
+    assert state.hash == core.CryptoEngine.hash_object(header)
@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+
+def write_manifest(validator, path, modules, **extra):
+    manifest = validator.ManifestGenerator.create("pkg", "1.0.0", modules)
+    manifest.update(extra)
+    if extra:
+        manifest["sha256_manifest"] = validator.CANONICAL.hexdigest(
+            {k: v for k, v in manifest.items() if k != "sha256_manifest"})
+    validator.ManifestGenerator.save(manifest, str(path))
+    return manifest
+
+
+@pytest.fixture
+def small_windows(validator, monkeypatch):
+    """Force many window refills so values straddle chunk boundaries."""
+    monkeypatch.setattr(validator.JSONStream, "CHUNK", 512)
+    monkeypatch.setattr(validator.JSONStream, "LOOKAHEAD", 64)
+
+
+def both(validator, path):
+    eager, streamed = validator.ManifestValidator(), validator.ManifestValidator()
+    assert eager.load(str(path)) and streamed.load_stream(str(path))
+    return eager, streamed
+
+
+def test_streamed_validation_matches_eager(validator, tmp_path, small_windows):
+    modules = [f"module-{i}-" + "é" * (i % 7) for i in range(3000)]
+    path = tmp_path / "big.json"
+    write_manifest(validator, path, modules, extra=[{"n": i, "s": "x" * (i % 300)} for i in range(200)])
+    eager, streamed = both(validator, path)
+
+    assert streamed.digest == eager.digest
+    assert len(streamed.manifest["modules"]) == 3000
+    assert isinstance(streamed.manifest["modules"], validator.StreamedArray)
+    assert streamed.calculate_sha256_stream() == eager.calculate_sha256(eager.manifest)
+    assert streamed.full_validate()["valid"] and eager.full_validate()["valid"]
+
+
+def test_streamed_tamper_is_detected(validator, tmp_path, small_windows):
+    path = tmp_path / "m.json"
+    write_manifest(validator, path, [f"m{i}" for i in range(500)])
+    text = path.read_text().replace('"m250"', '"mXYZ"')
+    path.write_text(text)
+    streamed = validator.ManifestValidator()
+    assert streamed.load_stream(str(path))
+    result = streamed.full_validate()
+    assert result["checks"]["sha256"] == "FAIL"
+
+
+def test_array_batches_rebuild_the_array(validator, tmp_path, small_windows):
+    values = [1, -2.5, "a,b]", {"k": [1, {"x": ","}]}, None, True, "z" * 700, [], {}] * 40
+    path = tmp_path / "a.json"
+    path.write_text(json.dumps(values, indent=1))
+    with open(path, "rb") as f:
+        stream = validator.JSONStream(f)
+        batches = list(stream.array())
+    assert [v for batch in batches for v in batch] == values
+    assert len(batches) > 1
+
+
+def test_elements_longer_than_the_lookahead(validator, tmp_path):
+    # Default window sizes: each element outgrows LOOKAHEAD, and some straddle a chunk.
+    values = ["x" * (3 * validator.JSONStream.LOOKAHEAD)] * 300
+    path = tmp_path / "long.json"
+    path.write_text(json.dumps(values))
+    with open(path, "rb") as f:
+        assert [v for batch in validator.JSONStream(f).array() for v in batch] == values
+
+
+def test_bom_and_errors(validator, tmp_path):
+    path = tmp_path / "bom.json"
+    path.write_bytes(b"\xef\xbb\xbf" + json.dumps({"modules": [1, 2]}).encode())
+    loaded = validator.ManifestValidator()
+    assert loaded.load_stream(str(path)) and len(loaded.manifest["modules"]) == 2
+
+    for bad in ('{"a": 1,}', '{"a": [1, 2', '{"a": [1, @, 2]}', '{"a": 1} trailing', '[1]'):
+        path.write_text(bad)
+        broken = validator.ManifestValidator()
+        assert not broken.load_stream(str(path))
+        assert broken.errors[0].startswith("Invalid JSON")
@@ -0,0 +1,44 @@
+import json
+
+
+def make(validator, path, package="pkg", modules=("a", "b", "c")):
+    manifest = validator.ManifestGenerator.create(package, "1.0.0", list(modules))
+    validator.ManifestGenerator.save(manifest, str(path))
+    return manifest
+
+
+def test_discovery_skips_hidden_directories(validator, tmp_path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / ".git").mkdir()
+    for path in ("one.json", "a/two.json", "a/b/three.json", ".git/hidden.json", "a/skip.txt"):
+        (tmp_path / path).write_text("{}")
+    found = list(validator.discover_manifests([str(tmp_path)]))
+    assert [p[len(str(tmp_path)) + 1:] for p in found] == ["one.json", "a/two.json", "a/b/three.json"]
+    assert list(validator.discover_manifests([str(tmp_path / "a" / "skip.txt")])) == \
+        [str(tmp_path / "a" / "skip.txt")]
+
+
+def test_validate_tree_serial_and_parallel_agree(validator, tmp_path):
+    for i in range(6):
+        make(validator, tmp_path / f"m{i}.json", package=f"pkg{i}")
+    (tmp_path / "broken.json").write_text("{not json")
+    tampered = make(validator, tmp_path / "tampered.json")
+    (tmp_path / "tampered.json").write_text(json.dumps(dict(tampered, version="9.9.9")))
+
+    def run(workers):
+        results = validator.validate_tree([str(tmp_path)], workers=workers, chunksize=2)
+        return {r["path"]: (r["valid"], r["checks"]) for r in results}
+
+    serial, parallel = run(1), run(3)
+    assert serial == parallel
+    assert sum(valid for valid, _ in serial.values()) == 6
+    assert serial[str(tmp_path / "broken.json")] == (False, {"load": "FAIL"})
+    assert serial[str(tmp_path / "tampered.json")][1]["sha256"] == "FAIL"
+
+
+def test_validate_file_never_raises(validator, tmp_path):
+    (tmp_path / "bad.json").write_bytes(b"\xff\xfe not utf-8")
+    result = validator.validate_file(str(tmp_path / "bad.json"))
+    assert result["valid"] is False and result["checks"]["load"] in ("FAIL", "ERROR")
+    missing = validator.validate_file(str(tmp_path / "missing.json"))
+    assert missing["valid"] is False
@@ -0,0 +1,83 @@
+import json
+import os
+
+
+MANIFEST = {"package": "demo", "credit": "tests", "version": "1.0.0",
+            "modules": ["core"], "sha256_manifest": "0" * 64}
+
+
+def write(path, manifest=MANIFEST):
+    path.write_text(json.dumps(manifest))
+    return str(path)
+
+
+def test_unchanged_manifest_is_served_from_cache(validator, tmp_path):
+    path = write(tmp_path / "m.json")
+    cache = validator.ValidationCache(str(tmp_path / "cache.db"))
+    first = validator.validate_cached(path, cache)
+    assert first["cached"] is False and cache.misses == 1
+
+    second = validator.validate_cached(path, cache)
+    assert second["cached"] is True and cache.hits == 1
+    assert {k: v for k, v in second.items() if k != "cached"} == \
+        {k: v for k, v in first.items() if k != "cached"}
+    cache.close()
+
+
+def test_touched_manifest_is_rehashed_in_chunks(validator, tmp_path, monkeypatch):
+    path = write(tmp_path / "m.json")
+    cache = validator.ValidationCache(str(tmp_path / "cache.db"))
+    validator.validate_cached(path, cache)
+
+    hashed = []
+    real = validator.hash_file
+    monkeypatch.setattr(validator, "hash_file", lambda p, *a: hashed.append(p) or real(p, *a))
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    assert cache.lookup(path)["cached"] is True
+    assert hashed == [path]
+    # The new mtime was recorded, so the next lookup needs no digest.
+    assert cache.lookup(path)["cached"] is True
+    assert hashed == [path]
+    cache.close()
+
+
+def test_same_size_edit_is_a_miss(validator, tmp_path):
+    path = write(tmp_path / "m.json")
+    cache = validator.ValidationCache(str(tmp_path / "cache.db"))
+    validator.validate_cached(path, cache)
+
+    st = os.stat(path)
+    write(tmp_path / "m.json", dict(MANIFEST, version="1.0.1"))
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert os.stat(path).st_size == st.st_size
+    assert cache.lookup(path) is None
+    cache.close()
+
+
+def test_validator_version_change_clears_the_cache(validator, tmp_path):
+    path = write(tmp_path / "m.json")
+    db = str(tmp_path / "cache.db")
+    cache = validator.ValidationCache(db)
+    validator.validate_cached(path, cache)
+    cache.close()
+
+    cache = validator.ValidationCache(db, version="other")
+    assert cache.lookup(path) is None
+    cache.close()
+
+
+def test_validate_tree_only_sends_misses_to_workers(validator, tmp_path):
+    for i in range(4):
+        write(tmp_path / f"m{i}.json", dict(MANIFEST, package=f"pkg{i}"))
+    cache = validator.ValidationCache(str(tmp_path / "cache.db"))
+    first = list(validator.validate_tree([str(tmp_path)], workers=2, cache=cache))
+    assert sorted(r["cached"] for r in first) == [False] * 4
+    cache.flush()
+
+    write(tmp_path / "m2.json", dict(MANIFEST, package="changed"))
+    second = {os.path.basename(r["path"]): r["cached"]
+              for r in validator.validate_tree([str(tmp_path)], workers=2, cache=cache)}
+    assert second == {"m0.json": True, "m1.json": True, "m2.json": False, "m3.json": True}
+    cache.close()
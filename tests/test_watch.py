@@ -0,0 +1,68 @@
+import json
+import os
+import sys
+import time
+
+import pytest
+
+
+def changes_until(backend, expected, limit=5.0):
+    """Collect reported paths until ``expected`` is covered or time runs out."""
+    seen = set()
+    deadline = time.monotonic() + limit
+    while not expected <= seen and time.monotonic() < deadline:
+        seen |= backend.changes(0.05) or set()
+    return seen
+
+
+@pytest.mark.parametrize("kind", ["PollingBackend", "InotifyBackend"])
+def test_backends_report_created_modified_and_removed_files(validator, tmp_path, kind):
+    if kind == "InotifyBackend" and not sys.platform.startswith("linux"):
+        pytest.skip("inotify is Linux-only")
+    existing = tmp_path / "old.json"
+    existing.write_text("{}")
+    backend = getattr(validator, kind)([str(tmp_path)], "*.json")
+    try:
+        (tmp_path / "sub").mkdir()
+        created = tmp_path / "sub" / "new.json"
+        created.write_text("{}")
+        assert str(created) in changes_until(backend, {str(created)})
+
+        existing.write_text('{"changed": 1}')
+        st = os.stat(existing)
+        os.utime(existing, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert str(existing) in changes_until(backend, {str(existing)})
+
+        created.unlink()
+        assert str(created) in changes_until(backend, {str(created)})
+    finally:
+        backend.close()
+
+
+def test_revalidate_emits_results_removals_and_log_events(validator, core, tmp_path, capsys):
+    manifest = validator.ManifestGenerator.create("pkg", "1.0.0", ["a", "b", "c"])
+    path = tmp_path / "m.json"
+    validator.ManifestGenerator.save(manifest, str(path))
+    log = core.EventLog("WATCH")
+    watcher = validator.ManifestWatcher([str(tmp_path)], log=log, polling=True)
+    try:
+        watcher.revalidate({str(path)})
+        path.unlink()
+        watcher.revalidate({str(path), str(tmp_path / "never.json")})
+    finally:
+        watcher.close()
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(r["type"], r["path"]) for r in records] == [("result", str(path)), ("removed", str(path))]
+    assert records[0]["valid"]
+    assert [e["type"] for e in log.events] == ["MANIFEST_VALID", "MANIFEST_REMOVED"]
+
+
+def test_watcher_ignores_hidden_directories_and_other_patterns(validator, tmp_path):
+    watcher = validator.ManifestWatcher([str(tmp_path)], polling=True)
+    try:
+        assert watcher._matches(str(tmp_path / "a" / "m.json"))
+        assert not watcher._matches(str(tmp_path / ".git" / "m.json"))
+        assert not watcher._matches(str(tmp_path / "notes.txt"))
+    finally:
+        watcher.close()
@@ -37,6 +37,30 @@ def hash_block(block: Dict[str, Any]) -> str:
     encoded = json.dumps(block_copy, sort_keys=True).encode()
     return hashlib.sha256(encoded).hexdigest()
 
+def nonce_hasher(block: Dict[str, Any]):
+    """Return nonce -> hash_block(block with that nonce).
+
+    Everything except the nonce is serialised once; the bytes before it are
+    absorbed into a SHA-256 midstate that each attempt copies. The split is
+    made between the top-level keys sorting before and after "nonce", so a
+    nested "nonce" key cannot be mistaken for it.
+    """
+    block_copy = block.copy()
+    block_copy.pop("hash", None)
+    block_copy.pop("nonce", None)
+    before = {k: v for k, v in block_copy.items() if k < "nonce"}
+    after = {k: v for k, v in block_copy.items() if k > "nonce"}
+    prefix = json.dumps(before, sort_keys=True)[:-1] + (", " if before else "") + '"nonce": '
+    suffix = (", " if after else "") + json.dumps(after, sort_keys=True)[1:]
+    midstate = hashlib.sha256(prefix.encode())
+    suffix = suffix.encode()
+
+    def digest(nonce: int) -> str:
+        h = midstate.copy()
+        h.update(str(nonce).encode() + suffix)
+        return h.hexdigest()
+    return digest
+
 def create_genesis_block() -> Dict[str, Any]:
     genesis_block = {
         "index": 0,
@@ -94,9 +118,10 @@ async def miner_loop():
             "nonce": 0,
             "timestamp": time.time()
         }
+        attempt = nonce_hasher(block)
         while True:
             block["nonce"] += 1
-            block["hash"] = hash_block(block)
+            block["hash"] = attempt(block["nonce"])
             if block["hash"].startswith("0" * DIFFICULTY_TARGET):
                 break
         block["glyph_signature"] = f"a_fortiori::moongirl::{datetime.utcnow().isoformat()}"
@@ -9,13 +9,27 @@ The Architect - Axis Prime - Veroti - Dustin Sean Coffey - Evomorphic
 𓁚 A FORTIORI • SUI GENERIS
 """
 
+import abc
 import json
 import hashlib
+import importlib.util
+import math
+import mmap
+import multiprocessing
+import os
+import sqlite3
+import struct
+import threading
 import time
 import sys
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from itertools import islice
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 
 CREDIT = "The Architect - Axis Prime - Veroti - Dustin Sean Coffey - Evomorphic"
@@ -23,12 +37,30 @@ EMAIL = "axismuse@gmail.com"
 GLYPH = "𓁚🜇∞Ϟ"
 
 
+
+def _load_core():
+    """Import vua-core.py from this directory."""
+    if 'vua_core' in sys.modules:
+        return sys.modules['vua_core']
+    spec = importlib.util.spec_from_file_location('vua_core', Path(__file__).resolve().parent / 'vua-core.py')
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['vua_core'] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# Canonical JSON (sorted keys, compact separators) for every hash and seal.
+CANONICAL = _load_core().CANONICAL
+
+
 class AttestationGenerator:
     """Generates cryptographic attestations for VUA systems with eternal binding."""
 
     def __init__(self, name: str = "TOTALITY"):
         self.name = name
         self.attestations = []
+        self._chain = ChainHasher()
+        self._chained = self.attestations
 
     def seal_state(self, state_data: Dict) -> Dict:
         """Create an attestation seal for a state object."""
@@ -45,8 +77,7 @@ class AttestationGenerator:
         entry['seal'] = self._generate_seal(entry)
         entry['checksum'] = self._checksum(entry['seal'])
 
-        self.attestations.append(entry)
-        return entry
+        return self.keep(entry)
 
     def seal_manifest(self, manifest_path: str) -> Dict:
         """Seal a manifest file with cryptographic binding."""
@@ -71,8 +102,7 @@ class AttestationGenerator:
         entry['seal'] = self._generate_seal(entry)
         entry['checksum'] = self._checksum(entry['seal'])
 
-        self.attestations.append(entry)
-        return entry
+        return self.keep(entry)
 
     def seal_execution(self, command: str, result: Dict) -> Dict:
         """Seal an execution result with eternal binding."""
@@ -90,8 +120,7 @@ class AttestationGenerator:
         entry['seal'] = self._generate_seal(entry)
         entry['checksum'] = self._checksum(entry['seal'])
 
-        self.attestations.append(entry)
-        return entry
+        return self.keep(entry)
 
     def seal_build(self, build_info: Dict) -> Dict:
         """Seal a build manifest with eternal binding."""
@@ -109,11 +138,15 @@ class AttestationGenerator:
         entry['seal'] = self._generate_seal(entry)
         entry['checksum'] = self._checksum(entry['seal'])
 
-        self.attestations.append(entry)
-        return entry
+        return self.keep(entry)
 
-    def create_chain(self) -> Dict:
-        """Create a chain of attestations (like a blockchain)."""
+    def create_chain(self, include_attestations: bool = True) -> Dict:
+        """Create a chain of attestations (like a blockchain).
+
+        The chain hash comes from the rolling ``chain_hash()``, so repeated
+        calls cost only the seals added since the last one. Without
+        ``include_attestations`` the members are left out of the result.
+        """
         if not self.attestations:
             return {'error': 'No attestations to chain'}
 
@@ -125,41 +158,108 @@ class AttestationGenerator:
             'glyph': GLYPH,
             'system': self.name,
             'count': len(self.attestations),
-            'attestations': self.attestations,
         }
+        if include_attestations:
+            chain['attestations'] = self.attestations
 
-        chain['chain_hash'] = self._create_chain_hash(self.attestations)
+        chain['chain_hash'] = self.chain_hash()
 
         return chain
 
+    def chain_hash(self) -> str:
+        """Chain hash of ``self.attestations``; equal to ``_create_chain_hash(self.attestations)``.
+
+        Seals are hashed as ``keep()`` stores them, so this only catches up on
+        entries appended to the list directly. A replaced or shortened list
+        restarts the rolling state; after editing stored entries in place,
+        call ``reset_chain()``.
+        """
+        if self._chained is not self.attestations or self._chain.count > len(self.attestations):
+            self.reset_chain()
+        for entry in self.attestations[self._chain.count:]:
+            self._chain.update(entry['seal'])
+        return self._chain.hexdigest()
+
+    def keep(self, entry: Dict) -> Dict:
+        """Store a sealed entry for ``create_chain()`` and extend the rolling chain hash."""
+        self.attestations.append(entry)
+        if self._chained is self.attestations and self._chain.count == len(self.attestations) - 1:
+            self._chain.update(entry['seal'])
+        return entry
+
+    def reset_chain(self) -> None:
+        """Forget the rolling chain hash; the next ``chain_hash()`` rehashes every seal."""
+        self._chain = ChainHasher()
+        self._chained = self.attestations
+
     def verify_seal(self, sealed_object: Dict) -> bool:
         """Verify a seal's integrity."""
+        return self.check_seal(sealed_object) is None
+
+    def check_seal(self, sealed_object: Dict) -> Optional[str]:
+        """Why a seal fails verification, or None if it holds.
+
+        The seal binds the second it was made. That is taken from the
+        object's own timestamp (or the following second, which the seal
+        methods can cross between the two clock reads), so the result does
+        not depend on when the check runs. Objects without a readable
+        timestamp fail.
+        """
         if 'seal' not in sealed_object or 'checksum' not in sealed_object:
-            return False
+            return 'missing seal or checksum'
 
         stored_seal = sealed_object['seal']
         stored_checksum = sealed_object['checksum']
+        if self._checksum(stored_seal) != stored_checksum:
+            return 'checksum mismatch'
 
-        verify_data = {k: v for k, v in sealed_object.items() 
+        verify_data = {k: v for k, v in sealed_object.items()
                       if k not in ['seal', 'checksum']}
-        
-        recalc_seal = self._generate_seal(verify_data)
-        recalc_checksum = self._checksum(recalc_seal)
 
-        return recalc_seal == stored_seal and recalc_checksum == stored_checksum
+        epoch = _to_epoch(verify_data.get('timestamp'))
+        if math.isnan(epoch):
+            return 'missing or unreadable timestamp'
+        candidates = [int(epoch), int(epoch) + 1]
+        hasher = hashlib.sha256()
+        CANONICAL.update(hasher, verify_data)
+        for second in candidates:
+            recalc = hasher.copy()
+            recalc.update((CREDIT + str(second)).encode())
+            if recalc.hexdigest() == stored_seal:
+                return None
+        return 'seal mismatch'
+
+    def check_chain(self, chain: Dict) -> Optional[str]:
+        """Why a chain fails verification, or None if its hash and member seals hold.
+
+        A chain stored without its members (``include_attestations=False``)
+        cannot be checked, so it fails too.
+        """
+        members = chain.get('attestations')
+        if 'chain_hash' not in chain:
+            return 'missing chain_hash'
+        if not isinstance(members, list):
+            return 'no members to check chain_hash against'
+        for i, member in enumerate(members):
+            reason = self.check_seal(member) if isinstance(member, dict) else 'malformed member'
+            if reason:
+                return f'member {i}: {reason}'
+        if chain.get('chain_hash') != self._create_chain_hash(members):
+            return 'chain_hash mismatch'
+        return None
 
     # Internal helpers
 
     def _hash_object(self, obj: Dict) -> str:
         """Hash an object with SHA-256."""
-        canonical = json.dumps(obj, sort_keys=True, separators=(',', ':'))
-        return hashlib.sha256(canonical.encode()).hexdigest()
+        return CANONICAL.hexdigest(obj)
 
     def _generate_seal(self, data: Dict) -> str:
         """Generate a cryptographic seal."""
-        canonical = json.dumps(data, sort_keys=True, separators=(',', ':'))
-        seal_input = canonical + CREDIT + str(int(time.time()))
-        return hashlib.sha256(seal_input.encode()).hexdigest()
+        hasher = hashlib.sha256()
+        CANONICAL.update(hasher, data)
+        hasher.update((CREDIT + str(int(time.time()))).encode())
+        return hasher.hexdigest()
 
     def _checksum(self, seal: str) -> str:
         """Generate a checksum of a seal."""
@@ -170,13 +270,575 @@ class AttestationGenerator:
         chain_str = ''.join([a['seal'] for a in attestations])
         return hashlib.sha256(chain_str.encode()).hexdigest()
 
+    # Batch sealing
+
+    def iter_seal_many(self, seal_type: str, payloads: Iterable, workers: int = 1,
+                       batch_size: int = 1000) -> Iterator[Dict]:
+        """Seal payloads of one type lazily, in input order.
+
+        ``seal_type`` is state, manifest, execution or build; payloads are
+        what the matching ``seal_*`` method takes, with ``(command, result)``
+        pairs for execution. Each batch of ``batch_size`` shares one
+        timestamp. With ``workers > 1`` batches are sealed on a process pool.
+        A manifest that cannot be read yields an ``{'error': ...}`` entry.
+        An unknown ``seal_type`` raises ValueError here, not on first ``next()``.
+        """
+        BatchSealer(seal_type, self.name)  # reject unknown types before any work
+        return self._iter_seal_many(seal_type, payloads, workers, batch_size)
+
+    def _iter_seal_many(self, seal_type: str, payloads: Iterable, workers: int,
+                        batch_size: int) -> Iterator[Dict]:
+        payloads = iter(payloads)
+        batches = iter(lambda: list(islice(payloads, batch_size)), [])
+        jobs = ((seal_type, self.name, time.time(), batch) for batch in batches)
+        if workers <= 1:
+            results = map(_seal_batch, jobs)
+        else:
+            pool = multiprocessing.Pool(workers)
+            results = pool.imap(_seal_batch, jobs)
+        try:
+            for batch in results:
+                yield from batch
+        finally:
+            if workers > 1:
+                pool.terminate()
+
+    def seal_many(self, seal_type: str, payloads: Iterable, workers: int = 1,
+                  batch_size: int = 1000) -> List[Dict]:
+        """Seal payloads of one type; sealed entries are kept for ``create_chain()``."""
+        entries = list(self.iter_seal_many(seal_type, payloads, workers, batch_size))
+        for entry in entries:
+            if 'seal' in entry:
+                self.keep(entry)
+        return entries
+
+    def seal_to_vault(self, seal_type: str, payloads: Iterable, vault, workers: int = 1,
+                      batch_size: int = 1000) -> int:
+        """Seal payloads straight into ``vault`` one batch at a time; returns the number stored.
+
+        Entries are not kept in memory, so this suits runs of any size.
+        """
+        stored = 0
+        entries = self.iter_seal_many(seal_type, payloads, workers, batch_size)
+        while True:
+            batch = [e for e in islice(entries, batch_size) if 'seal' in e]
+            if not batch:
+                return stored
+            vault.add_many(batch)
+            stored += len(batch)
+
+
+class BatchSealer:
+    """Seals many payloads of one type under a shared timestamp.
+
+    Entries match those of ``AttestationGenerator.seal_*``. The canonical
+    text of an entry is assembled from a template encoded once per batch,
+    and each payload is canonicalised once, for both its hash and, for build
+    seals, its embedded copy.
+    """
+
+    # Entry keys after the common header, per seal type; all but 'system' vary.
+    LAYOUT = {
+        'state_seal': ('data_hash', 'system'),
+        'manifest_seal': ('manifest_file', 'manifest_sha256', 'manifest_version', 'modules_count'),
+        'execution_seal': ('command', 'result_hash', 'system'),
+        'build_seal': ('build_hash', 'system', 'build_info'),
+    }
+
+    def __init__(self, seal_type: str, system: str = "TOTALITY", now: Optional[float] = None):
+        self.seal_type = seal_type if seal_type.endswith('_seal') else seal_type + '_seal'
+        if self.seal_type not in self.LAYOUT:
+            raise ValueError(f"unknown seal type: {seal_type}")
+        now = time.time() if now is None else now
+        self.system = system
+        self.head = {
+            'type': self.seal_type,
+            'timestamp': datetime.fromtimestamp(now, timezone.utc).isoformat(),
+            'credit': CREDIT,
+            'email': EMAIL,
+            'glyph': GLYPH,
+        }
+        self.suffix = (CREDIT + str(int(now))).encode()
+        self.fields = getattr(self, '_' + self.seal_type)
+
+        # Encode the entry once with a marker per varying key, then split the
+        # text at the markers; sealing joins the parts with per-payload values.
+        layout = self.LAYOUT[self.seal_type]
+        template = dict(self.head)
+        for key in layout:
+            template[key] = system if key == 'system' else '\0' + key
+        text = CANONICAL.encode(template)
+        markers = sorted((text.index(CANONICAL.encode('\0' + key)), key)
+                         for key in layout if key != 'system')
+        self.parts, self.slots = [], []
+        for _, key in markers:
+            head, text = text.split(CANONICAL.encode('\0' + key), 1)
+            self.parts.append(head)
+            self.slots.append(key)
+        self.parts.append(text)
+
+    def seal(self, payload: Any) -> Dict:
+        """Sealed entry for one payload."""
+        values = self.fields(payload)
+        if 'error' in values:
+            return {'error': values['error']}
+        entry = dict(self.head)
+        for key in self.LAYOUT[self.seal_type]:
+            entry[key] = self.system if key == 'system' else values[key][0]
+        pieces = [self.parts[0]]
+        for key, part in zip(self.slots, self.parts[1:]):
+            pieces.append(values[key][1])
+            pieces.append(part)
+        hasher = hashlib.sha256(b''.join(pieces))
+        hasher.update(self.suffix)
+        entry['seal'] = hasher.hexdigest()
+        entry['checksum'] = hashlib.sha256(entry['seal'].encode()).hexdigest()[:16]
+        return entry
+
+    # Per-type fields: key -> (value, canonical JSON bytes of value)
+
+    @staticmethod
+    def _digest(obj: Any) -> Tuple[str, bytes]:
+        digest = CANONICAL.hexdigest(obj)
+        return digest, b'"' + digest.encode() + b'"'
 
-class AttestationVault:
+    def _state_seal(self, state_data: Dict) -> Dict:
+        return {'data_hash': self._digest(state_data)}
+
+    def _execution_seal(self, payload: Tuple[str, Dict]) -> Dict:
+        command, result = payload
+        return {'command': (command, CANONICAL.encode(command)),
+                'result_hash': self._digest(result)}
+
+    def _build_seal(self, build_info: Dict) -> Dict:
+        # Frozen: the canonical bytes serve both the hash and the embedded copy.
+        frozen = CANONICAL.freeze(build_info)
+        return {'build_hash': (frozen.digest, b'"' + frozen.digest.encode() + b'"'),
+                'build_info': (build_info, frozen.canonical)}
+
+    def _manifest_seal(self, manifest_path: str) -> Dict:
+        try:
+            with open(manifest_path, 'r') as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return {'error': f'Manifest not found: {manifest_path}'}
+        values = {
+            'manifest_file': manifest_path,
+            'manifest_sha256': manifest.get('sha256_manifest', 'N/A'),
+            'manifest_version': manifest.get('version', 'N/A'),
+            'modules_count': len(manifest.get('modules', [])),
+        }
+        return {k: (v, CANONICAL.encode(v)) for k, v in values.items()}
+
+
+def _seal_batch(job: Tuple[str, str, float, list]) -> List[Dict]:
+    """Pool worker: seal one batch of payloads under the batch's timestamp."""
+    seal_type, system, now, payloads = job
+    sealer = BatchSealer(seal_type, system, now)
+    return [sealer.seal(payload) for payload in payloads]
+
+
+class ChainHasher:
+    """Rolling chain hash: SHA-256 over the concatenated seals, one update per seal.
+
+    ``hexdigest()`` equals ``AttestationGenerator._create_chain_hash()`` over
+    the same attestations, at constant cost per appended seal.
+    """
+
+    def __init__(self, seals: Iterable[str] = ()):
+        self._hasher = hashlib.sha256()
+        self.count = 0
+        for seal in seals:
+            self.update(seal)
+
+    def update(self, seal: str) -> None:
+        self._hasher.update(seal.encode())
+        self.count += 1
+
+    def hexdigest(self) -> str:
+        return self._hasher.copy().hexdigest()
+
+
+class ChainWriter:
+    """Streams an attestation chain document to a file, one member at a time.
+
+    The output has the same fields as ``create_chain()``; members are written
+    as they are appended and only the rolling hash is kept in memory, with
+    ``count`` and ``chain_hash`` following the members. The document is built
+    in ``<path>.tmp`` and renamed into place by ``close()``, so readers never
+    see a partial chain.
+
+        with ChainWriter('chain.json') as chain:
+            for attestation in vault.iter_attestations():
+                chain.append(attestation)
+    """
+
+    def __init__(self, path: str, system: str = "TOTALITY"):
+        self.path = Path(path)
+        self.tmp_path = self.path.with_name(self.path.name + '.tmp')
+        self.hasher = ChainHasher()
+        self.header = {
+            'type': 'attestation_chain',
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'credit': CREDIT,
+            'email': EMAIL,
+            'glyph': GLYPH,
+            'system': system,
+        }
+        self._summary = None
+        self._file = open(self.tmp_path, 'w')
+        self._file.write(json.dumps(self.header)[:-1] + ', "attestations": [')
+
+    def append(self, attestation: Dict) -> str:
+        """Write one member; returns the chain hash so far."""
+        if self.hasher.count:
+            self._file.write(', ')
+        self._file.write(json.dumps(attestation))
+        self.hasher.update(attestation['seal'])
+        return self.hasher.hexdigest()
+
+    def extend(self, attestations: Iterable[Dict]) -> None:
+        for attestation in attestations:
+            self.append(attestation)
+
+    def close(self) -> Dict:
+        """Finish the document and return the chain without its members.
+
+        As with ``create_chain()``, an empty chain is refused: nothing is
+        written and ``{'error': ...}`` is returned.
+        """
+        if self._summary is not None:
+            return self._summary
+        if not self.hasher.count:
+            self.abort()
+            self._summary = {'error': 'No attestations to chain'}
+            return self._summary
+        summary = dict(self.header, count=self.hasher.count, chain_hash=self.hasher.hexdigest())
+        self._file.write(f'], "count": {summary["count"]}, "chain_hash": "{summary["chain_hash"]}"}}\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        os.replace(self.tmp_path, self.path)
+        self._summary = summary
+        return summary
+
+    def abort(self) -> None:
+        """Discard the partial document."""
+        if not self._file.closed:
+            self._file.close()
+            self.tmp_path.unlink()
+        if self._summary is None:
+            self._summary = {'error': 'Chain aborted'}
+
+    def __enter__(self) -> 'ChainWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def _hex_key(value) -> Optional[int]:
+    """64-bit prefix of a hex digest, used as a hash-map key."""
+    if isinstance(value, str) and len(value) >= 16:
+        try:
+            return int(value[:16], 16)
+        except ValueError:
+            return None
+    return None
+
+
+def _to_epoch(value: Union[str, float, int, None]) -> float:
+    """Epoch seconds from an ISO timestamp (naive means UTC) or number; NaN if unparseable."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        moment = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return math.nan
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+class AttestationIndex:
+    """Columnar query index over attestations, addressed by ordinal.
+
+    Each attestation contributes one fixed 40-byte record: type code, system
+    code, timestamp as epoch seconds, and 64-bit prefixes of seal and
+    checksum. Codes refer to a names table. Posting lists per code and hash
+    maps from seal/checksum prefix to ordinals are built on first use and then
+    maintained on ``add()``. With ``path`` the records are persisted
+    (``<path>`` plus ``<path>.names``) and load with a single ``frombytes``.
+    The file starts with a header carrying a digest of ``stamp``, which
+    identifies the data indexed; a persisted index with another stamp is
+    discarded on load.
+    """
+
+    FIELDS = 5
+    RECORD = struct.Struct('=QQdQQ')
+    HEADER = struct.Struct('=8s32s')
+    MAGIC = b'VUAKEYS1'
+
+    def __init__(self, path: Optional[str] = None, stamp: str = ''):
+        self.path = Path(path) if path else None
+        self.stamp = stamp
+        self.names: List[Optional[str]] = [None]
+        self.codes: Dict[Optional[str], int] = {None: 0}
+        self.types = array('Q')
+        self.systems = array('Q')
+        self.epochs = array('d')
+        self.seals = array('Q')
+        self.checksums = array('Q')
+        self.time_sorted = True
+        self._postings = None
+        self._seal_map = None
+        self._checksum_map = None
+        self._file = None
+        self._names_file = None
+        if self.path:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def add(self, attestation: Dict) -> int:
+        """Index the next attestation; returns its ordinal."""
+        ordinal = len(self.types)
+        type_code = self._code(attestation.get('type'))
+        system_code = self._code(attestation.get('system'))
+        epoch = _to_epoch(attestation.get('timestamp'))
+        seal = _hex_key(attestation.get('seal')) or 0
+        checksum = _hex_key(attestation.get('checksum')) or 0
+
+        if self.epochs and not epoch >= self.epochs[-1]:
+            self.time_sorted = False
+        self.types.append(type_code)
+        self.systems.append(system_code)
+        self.epochs.append(epoch)
+        self.seals.append(seal)
+        self.checksums.append(checksum)
+        if self._postings is not None:
+            self._postings[type_code].append(ordinal)
+            if system_code != type_code:
+                self._postings[system_code].append(ordinal)
+        if self._seal_map is not None:
+            self._seal_map[seal].append(ordinal)
+        if self._checksum_map is not None:
+            self._checksum_map[checksum].append(ordinal)
+        if self._file:
+            self._file.write(self.RECORD.pack(type_code, system_code, epoch, seal, checksum))
+        return ordinal
+
+    def candidates(self, seal_type: Optional[str] = None, system: Optional[str] = None,
+                   since: float = -math.inf, until: float = math.inf,
+                   seal: Optional[str] = None, checksum: Optional[str] = None,
+                   start: int = 0) -> Iterator[int]:
+        """Ordinals >= ``start`` matching the filters, in order.
+
+        Seal and checksum matches are by 64-bit prefix; callers confirm them
+        against the record.
+        """
+        type_code = system_code = None
+        if seal_type is not None:
+            type_code = self.codes.get(seal_type)
+            if type_code is None:
+                return
+        if system is not None:
+            system_code = self.codes.get(system)
+            if system_code is None:
+                return
+
+        # Drive from the most selective structure available.
+        if seal is not None:
+            base = self._lookup('seal', _hex_key(seal))
+        elif checksum is not None:
+            base = self._lookup('checksum', _hex_key(checksum))
+        elif type_code is not None or system_code is not None:
+            postings = self._get_postings()
+            base = min((postings.get(c, ()) for c in (type_code, system_code) if c is not None),
+                       key=len)
+        else:
+            lo, hi = 0, len(self.types)
+            if self.time_sorted:
+                if since > -math.inf:
+                    lo = bisect_left(self.epochs, since)
+                if until < math.inf:
+                    hi = bisect_left(self.epochs, until)
+            base = range(lo, hi)
+
+        timed = since > -math.inf or until < math.inf
+        for i in range(bisect_left(base, start), len(base)):
+            ordinal = base[i]
+            if type_code is not None and self.types[ordinal] != type_code:
+                continue
+            if system_code is not None and self.systems[ordinal] != system_code:
+                continue
+            if timed and not since <= self.epochs[ordinal] < until:
+                continue
+            yield ordinal
+
+    def flush(self) -> None:
+        for handle in (self._names_file, self._file):
+            if handle:
+                handle.flush()
+
+    def close(self) -> None:
+        self.flush()
+        for handle in (self._names_file, self._file):
+            if handle:
+                handle.close()
+        self._file = self._names_file = None
+
+    def reset(self) -> None:
+        """Drop every entry (and the persisted files) so the owner can re-add."""
+        self.close()
+        if self.path:
+            for path in (self.path, self._names_path()):
+                if path.exists():
+                    path.unlink()
+        self.__init__(str(self.path) if self.path else None, self.stamp)
+
+    # Internal helpers
+
+    def _names_path(self) -> Path:
+        return Path(str(self.path) + '.names')
+
+    def _code(self, name) -> int:
+        if not isinstance(name, str):
+            return 0
+        code = self.codes.get(name)
+        if code is None:
+            code = self.codes[name] = len(self.names)
+            self.names.append(name)
+            if self._names_file:
+                self._names_file.write((json.dumps(name) + '\n').encode())
+        return code
+
+    def _get_postings(self) -> Dict[int, array]:
+        if self._postings is None:
+            postings = defaultdict(lambda: array('Q'))
+            for ordinal, (t, sy) in enumerate(zip(self.types, self.systems)):
+                postings[t].append(ordinal)
+                if sy != t:
+                    postings[sy].append(ordinal)
+            self._postings = postings
+        return self._postings
+
+    def _lookup(self, field: str, key: Optional[int]) -> List[int]:
+        if key is None:
+            return []
+        attr = '_seal_map' if field == 'seal' else '_checksum_map'
+        if getattr(self, attr) is None:
+            mapping = defaultdict(list)
+            for ordinal, k in enumerate(self.seals if field == 'seal' else self.checksums):
+                mapping[k].append(ordinal)
+            setattr(self, attr, mapping)
+        return getattr(self, attr).get(key, [])
+
+    def _load(self) -> None:
+        names_path = self._names_path()
+        header = self.HEADER.pack(self.MAGIC, hashlib.sha256(self.stamp.encode()).digest())
+        raw = b''
+        if self.path.exists():
+            with open(self.path, 'rb') as f:
+                raw = f.read()
+        if raw[:len(header)] != header:
+            # Missing, from an older format or for other data: start over.
+            raw = b''
+            for path in (self.path, names_path):
+                if path.exists():
+                    path.unlink()
+        if names_path.exists():
+            with open(names_path, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break
+                    name = json.loads(line)
+                    self.codes[name] = len(self.names)
+                    self.names.append(name)
+
+        data = array('Q')
+        raw = raw[len(header):]
+        data.frombytes(raw[:len(raw) - len(raw) % self.RECORD.size])
+        self.types = data[0::self.FIELDS]
+        self.systems = data[1::self.FIELDS]
+        self.epochs = array('d', data[2::self.FIELDS].tobytes())
+        self.seals = data[3::self.FIELDS]
+        self.checksums = data[4::self.FIELDS]
+        if (self.types and max(self.types) >= len(self.names)) or \
+                (self.systems and max(self.systems) >= len(self.names)):
+            # Records reference a name lost in a crash: start over.
+            data = array('Q')
+            self.types, self.systems, self.seals, self.checksums = (array('Q') for _ in range(4))
+            self.epochs = array('d')
+        self.time_sorted = all(a <= b for a, b in zip(self.epochs, self.epochs[1:]))
+
+        self._names_file = open(names_path, 'ab')
+        self._file = open(self.path, 'r+b' if self.path.exists() else 'wb')
+        self._file.write(header)
+        self._file.truncate(len(header) + len(data) * data.itemsize)
+        self._file.seek(0, os.SEEK_END)
+
+
+class QueryableVault(abc.ABC):
+    """Query API shared by vaults that keep an ``AttestationIndex``."""
+
+    index: AttestationIndex
+
+    @abc.abstractmethod
+    def get_attestation(self, n: int) -> Dict:
+        """The ``n``-th attestation."""
+
+    def query(self, seal_type: Optional[str] = None, system: Optional[str] = None,
+              since: Union[str, float, None] = None, until: Union[str, float, None] = None,
+              seal: Optional[str] = None, checksum: Optional[str] = None,
+              limit: int = 100, cursor: Optional[str] = None) -> Dict:
+        """Filter attestations by type, system, [since, until), seal or checksum.
+
+        Returns ``{'attestations': [...], 'next_cursor': str | None}``; pass
+        ``next_cursor`` back as ``cursor`` for the following page.
+        """
+        start = int(cursor) if cursor else 0
+        results, next_cursor = [], None
+        for ordinal in self.index.candidates(
+                seal_type, system,
+                -math.inf if since is None else _to_epoch(since),
+                math.inf if until is None else _to_epoch(until),
+                seal, checksum, start):
+            if len(results) == limit:
+                next_cursor = str(ordinal)
+                break
+            attestation = self.get_attestation(ordinal)
+            if seal is not None and attestation.get('seal') != seal:
+                continue
+            if checksum is not None and attestation.get('checksum') != checksum:
+                continue
+            results.append(attestation)
+        return {'attestations': results, 'next_cursor': next_cursor}
+
+    def find_by_seal(self, seal: str) -> Optional[Dict]:
+        """First attestation with this seal, via hash lookup."""
+        found = self.query(seal=seal, limit=1)['attestations']
+        return found[0] if found else None
+
+    def find_by_checksum(self, checksum: str) -> Optional[Dict]:
+        """First attestation with this checksum, via hash lookup."""
+        found = self.query(checksum=checksum, limit=1)['attestations']
+        return found[0] if found else None
+
+
+class AttestationVault(QueryableVault):
     """Stores and manages attestations in JSON format."""
 
     def __init__(self, vault_path: str = "attestations.json"):
         self.vault_path = Path(vault_path)
         self.vault = self._load_vault()
+        self.index = AttestationIndex()
+        for attestation in self.vault.get('attestations', []):
+            self.index.add(attestation)
 
     def _load_vault(self) -> Dict:
         """Load existing vault or create new one."""
@@ -194,6 +856,7 @@ class AttestationVault:
             self.vault['attestations'] = []
 
         self.vault['attestations'].append(attestation)
+        self.index.add(attestation)
         self.vault['last_updated'] = datetime.now(timezone.utc).isoformat()
 
         return self.save()
@@ -218,6 +881,17 @@ class AttestationVault:
             print(f"Error saving vault: {e}")
             return False
 
+    def add_many(self, attestations: Iterable[Dict]) -> int:
+        """Add attestations with a single save; returns how many were added."""
+        added = 0
+        for attestation in attestations:
+            self.vault.setdefault('attestations', []).append(attestation)
+            self.index.add(attestation)
+            added += 1
+        self.vault['last_updated'] = datetime.now(timezone.utc).isoformat()
+        self.save()
+        return added
+
     def get_attestations(self) -> list:
         """Get all attestations."""
         return self.vault.get('attestations', [])
@@ -226,6 +900,10 @@ class AttestationVault:
         """Get all chains."""
         return self.vault.get('chains', [])
 
+    def get_attestation(self, n: int) -> Dict:
+        """The ``n``-th attestation."""
+        return self.vault['attestations'][n]
+
     def count(self) -> Dict:
         """Get counts of attestations and chains."""
         return {
@@ -234,11 +912,755 @@ class AttestationVault:
         }
 
 
+class LogAttestationVault(QueryableVault):
+    """Append-only, log-structured attestation vault.
+
+    Records are NDJSON lines ``{"k":KIND,"v":VALUE}`` in ``<path>`` (kinds:
+    ``a`` attestation, ``c`` chain, ``m`` vault metadata), behind a header
+    line carrying the file generation. The ``<path>.idx`` sidecar starts with
+    the generation and then holds one little-endian uint64 per record: the
+    byte offset with the kind code in the top byte, so opening a vault reads
+    the index instead of parsing the log. Adds are one append to each file
+    (fsync'd when ``fsync=True``); reads go through a memory map.
+
+    ``compact()`` rewrites the log into a temp file and renames it into place,
+    dropping superseded metadata and replacing chain members that are stored
+    as attestations with their ordinal ``n``; the record's ``"r"`` field lists
+    which members are such references. It can run on a background thread
+    while adds continue. On open, index entries for torn or corrupt tail
+    records are dropped and the log is truncated after the last good record;
+    an index whose generation differs from the log's is rebuilt from the log.
+
+    Queries go through a persisted ``AttestationIndex`` in ``<path>.keys``,
+    kept in step with the log on every add and caught up on open. It is
+    stamped with the random log ``id`` from the header, which compaction
+    keeps, and rebuilt if the stamp or its last entry does not match the log.
+    """
+
+    INDEX = struct.Struct('<Q')
+    KIND_SHIFT = 56
+    OFFSET_MASK = (1 << KIND_SHIFT) - 1
+    KINDS = {'a': 1, 'c': 2, 'm': 3}
+    KIND_NAMES = {code: kind for kind, code in KINDS.items()}
+    FORMAT = 1
+
+    def __init__(self, vault_path: str = "attestations.vlog", fsync: bool = False):
+        self.vault_path = Path(vault_path)
+        self.index_path = Path(str(vault_path) + '.idx')
+        self.fsync = fsync
+        self.autoflush = True
+        self.generation = 0
+        self.log_id = ''
+        self.records = array('Q')
+        self.positions = {kind: array('Q') for kind in self.KINDS}
+        self.meta: Dict = {}
+        self.superseded = 0
+        self._lock = threading.RLock()
+        self._mapped = None
+        self._log_file = None
+        self._idx_file = None
+        self._compactor = None
+        self.index = None
+
+        self._open()
+
+    # Public interface (matches AttestationVault)
+
+    def add_attestation(self, attestation: Dict) -> bool:
+        """Add attestation to vault."""
+        return self._append('a', attestation)
+
+    def add_chain(self, chain: Dict) -> bool:
+        """Add attestation chain to vault."""
+        return self._append('c', chain)
+
+    def add_many(self, attestations: Iterable[Dict]) -> int:
+        """Append attestations with a single flush; returns how many were added."""
+        added = 0
+        with self._lock:
+            autoflush, self.autoflush = self.autoflush, False
+            try:
+                for attestation in attestations:
+                    self._append('a', attestation)
+                    added += 1
+            finally:
+                self.autoflush = autoflush
+                self.flush()
+        return added
+
+    def set_meta(self, key: str, value) -> bool:
+        """Record a vault-level metadata value; the latest value wins."""
+        with self._lock:
+            self.superseded += key in self.meta
+            self.meta[key] = value
+            return self._append('m', {key: value})
+
+    def save(self) -> bool:
+        """Flush pending appends to disk."""
+        try:
+            self.flush()
+            return True
+        except OSError as e:
+            print(f"Error saving vault: {e}")
+            return False
+
+    def get_attestations(self) -> list:
+        """Get all attestations."""
+        return list(self.iter_attestations())
+
+    def get_chains(self) -> list:
+        """Get all chains."""
+        return list(self.iter_chains())
+
+    def iter_attestations(self, start: int = 0) -> Iterator[Dict]:
+        """Stream attestations from ordinal ``start`` present when iteration starts."""
+        return (self.get_attestation(n) for n in range(start, len(self.positions['a'])))
+
+    def iter_chains(self, start: int = 0) -> Iterator[Dict]:
+        """Stream chains from ordinal ``start`` present when iteration starts, with references resolved."""
+        return (self.get_chain(n) for n in range(start, len(self.positions['c'])))
+
+    def get_attestation(self, n: int) -> Dict:
+        """The ``n``-th attestation, by random access."""
+        with self._lock:
+            return self._read(self.positions['a'][n])
+
+    def get_chain(self, n: int) -> Dict:
+        """The ``n``-th chain, by random access."""
+        with self._lock:
+            record = self._record(self.positions['c'][n])
+        return self._resolve(record['v'], record.get('r', ()))
+
+    def count(self) -> Dict:
+        """Get counts of attestations and chains."""
+        return {
+            'attestations': len(self.positions['a']),
+            'chains': len(self.positions['c']),
+        }
+
+    @property
+    def last_updated(self) -> str:
+        mtime = self.vault_path.stat().st_mtime
+        return datetime.fromtimestamp(mtime, timezone.utc).isoformat()
+
+    def flush(self) -> None:
+        """Flush both files (and fsync if configured)."""
+        with self._lock:
+            for handle in (self._log_file, self._idx_file):
+                if handle:
+                    handle.flush()
+                    if self.fsync:
+                        os.fsync(handle.fileno())
+            if self.index:
+                self.index.flush()
+
+    def close(self) -> None:
+        """Wait for a running compaction, then flush and release files."""
+        if self._compactor:
+            self._compactor.join()
+        with self._lock:
+            self.flush()
+            self._release()
+            self.index.close()
+
+    @classmethod
+    def import_json(cls, json_path: str, vault_path: str, fsync: bool = False) -> 'LogAttestationVault':
+        """Build a log vault from a legacy ``attestations.json``."""
+        with open(json_path, 'r') as f:
+            legacy = json.load(f)
+        vault = cls(vault_path, fsync=fsync)
+        with vault._lock:
+            vault.autoflush = False
+            try:
+                vault.add_many(legacy.get('attestations', []))
+                for chain in legacy.get('chains', []):
+                    vault.add_chain(chain)
+                for key, value in legacy.items():
+                    if key not in ('attestations', 'chains'):
+                        vault.set_meta(key, value)
+            finally:
+                vault.autoflush = True
+                vault.flush()
+        return vault
+
+    # Compaction
+
+    def compact(self, background: bool = False) -> Optional[threading.Thread]:
+        """Rewrite the log without superseded records; optionally on a thread."""
+        if not background:
+            self._compact()
+            return None
+        if not (self._compactor and self._compactor.is_alive()):
+            self._compactor = threading.Thread(target=self._compact, name='vault-compactor',
+                                               daemon=True)
+            self._compactor.start()
+        return self._compactor
+
+    def _compact(self) -> None:
+        with self._lock:
+            self.flush()
+            cut = len(self.records)
+            generation = self.generation + 1
+
+        tmp_log = self.vault_path.with_name(self.vault_path.name + '.compact')
+        tmp_idx = self.index_path.with_name(self.index_path.name + '.compact')
+        seals: Dict[int, int] = {}
+        ordinal = [0]
+
+        with open(tmp_log, 'wb') as log, open(tmp_idx, 'wb') as idx:
+            log.write(self._header(generation))
+            idx.write(self.INDEX.pack(generation))
+
+            def copy(start: int, end: int) -> None:
+                latest_meta = {}
+                for r in range(start, end):
+                    if self.records[r] >> self.KIND_SHIFT == self.KINDS['m']:
+                        for key in self._locked_record(r)['v']:
+                            latest_meta[key] = r
+                for r in range(start, end):
+                    kind = self.KIND_NAMES[self.records[r] >> self.KIND_SHIFT]
+                    record = self._locked_record(r)
+                    value, refs = record['v'], record.get('r')
+                    if kind == 'm':
+                        value = {k: v for k, v in value.items() if latest_meta[k] == r}
+                        if not value:
+                            continue
+                    elif kind == 'a':
+                        key = self._seal_key(value)
+                        if key is not None:
+                            seals.setdefault(key, ordinal[0])
+                        ordinal[0] += 1
+                    else:
+                        value, refs = self._dedupe_chain(value, refs or (), seals)
+                    idx.write(self.INDEX.pack(log.tell() | self.KINDS[kind] << self.KIND_SHIFT))
+                    log.write(self._encode(kind, value, refs))
+
+            # Bulk of the copy runs unlocked; only the tail appended meanwhile
+            # and the swap hold the lock.
+            copy(0, cut)
+            with self._lock:
+                self.flush()
+                copy(cut, len(self.records))
+                for handle in (log, idx):
+                    handle.flush()
+                    os.fsync(handle.fileno())
+                # Index first: a crash between the renames leaves a generation
+                # mismatch, which _open() repairs by rebuilding the index.
+                os.replace(tmp_idx, self.index_path)
+                os.replace(tmp_log, self.vault_path)
+                self._release()
+                self._open()
+
+    def _dedupe_chain(self, chain: Dict, refs: Iterable[int],
+                      seals: Dict[int, int]) -> Tuple[Dict, List[int]]:
+        """Replace chain members identical to stored attestations with their ordinals.
+
+        ``refs`` are the member positions that are already references; the
+        result is the chain and every reference position.
+        """
+        members = chain.get('attestations')
+        if not isinstance(members, list):
+            return chain, []
+        refs = set(refs)
+        out = []
+        for i, member in enumerate(members):
+            if i not in refs:
+                n = seals.get(self._seal_key(member))
+                if n is not None and self.get_attestation(n) == member:
+                    member = n
+                    refs.add(i)
+            out.append(member)
+        return dict(chain, attestations=out), sorted(refs)
+
+    @staticmethod
+    def _seal_key(attestation) -> Optional[int]:
+        seal = attestation.get('seal') if isinstance(attestation, dict) else None
+        if isinstance(seal, str) and len(seal) >= 16:
+            try:
+                return int(seal[:16], 16)
+            except ValueError:
+                return None
+        return None
+
+    # Internal helpers
+
+    def _header(self, generation: int) -> bytes:
+        return (json.dumps({'k': 'h', 'format': self.FORMAT, 'generation': generation,
+                            'id': self.log_id}, separators=(',', ':')) + '\n').encode()
+
+    @staticmethod
+    def _encode(kind: str, value: Dict, refs: Optional[List[int]] = None) -> bytes:
+        body = json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+        if refs:
+            body += ',"r":' + json.dumps(refs, separators=(',', ':'))
+        return ('{"k":"' + kind + '","v":' + body + '}\n').encode()
+
+    def _append(self, kind: str, value: Dict) -> bool:
+        line = self._encode(kind, value)
+        with self._lock:
+            entry = self._log_file.tell() | self.KINDS[kind] << self.KIND_SHIFT
+            self._log_file.write(line)
+            self._idx_file.write(self.INDEX.pack(entry))
+            self._track(entry)
+            if kind == 'a':
+                self.index.add(value)
+            if self.autoflush:
+                self.flush()
+        return True
+
+    def _track(self, entry: int) -> None:
+        kind = self.KIND_NAMES[entry >> self.KIND_SHIFT]
+        self.positions[kind].append(len(self.records))
+        self.records.append(entry)
+
+    def _read(self, record: int) -> Dict:
+        """Decode one record's value; caller holds the lock."""
+        return self._record(record)['v']
+
+    def _record(self, record: int) -> Dict:
+        """Decode one record's ``{"k", "v"[, "r"]}`` line; caller holds the lock."""
+        offset = self.records[record] & self.OFFSET_MASK
+        end = self._mapped.find(b'\n', offset) if self._mapped is not None else -1
+        if end < 0:
+            # Past the current mapping: flush buffered appends and remap.
+            self.flush()
+            with open(self.vault_path, 'rb') as f:
+                self._mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            end = self._mapped.find(b'\n', offset)
+        return json.loads(self._mapped[offset:end])
+
+    def _locked_record(self, record: int) -> Dict:
+        with self._lock:
+            return self._record(record)
+
+    def _resolve(self, chain: Dict, refs: Iterable[int]) -> Dict:
+        """Substitute the attestations that the members at ``refs`` refer to."""
+        if refs:
+            members = list(chain['attestations'])
+            for i in refs:
+                members[i] = self.get_attestation(members[i])
+            chain = dict(chain, attestations=members)
+        return chain
+
+    def _release(self) -> None:
+        for handle in (self._log_file, self._idx_file):
+            if handle:
+                handle.close()
+        self._log_file = self._idx_file = None
+        self._mapped = None
+
+    def _open(self) -> None:
+        """Open (or create) the vault, recovering from torn writes and stale indexes."""
+        if not self.vault_path.exists() or self.vault_path.stat().st_size == 0:
+            self.vault_path.parent.mkdir(parents=True, exist_ok=True)
+            self.log_id = os.urandom(16).hex()
+            with open(self.vault_path, 'wb') as log:
+                log.write(self._header(1))
+            with open(self.index_path, 'wb') as idx:
+                idx.write(self.INDEX.pack(1))
+
+        with open(self.vault_path, 'r+b') as log:
+            header = log.readline()
+            head = json.loads(header)
+            self.generation, self.log_id = head['generation'], head.get('id', '')
+
+            entries = array('Q')
+            data = b''
+            if self.index_path.exists():
+                with open(self.index_path, 'rb') as idx:
+                    data = idx.read()
+                entries.frombytes(data[:len(data) - len(data) % self.INDEX.size])
+            if entries and entries[0] == self.generation:
+                del entries[0]
+            else:
+                entries = array('Q')
+                data = b''
+            # Drop entries for tail records that are torn or corrupt (possible
+            # without fsync), as SegmentedEventStore._recover_segment does.
+            while entries:
+                log.seek(entries[-1] & self.OFFSET_MASK)
+                line = log.readline()
+                try:
+                    if (line.endswith(b'\n') and self.KINDS[json.loads(line)['k']]
+                            == entries[-1] >> self.KIND_SHIFT):
+                        break
+                except (ValueError, KeyError, TypeError):
+                    pass
+                entries.pop()
+            if not entries:
+                log.seek(len(header))
+            # Entries the sidecar already holds correctly; it is only
+            # rewritten when missing or from another generation.
+            indexed = len(entries) if data else None
+
+            # Index complete records past the indexed prefix; drop a torn tail.
+            good_end = log.tell()
+            while True:
+                line = log.readline()
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    code = self.KINDS[json.loads(line)['k']]
+                except (ValueError, KeyError, TypeError):
+                    break
+                entries.append(good_end | code << self.KIND_SHIFT)
+                good_end = log.tell()
+            log.truncate(good_end)
+
+        if indexed is None:
+            with open(self.index_path, 'wb') as idx:
+                idx.write(self.INDEX.pack(self.generation))
+                idx.write(entries.tobytes())
+        elif len(entries) != indexed or len(data) != (indexed + 1) * self.INDEX.size:
+            with open(self.index_path, 'r+b') as idx:
+                idx.truncate((indexed + 1) * self.INDEX.size)
+                idx.seek(0, os.SEEK_END)
+                idx.write(entries[indexed:].tobytes())
+
+        self.records = array('Q')
+        self.positions = {kind: array('Q') for kind in self.KINDS}
+        for entry in entries:
+            self._track(entry)
+        self.meta, self.superseded = {}, 0
+        for r in self.positions['m']:
+            for key, value in self._read(r).items():
+                self.superseded += key in self.meta
+                self.meta[key] = value
+
+        # Ordinals survive compaction, so the query index only needs catching
+        # up, unless it was built for another log (stamp) or other content.
+        if self.index is None:
+            self.index = AttestationIndex(str(self.vault_path) + '.keys', self.log_id)
+        indexed = len(self.index)
+        if indexed > len(self.positions['a']) or (indexed and self.index.seals[-1] != (
+                _hex_key(self._read(self.positions['a'][indexed - 1]).get('seal')) or 0)):
+            self.index.reset()
+        for n in range(len(self.index), len(self.positions['a'])):
+            self.index.add(self._read(self.positions['a'][n]))
+        self.index.flush()
+
+        self._log_file = open(self.vault_path, 'ab')
+        self._idx_file = open(self.index_path, 'ab')
+
+
+class SQLiteAttestationVault(QueryableVault):
+    """Attestation vault in a SQLite database (WAL mode), safe for concurrent writers.
+
+    Each attestation is a row holding its JSON body as-is, with type, system,
+    timestamp, seal and checksum in indexed columns. Single adds commit
+    immediately; ``add_many()`` and ``batch()`` group inserts into one
+    transaction. Several processes may open the same file: WAL lets readers
+    proceed during writes, and writers wait up to ``timeout`` seconds for
+    the lock.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS attestations (
+            id INTEGER PRIMARY KEY, type TEXT, system TEXT, timestamp TEXT,
+            epoch REAL, seal TEXT, checksum TEXT, body TEXT NOT NULL);
+        CREATE INDEX IF NOT EXISTS attestations_type ON attestations (type, id);
+        CREATE INDEX IF NOT EXISTS attestations_system ON attestations (system, id);
+        CREATE INDEX IF NOT EXISTS attestations_epoch ON attestations (epoch);
+        CREATE INDEX IF NOT EXISTS attestations_seal ON attestations (seal);
+        CREATE INDEX IF NOT EXISTS attestations_checksum ON attestations (checksum);
+        CREATE TABLE IF NOT EXISTS chains (
+            id INTEGER PRIMARY KEY, timestamp TEXT, chain_hash TEXT, body TEXT NOT NULL);
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+    """
+
+    def __init__(self, vault_path: str = "attestations.db", timeout: float = 30.0):
+        self.vault_path = Path(vault_path)
+        self.conn = sqlite3.connect(str(vault_path), timeout=timeout, isolation_level=None,
+                                    check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(self.SCHEMA)
+        self._lock = threading.RLock()
+        self._depth = 0
+
+    @contextmanager
+    def batch(self):
+        """Group every add inside the block into one transaction."""
+        with self._lock:
+            if self._depth == 0:
+                self.conn.execute('BEGIN IMMEDIATE')
+            self._depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    self.conn.execute('ROLLBACK')
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                self.conn.execute('COMMIT')
+
+    def add_attestation(self, attestation: Dict) -> bool:
+        """Add attestation to vault."""
+        with self.batch():
+            self.conn.execute('INSERT INTO attestations VALUES (NULL, ?, ?, ?, ?, ?, ?, ?)',
+                              self._row(attestation))
+        return True
+
+    def add_many(self, attestations: Iterable[Dict]) -> int:
+        """Insert attestations in a single transaction; returns how many were added."""
+        with self.batch():
+            before = self.conn.total_changes
+            self.conn.executemany('INSERT INTO attestations VALUES (NULL, ?, ?, ?, ?, ?, ?, ?)',
+                                  map(self._row, attestations))
+            return self.conn.total_changes - before
+
+    def add_chain(self, chain: Dict) -> bool:
+        """Add attestation chain to vault."""
+        with self.batch():
+            self.conn.execute('INSERT INTO chains VALUES (NULL, ?, ?, ?)', (
+                chain.get('timestamp'), chain.get('chain_hash'), self._body(chain)))
+        return True
+
+    def set_meta(self, key: str, value) -> bool:
+        """Record a vault-level metadata value."""
+        with self.batch():
+            self.conn.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', (key, json.dumps(value)))
+        return True
+
+    @property
+    def meta(self) -> Dict:
+        return {k: json.loads(v) for k, v in self.conn.execute('SELECT key, value FROM meta')}
+
+    def save(self) -> bool:
+        """Every add is already committed; kept for interface parity."""
+        return True
+
+    def get_attestations(self) -> list:
+        """Get all attestations."""
+        return list(self.iter_attestations())
+
+    def get_chains(self) -> list:
+        """Get all chains."""
+        return list(self.iter_chains())
+
+    def iter_attestations(self, start: int = 0) -> Iterator[Dict]:
+        for (body,) in self.conn.execute(
+                'SELECT body FROM attestations WHERE id > ? ORDER BY id', (start,)):
+            yield json.loads(body)
+
+    def iter_chains(self, start: int = 0) -> Iterator[Dict]:
+        for (body,) in self.conn.execute('SELECT body FROM chains WHERE id > ? ORDER BY id', (start,)):
+            yield json.loads(body)
+
+    def get_attestation(self, n: int) -> Dict:
+        """The ``n``-th attestation (row id ``n + 1``)."""
+        row = self.conn.execute('SELECT body FROM attestations WHERE id = ?', (n + 1,)).fetchone()
+        if row is None:
+            raise IndexError('attestation index out of range')
+        return json.loads(row[0])
+
+    def count(self) -> Dict:
+        """Get counts of attestations and chains."""
+        return {
+            'attestations': self.conn.execute('SELECT COUNT(*) FROM attestations').fetchone()[0],
+            'chains': self.conn.execute('SELECT COUNT(*) FROM chains').fetchone()[0],
+        }
+
+    def query(self, seal_type: Optional[str] = None, system: Optional[str] = None,
+              since: Union[str, float, None] = None, until: Union[str, float, None] = None,
+              seal: Optional[str] = None, checksum: Optional[str] = None,
+              limit: int = 100, cursor: Optional[str] = None) -> Dict:
+        """Same contract as QueryableVault.query(), answered by the SQLite indexes."""
+        clauses, params = ['id >= ?'], [int(cursor) + 1 if cursor else 0]
+        for column, value in (('type', seal_type), ('system', system),
+                              ('seal', seal), ('checksum', checksum)):
+            if value is not None:
+                clauses.append(f'{column} = ?')
+                params.append(value)
+        if since is not None:
+            clauses.append('epoch >= ?')
+            params.append(_to_epoch(since))
+        if until is not None:
+            clauses.append('epoch < ?')
+            params.append(_to_epoch(until))
+        rows = self.conn.execute(
+            f"SELECT id, body FROM attestations WHERE {' AND '.join(clauses)} ORDER BY id LIMIT ?",
+            params + [limit + 1]).fetchall()
+        next_cursor = str(rows.pop()[0] - 1) if len(rows) > limit else None
+        return {'attestations': [json.loads(body) for _, body in rows], 'next_cursor': next_cursor}
+
+    def close(self) -> None:
+        self.conn.close()
+
+    @classmethod
+    def import_json(cls, json_path: str, vault_path: str) -> 'SQLiteAttestationVault':
+        """Build a SQLite vault from a legacy ``attestations.json`` in one transaction."""
+        with open(json_path, 'r') as f:
+            legacy = json.load(f)
+        vault = cls(vault_path)
+        with vault.batch():
+            vault.add_many(legacy.get('attestations', []))
+            for chain in legacy.get('chains', []):
+                vault.add_chain(chain)
+            for key, value in legacy.items():
+                if key not in ('attestations', 'chains'):
+                    vault.set_meta(key, value)
+        return vault
+
+    # Internal helpers
+
+    @staticmethod
+    def _body(obj: Dict) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+    def _row(self, attestation: Dict) -> tuple:
+        epoch = _to_epoch(attestation.get('timestamp'))
+        return (attestation.get('type'), attestation.get('system'), attestation.get('timestamp'),
+                None if math.isnan(epoch) else epoch, attestation.get('seal'),
+                attestation.get('checksum'), self._body(attestation))
+
+
+SQLITE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+
+
+def open_vault(path: Optional[str] = None):
+    """Vault for ``path``: legacy JSON for ``*.json``, SQLite for ``*.db``, else log-structured.
+
+    The default is ``$VUA_VAULT``, else ``attestations.vlog``. An existing
+    legacy ``attestations.json`` with no ``attestations.vlog`` beside it is
+    kept in use, with a hint to import it.
+    """
+    path = path or os.environ.get('VUA_VAULT')
+    if not path:
+        path = 'attestations.vlog'
+        if not os.path.exists(path) and os.path.exists('attestations.json'):
+            print("Using legacy attestations.json; convert it with "
+                  "'vua-attestation-gen.py vault import attestations.json attestations.vlog'",
+                  file=sys.stderr)
+            path = 'attestations.json'
+    if path.endswith('.json'):
+        return AttestationVault(path)
+    if path.endswith(SQLITE_SUFFIXES):
+        return SQLiteAttestationVault(path)
+    return LogAttestationVault(path)
+
+
+def audit_vault(vault, report_path: str, checkpoint_path: Optional[str] = None,
+                workers: Optional[int] = None, batch_size: int = 1000) -> Dict:
+    """Re-verify every attestation and chain in ``vault``; returns a summary.
+
+    Records are streamed in order and checked in batches on a process pool. Each
+    failure is written to ``report_path`` as one NDJSON line
+    ``{kind, n, type, seal, reason}``. After each batch, ``checkpoint_path``
+    records how far the audit got and the report size. An interrupted audit
+    run again with the same checkpoint resumes there, truncating any report
+    lines past the checkpoint. The checkpoint is removed when the audit
+    completes. Records added after the audit starts are not covered.
+    """
+    totals = vault.count()
+    state = {'vault': str(vault.vault_path), 'attestations': 0, 'chains': 0,
+             'failures': 0, 'report_bytes': 0}
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        with open(checkpoint_path, 'r') as f:
+            saved = json.load(f)
+        if saved.get('vault') == state['vault']:
+            state = saved
+    resumed = state['attestations'] + state['chains'] > 0
+
+    report = open(report_path, 'r+' if resumed and os.path.exists(report_path) else 'w')
+    report.truncate(state['report_bytes'] if resumed else 0)
+    report.seek(0, os.SEEK_END)
+
+    def records(kind: str, start: int) -> Iterator[Tuple[str, int, Dict]]:
+        key = kind + 's'
+        if hasattr(vault, 'iter_' + key):
+            items = getattr(vault, 'iter_' + key)(start)
+        else:
+            items = islice(getattr(vault, 'get_' + key)(), start, None)
+        items = islice(items, max(0, totals[key] - start))
+        return ((kind, n, item) for n, item in enumerate(items, start))
+
+    def batches() -> Iterator[list]:
+        for kind, key in (('attestation', 'attestations'), ('chain', 'chains')):
+            source = records(kind, state[key])
+            yield from iter(lambda: list(islice(source, batch_size)), [])
+
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        results = map(_audit_batch, batches())
+    else:
+        pool = multiprocessing.Pool(workers)
+        results = pool.imap(_audit_batch, batches())
+    try:
+        for kind, last, failures in results:
+            for failure in failures:
+                report.write(json.dumps(failure) + '\n')
+            report.flush()
+            state[kind + 's'] = last + 1
+            state['failures'] += len(failures)
+            state['report_bytes'] = report.tell()
+            if checkpoint_path:
+                tmp = checkpoint_path + '.tmp'
+                with open(tmp, 'w') as f:
+                    json.dump(state, f)
+                os.replace(tmp, checkpoint_path)
+    finally:
+        if workers > 1:
+            pool.terminate()
+        report.close()
+
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        os.unlink(checkpoint_path)
+    return {'attestations': state['attestations'], 'chains': state['chains'],
+            'failures': state['failures'], 'resumed': resumed, 'report': report_path}
+
+
+def _audit_batch(batch: List[Tuple[str, int, Dict]]) -> Tuple[str, int, List[Dict]]:
+    """Pool worker: verify one batch of records, returning its kind, last ordinal and failures."""
+    gen = AttestationGenerator()
+    failures = []
+    for kind, n, record in batch:
+        reason = gen.check_seal(record) if kind == 'attestation' else gen.check_chain(record)
+        if reason:
+            failures.append({'kind': kind, 'n': n, 'type': record.get('type'),
+                             'seal': record.get('seal', record.get('chain_hash')),
+                             'reason': reason})
+    return batch[0][0], batch[-1][1], failures
+
+
+def _pop_option(args: List[str], name: str, default: Optional[str] = None) -> Optional[str]:
+    """Remove ``name VALUE`` from args and return VALUE."""
+    if name in args:
+        i = args.index(name)
+        value = args[i + 1]
+        del args[i:i + 2]
+        return value
+    return default
+
+
+def _pop_flag(args: List[str], name: str) -> bool:
+    """Remove ``name`` from args and report whether it was there."""
+    if name in args:
+        args.remove(name)
+        return True
+    return False
+
+
 def main():
     """CLI interface."""
     
     if len(sys.argv) < 2:
-        print("VUA Attestation Generator — Eternal Binding Sealer")
+        print("""VUA Attestation Generator — Eternal Binding Sealer
+
+  seal state|manifest|execution|build ...
+  seal-many state|manifest|execution|build FILE [--workers N] [--batch N] [--vault]
+  chain ATTESTATION...
+  verify ATTESTATION
+  vault add FILE | list | count | compact | chain OUT
+  vault audit [--report FILE] [--checkpoint FILE] [--workers N] [--batch N] [--restart]
+  vault query [--type T] [--system S] [--since ISO] [--until ISO]
+              [--seal HEX] [--checksum HEX] [--limit N] [--cursor C]
+  vault import [attestations.json] [VAULT]
+
+The vault is $VUA_VAULT (default attestations.vlog); a *.json path selects
+the legacy whole-file vault and *.db / *.sqlite a SQLite vault.""")
         return
 
     cmd = sys.argv[1]
@@ -280,6 +1702,30 @@ def main():
             except json.JSONDecodeError:
                 print("Invalid JSON for build info")
 
+    elif cmd == 'seal-many' and len(sys.argv) > 3:
+        args = sys.argv[4:]
+        workers = int(_pop_option(args, '--workers', '1'))
+        batch_size = int(_pop_option(args, '--batch', '1000'))
+        to_vault = '--vault' in args
+        source = sys.stdin if sys.argv[3] == '-' else open(sys.argv[3], 'r')
+        payloads = (json.loads(line) for line in source if line.strip())
+        try:
+            if to_vault:
+                vault = open_vault()
+                stored = gen.seal_to_vault(sys.argv[2], payloads, vault, workers, batch_size)
+                if hasattr(vault, 'close'):
+                    vault.close()
+                print(f"✓ Sealed {stored} payloads into {vault.vault_path}")
+            else:
+                for entry in gen.iter_seal_many(sys.argv[2], payloads, workers, batch_size):
+                    print(json.dumps(entry))
+        except ValueError as e:
+            print(f"✗ {e}")
+            sys.exit(1)
+        finally:
+            if source is not sys.stdin:
+                source.close()
+
     elif cmd == 'chain':
         attestations = []
         for filepath in sys.argv[2:]:
@@ -307,8 +1753,18 @@ def main():
         except:
             print(f"Could not load attestation file: {sys.argv[2]}")
 
+    elif cmd == 'vault' and len(sys.argv) > 2 and sys.argv[2] == 'import':
+        source = sys.argv[3] if len(sys.argv) > 3 else 'attestations.json'
+        target = sys.argv[4] if len(sys.argv) > 4 else os.environ.get('VUA_VAULT', 'attestations.vlog')
+        backend = SQLiteAttestationVault if target.endswith(SQLITE_SUFFIXES) else LogAttestationVault
+        vault = backend.import_json(source, target)
+        counts = vault.count()
+        vault.close()
+        print(f"✓ Imported {counts['attestations']} attestations and {counts['chains']} chains into {target}")
+
     elif cmd == 'vault':
-        vault = AttestationVault()
+        vault = open_vault()
+        failed = False
 
         if len(sys.argv) > 2:
             if sys.argv[2] == 'add' and len(sys.argv) > 3:
@@ -323,17 +1779,77 @@ def main():
                     print(f"Could not load file: {sys.argv[3]}")
 
             elif sys.argv[2] == 'list':
-                attestations = vault.get_attestations()
-                print(f"Attestations in vault ({len(attestations)}):")
+                print(f"Attestations in vault ({vault.count()['attestations']}):")
+                attestations = (vault.iter_attestations() if hasattr(vault, 'iter_attestations')
+                                else vault.get_attestations())
                 for att in attestations:
                     print(f"  • {att['type']} @ {att['timestamp']}")
 
+            elif sys.argv[2] == 'chain' and len(sys.argv) > 3:
+                attestations = (vault.iter_attestations() if hasattr(vault, 'iter_attestations')
+                                else vault.get_attestations())
+                with ChainWriter(sys.argv[3], gen.name) as writer:
+                    writer.extend(attestations)
+                summary = writer.close()
+                if 'error' in summary:
+                    print(f"✗ {summary['error']}")
+                    failed = True
+                else:
+                    print(f"✓ Chained {summary['count']} attestations into {sys.argv[3]}")
+                    print(f"  chain_hash: {summary['chain_hash']}")
+
+            elif sys.argv[2] == 'audit':
+                args = sys.argv[3:]
+                checkpoint = _pop_option(args, '--checkpoint', f'{vault.vault_path}.audit.json')
+                if _pop_flag(args, '--restart') and os.path.exists(checkpoint):
+                    os.unlink(checkpoint)
+                summary = audit_vault(
+                    vault,
+                    report_path=_pop_option(args, '--report', f'{vault.vault_path}.audit.ndjson'),
+                    checkpoint_path=checkpoint,
+                    workers=int(_pop_option(args, '--workers', '0')) or None,
+                    batch_size=int(_pop_option(args, '--batch', '1000')),
+                )
+                mark = '✓' if summary['failures'] == 0 else '✗'
+                print(f"{mark} Audited {summary['attestations']} attestations and "
+                      f"{summary['chains']} chains{' (resumed)' if summary['resumed'] else ''}: "
+                      f"{summary['failures']} failures")
+                if summary['failures']:
+                    print(f"  report: {summary['report']}")
+                    failed = True
+
+            elif sys.argv[2] == 'query':
+                args = sys.argv[3:]
+                page = vault.query(
+                    seal_type=_pop_option(args, '--type'),
+                    system=_pop_option(args, '--system'),
+                    since=_pop_option(args, '--since'),
+                    until=_pop_option(args, '--until'),
+                    seal=_pop_option(args, '--seal'),
+                    checksum=_pop_option(args, '--checksum'),
+                    limit=int(_pop_option(args, '--limit', '100')),
+                    cursor=_pop_option(args, '--cursor'),
+                )
+                for att in page['attestations']:
+                    print(json.dumps(att, ensure_ascii=False))
+                print(json.dumps({'next_cursor': page['next_cursor']}))
+
+            elif sys.argv[2] == 'compact' and hasattr(vault, 'compact'):
+                before = vault.vault_path.stat().st_size
+                vault.compact()
+                print(f"✓ Vault compacted: {before} → {vault.vault_path.stat().st_size} bytes")
+
             elif sys.argv[2] == 'count':
                 counts = vault.count()
                 print(f"Vault counts:")
                 print(f"  Attestations: {counts['attestations']}")
                 print(f"  Chains: {counts['chains']}")
 
+        if hasattr(vault, 'close'):
+            vault.close()
+        if failed:
+            sys.exit(1)
+
 
 if __name__ == '__main__':
     main()
@@ -9,16 +9,31 @@ The Architect - Axis Prime - Veroti - Dustin Sean Coffey - Evomorphic
 𓁚 A FORTIORI • SUI GENERIS
 """
 
+import asyncio
 import json
+from json.encoder import encode_basestring_ascii
 import hashlib
+import hmac
+import math
+import mmap
+import os
+import struct
+import multiprocessing
+import pickle
+from array import array
+from bisect import bisect_left, bisect_right, insort
 import time
 import sys
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple, Any
-from collections import defaultdict
+from typing import Dict, List, Optional, Tuple, Any, Iterable, Iterator, Union
+from collections import Counter, OrderedDict, defaultdict, deque
+from itertools import accumulate, repeat
 import threading
 import queue
+import shutil
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 
 # CONSTANTS
@@ -32,9 +47,179 @@ AXIS_BASE_FREQUENCY = 72.0
 MEDJED_TRIPLEX_CONSTANT = 1.3176
 
 
+class FrozenJSON:
+    """An immutable JSON value with its canonical bytes and digest cached.
+    
+    Wrap a sub-object that is hashed more than once (or embedded in several
+    larger objects) and ``CanonicalJSON`` will splice the cached bytes in
+    instead of serialising it again. Only use it as hashing input; plain
+    ``json.dumps`` does not understand it.
+    """
+    
+    __slots__ = ('value', 'canonical', 'digest')
+    
+    def __init__(self, value: Any, canonical: bytes):
+        self.value = value
+        self.canonical = canonical
+        self.digest = hashlib.sha256(canonical).hexdigest()
+
+
+class _ContainsFrozen(Exception):
+    """Raised by the fast path when it meets a FrozenJSON node."""
+
+
+class CanonicalJSON:
+    """Shared canonical-JSON (sorted keys, compact separators) hashing engine.
+    
+    Objects are encoded by one preconstructed C encoder instead of building
+    a new encoder per ``json.dumps`` call. When hashing, trees estimated
+    above ``STREAM_BYTES`` and trees containing ``FrozenJSON`` nodes are
+    walked instead, feeding the hasher bounded pieces: subtrees under the
+    estimate go through the C encoder in one call and frozen bytes are
+    spliced in, so the whole document is never built in memory.
+    """
+    
+    STREAM_BYTES = 64 * 1024
+    
+    def __init__(self, ensure_ascii: bool = True, separators: Tuple[str, str] = (',', ':')):
+        self.ensure_ascii = ensure_ascii
+        self.separators = separators
+        self._encoder = json.JSONEncoder(sort_keys=True, separators=separators,
+                                         ensure_ascii=ensure_ascii, default=self._default)
+        self._item_sep = separators[0].encode()
+        self._key_sep = separators[1].encode()
+    
+    def dumps(self, obj: Any) -> str:
+        """Canonical JSON text (``FrozenJSON`` nodes are spliced in)."""
+        return self.encode(obj).decode('utf-8')
+    
+    def encode(self, obj: Any) -> bytes:
+        """Canonical JSON as UTF-8 bytes."""
+        try:
+            return self._encoder.encode(obj).encode('utf-8')
+        except _ContainsFrozen:
+            return b''.join(self._chunks(obj))
+    
+    def update(self, hasher, obj: Any) -> None:
+        """Feed the canonical bytes of ``obj`` into a hashlib object."""
+        if self._small(obj):
+            try:
+                hasher.update(self._encoder.encode(obj).encode('utf-8'))
+                return
+            except _ContainsFrozen:
+                pass
+        pending, size = [], 0
+        for chunk in self._chunks(obj):
+            pending.append(chunk)
+            size += len(chunk)
+            if size >= self.STREAM_BYTES:
+                hasher.update(b''.join(pending))
+                pending, size = [], 0
+        hasher.update(b''.join(pending))
+    
+    def hexdigest(self, obj: Any, algorithm: str = 'sha256') -> str:
+        """Hex digest of the canonical form of ``obj``."""
+        if isinstance(obj, FrozenJSON) and algorithm == 'sha256':
+            return obj.digest
+        hasher = hashlib.new(algorithm)
+        self.update(hasher, obj)
+        return hasher.hexdigest()
+    
+    def freeze(self, obj: Any) -> FrozenJSON:
+        """Serialise ``obj`` once and cache its bytes and SHA-256 digest."""
+        return FrozenJSON(obj, self.encode(obj))
+    
+    # Internal helpers
+    
+    @staticmethod
+    def _default(obj: Any) -> Any:
+        if isinstance(obj, FrozenJSON):
+            raise _ContainsFrozen()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    
+    def _key(self, key: Any) -> bytes:
+        """Encode a dict key the way ``json`` coerces it."""
+        if not isinstance(key, str):
+            if key is True or key is False or key is None:
+                key = json.dumps(key)
+            elif isinstance(key, (int, float)):
+                key = self._encoder.encode(key)
+            else:
+                raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+        return self._encoder.encode(key).encode('utf-8')
+    
+    def _small(self, obj: Any) -> bool:
+        """Rough check that ``obj`` encodes to under ``STREAM_BYTES``."""
+        if not isinstance(obj, (dict, list, tuple)):
+            return True
+        budget = self.STREAM_BYTES
+        stack = [obj]
+        while stack:
+            node = stack.pop()
+            values = node.values() if isinstance(node, dict) else node
+            budget -= 8 * len(values)
+            for value in values:
+                if isinstance(value, str):
+                    budget -= len(value)
+                elif isinstance(value, (dict, list, tuple)):
+                    stack.append(value)
+            if budget < 0:
+                return False
+        return True
+    
+    def _chunks(self, obj: Any) -> Iterator[bytes]:
+        if isinstance(obj, FrozenJSON):
+            yield obj.canonical
+            return
+        if self._small(obj):
+            try:
+                yield self._encoder.encode(obj).encode('utf-8')
+                return
+            except _ContainsFrozen:
+                pass
+        
+        if isinstance(obj, dict):
+            yield b'{'
+            for i, key in enumerate(sorted(obj)):
+                if i:
+                    yield self._item_sep
+                yield self._key(key) + self._key_sep
+                yield from self._chunks(obj[key])
+            yield b'}'
+        else:
+            yield b'['
+            for i, item in enumerate(obj):
+                if i:
+                    yield self._item_sep
+                yield from self._chunks(item)
+            yield b']'
+
+
+# Canonical form used for every hash in this module.
+CANONICAL = CanonicalJSON()
+
+
+# Shared thread pool for CryptoEngine.hash_many (created on first use).
+_HASH_POOL = None
+_HASH_POOL_LOCK = threading.Lock()
+
+
+def _hash_pool() -> ThreadPoolExecutor:
+    global _HASH_POOL
+    with _HASH_POOL_LOCK:
+        if _HASH_POOL is None:
+            _HASH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                            thread_name_prefix='vua-hash')
+        return _HASH_POOL
+
+
 class CryptoEngine:
     """Pure Python cryptographic operations using stdlib only."""
     
+    # Inputs at least this large go to the thread pool; hashlib releases the
+    # GIL while hashing them, so they hash in parallel.
+    PARALLEL_THRESHOLD = 64 * 1024
+    
     @staticmethod
     def sha256(data: str) -> str:
         """SHA-256 hash."""
@@ -48,8 +233,50 @@ class CryptoEngine:
     @staticmethod
     def hash_object(obj: Dict) -> str:
         """Hash a JSON object with canonical form."""
-        canonical = json.dumps(obj, sort_keys=True, separators=(',', ':'))
-        return CryptoEngine.sha256(canonical)
+        return CANONICAL.hexdigest(obj)
+    
+    @staticmethod
+    def hash_many(items: Iterable[Union[str, bytes]], algorithm: str = 'sha256',
+                  stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """Hex digests of many strings/bytes, in input order.
+        
+        Small inputs are hashed inline; inputs of ``PARALLEL_THRESHOLD`` bytes
+        or more are hashed on a shared thread pool. With ``stream=True`` a
+        generator is returned that consumes ``items`` lazily, keeping a
+        bounded number of large inputs in flight.
+        """
+        digests = CryptoEngine._hash_stream(items, algorithm)
+        return digests if stream else list(digests)
+    
+    @staticmethod
+    def hash_objects(objs: Iterable[Any], algorithm: str = 'sha256',
+                     stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """Batch ``hash_object``: canonicalise with the shared engine, then hash."""
+        return CryptoEngine.hash_many((CANONICAL.encode(obj) for obj in objs), algorithm, stream)
+    
+    @staticmethod
+    def _hash_stream(items: Iterable[Union[str, bytes]], algorithm: str) -> Iterator[str]:
+        constructor = getattr(hashlib, algorithm, None) or (lambda data: hashlib.new(algorithm, data))
+        threshold = CryptoEngine.PARALLEL_THRESHOLD
+        in_flight = 4 * (os.cpu_count() or 1)
+        pending = deque()
+        pool = None
+        
+        for item in items:
+            data = item.encode() if isinstance(item, str) else item
+            if len(data) >= threshold:
+                pool = pool or _hash_pool()
+                pending.append(pool.submit(lambda d: constructor(d).hexdigest(), data))
+            else:
+                pending.append(constructor(data).hexdigest())
+            while pending and (not isinstance(pending[0], Future)
+                               or pending[0].done() or len(pending) > in_flight):
+                head = pending.popleft()
+                yield head.result() if isinstance(head, Future) else head
+        
+        while pending:
+            head = pending.popleft()
+            yield head.result() if isinstance(head, Future) else head
     
     @staticmethod
     def checksum(data: str) -> str:
@@ -59,15 +286,305 @@ class CryptoEngine:
     @staticmethod
     def create_seal(data: Dict, salt: str = "") -> str:
         """Create cryptographic seal."""
-        canonical = json.dumps(data, sort_keys=True, separators=(',', ':'))
-        seal_input = canonical + CREDIT + salt + str(int(time.time()))
-        return CryptoEngine.sha256(seal_input)
+        hasher = hashlib.sha256()
+        CANONICAL.update(hasher, data)
+        hasher.update((CREDIT + salt + str(int(time.time()))).encode())
+        return hasher.hexdigest()
+
+
+class Subscription:
+    """A subscriber's bounded queue on an EventBus topic pattern.
+    
+    Overflow policies: ``'drop_oldest'`` discards the oldest pending message,
+    ``'block'`` makes the publisher wait (up to ``block_timeout`` seconds,
+    then the new message is dropped), and ``'coalesce'`` merges a message
+    into the pending one with the same ``key`` (``delta`` dicts are merged,
+    other payload fields take the newest value), dropping the oldest key
+    only if the queue is full of distinct keys.
+    """
+    
+    POLICIES = ('drop_oldest', 'block', 'coalesce')
+    
+    def __init__(self, bus: 'EventBus', pattern: str, maxsize: int = 1024,
+                 policy: str = 'drop_oldest', block_timeout: Optional[float] = None):
+        if policy not in self.POLICIES:
+            raise ValueError(f"policy must be one of {self.POLICIES}")
+        self.bus = bus
+        self.pattern = pattern
+        self.maxsize = maxsize
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self.closed = False
+        self._pending = OrderedDict() if policy == 'coalesce' else deque()
+        self._cond = threading.Condition()
+        self._wakers = []
+    
+    def matches(self, topic: str) -> bool:
+        """``'*'`` matches everything and ``'state.*'`` a topic family."""
+        if self.pattern in ('*', topic):
+            return True
+        return self.pattern.endswith('.*') and topic.startswith(self.pattern[:-1])
+    
+    def get(self, timeout: Optional[float] = None) -> Optional[Dict]:
+        """Next message, or None on timeout or once closed and drained."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._pending or self.closed, timeout):
+                return None
+            return self._pop()
+    
+    def get_nowait(self) -> Optional[Dict]:
+        with self._cond:
+            return self._pop()
+    
+    def close(self) -> None:
+        """Unsubscribe and wake any waiting consumer."""
+        self.bus.unsubscribe(self)
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+        self._wake()
+    
+    def __iter__(self) -> Iterator[Dict]:
+        while True:
+            message = self.get()
+            if message is None:
+                return
+            yield message
+    
+    def __len__(self) -> int:
+        return len(self._pending)
+    
+    def _offer(self, message: Dict) -> None:
+        with self._cond:
+            if self.closed:
+                return
+            pending = self._pending
+            if self.policy == 'coalesce':
+                key = message['key']
+                if key in pending:
+                    pending[key] = self._coalesce(pending[key], message)
+                else:
+                    if len(pending) >= self.maxsize:
+                        pending.popitem(last=False)
+                        self.dropped += 1
+                    pending[key] = message
+            else:
+                if len(pending) >= self.maxsize:
+                    if self.policy == 'drop_oldest':
+                        pending.popleft()
+                        self.dropped += 1
+                    elif not self._cond.wait_for(
+                            lambda: len(pending) < self.maxsize or self.closed, self.block_timeout) \
+                            or self.closed:
+                        self.dropped += 1
+                        return
+                pending.append(message)
+            self._cond.notify_all()
+        self._wake()
+    
+    def _pop(self) -> Optional[Dict]:
+        if not self._pending:
+            return None
+        if self.policy == 'coalesce':
+            message = self._pending.popitem(last=False)[1]
+        else:
+            message = self._pending.popleft()
+        self._cond.notify_all()
+        return message
+    
+    def _wake(self) -> None:
+        for waker in list(self._wakers):
+            waker()
+    
+    @staticmethod
+    def _coalesce(old: Dict, new: Dict) -> Dict:
+        payload = dict(old['payload'], **new['payload'])
+        if isinstance(old['payload'].get('delta'), dict) and isinstance(new['payload'].get('delta'), dict):
+            payload['delta'] = dict(old['payload']['delta'], **new['payload']['delta'])
+        return dict(new, payload=payload, coalesced=old.get('coalesced', 1) + 1)
+
+
+class AsyncSubscription:
+    """asyncio adapter: ``await sub.get()`` or ``async for message in sub``."""
+    
+    def __init__(self, subscription: Subscription, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.subscription = subscription
+        self.loop = loop or asyncio.get_running_loop()
+        self._ready = asyncio.Event()
+        subscription._wakers.append(lambda: self.loop.call_soon_threadsafe(self._ready.set))
+    
+    async def get(self) -> Optional[Dict]:
+        """Next message, or None once the subscription is closed and drained."""
+        while True:
+            self._ready.clear()
+            message = self.subscription.get_nowait()
+            if message is not None or self.subscription.closed:
+                return message
+            await self._ready.wait()
+    
+    def close(self) -> None:
+        self.subscription.close()
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self) -> Dict:
+        message = await self.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+
+class EventBus:
+    """In-process publish/subscribe bus with typed topics.
+    
+    Topics must be registered (the core ones are built in) so a typo fails
+    loudly. Each subscriber has its own bounded queue and overflow policy,
+    so a slow consumer never grows memory without bound. StateVector,
+    EventLog and MetricsCollector publish deltas when given ``bus=``.
+    Messages are ``{'topic', 'key', 'seq', 'timestamp', 'payload'}``.
+    """
+    
+    TOPICS = {
+        'state.update': "StateVector.update(): name, cycle, delta, hash, timestamp",
+        'state.rotate': "StateVector.phi_rotate(): name, phi_phase, stability, hash",
+        'log.append': "EventLog append: name, entry",
+        'metrics.record': "MetricsCollector.record(): metric, value, epoch, tags",
+    }
+    
+    def __init__(self):
+        self.topics = dict(self.TOPICS)
+        self.subscriptions = []
+        self._seq = 0
+        self._lock = threading.Lock()
+    
+    def register_topic(self, topic: str, description: str = "") -> None:
+        self.topics[topic] = description
+    
+    def subscribe(self, pattern: str, maxsize: int = 1024, policy: str = 'drop_oldest',
+                  block_timeout: Optional[float] = None) -> Subscription:
+        """Subscribe to a topic, a ``'family.*'`` pattern or ``'*'``."""
+        if pattern != '*' and not pattern.endswith('.*') and pattern not in self.topics:
+            raise KeyError(f"unknown topic: {pattern}")
+        subscription = Subscription(self, pattern, maxsize, policy, block_timeout)
+        with self._lock:
+            self.subscriptions = self.subscriptions + [subscription]
+        return subscription
+    
+    def subscribe_async(self, pattern: str, maxsize: int = 1024, policy: str = 'drop_oldest',
+                        loop: Optional[asyncio.AbstractEventLoop] = None) -> AsyncSubscription:
+        """Subscribe from asyncio code (call inside the running loop).
+        
+        ``'block'`` is refused: a publisher on the loop's own thread would
+        wait for a consumer that cannot run until it returns.
+        """
+        if policy == 'block':
+            raise ValueError("async subscribers cannot use the 'block' policy")
+        return AsyncSubscription(self.subscribe(pattern, maxsize, policy), loop)
+    
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self.subscriptions = [s for s in self.subscriptions if s is not subscription]
+    
+    def publish(self, topic: str, payload: Dict, key: Optional[str] = None) -> int:
+        """Deliver a message to matching subscribers; returns how many."""
+        if topic not in self.topics:
+            raise KeyError(f"unknown topic: {topic}")
+        subscriptions = self.subscriptions
+        if not subscriptions:
+            return 0
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+        message = {'topic': topic, 'key': key or topic, 'seq': seq,
+                   'timestamp': time.time(), 'payload': payload}
+        delivered = 0
+        for subscription in subscriptions:
+            if subscription.matches(topic):
+                subscription._offer(message)
+                delivered += 1
+        return delivered
+
+
+class StateData(dict):
+    """A dict that records which top-level keys were set or removed.
+    
+    ``StateVector`` uses ``dirty`` to rehash only the keys that changed,
+    whichever way they were changed.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dirty = set(self)
+    
+    def __reduce__(self):
+        return (StateData, (dict(self),))
+    
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self.dirty.add(key)
+    
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self.dirty.add(key)
+    
+    def __ior__(self, other):
+        self.update(other)
+        return self
+    
+    def update(self, *args, **kwargs) -> None:
+        other = dict(*args, **kwargs)
+        super().update(other)
+        self.dirty.update(other)
+    
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+    
+    def pop(self, key, *default):
+        if key in self:
+            self.dirty.add(key)
+        return super().pop(key, *default)
+    
+    def popitem(self):
+        key, value = super().popitem()
+        self.dirty.add(key)
+        return key, value
+    
+    def clear(self) -> None:
+        self.dirty.update(self)
+        super().clear()
 
 
 class StateVector:
-    """Represents VUA system state with phi-harmonic resonance."""
+    """Represents VUA system state with phi-harmonic resonance.
+    
+    The data root is a Merkle tree over the ``data`` items, so an update
+    rehashes only the changed keys and their paths to the root. Each item has
+    a key hash ``SHA-256(0x02 + canonical(key))`` and a leaf digest
+    ``SHA-256(0x00 + canonical([key, value]))``. A tree node covers the items
+    whose key hashes start with its bit prefix. A node with at most
+    ``BUCKET`` items is ``SHA-256(0x03 + their leaf digests in key-hash
+    order)``; a larger one is ``SHA-256(0x01 + left + right)``, splitting on
+    the next bit. The shape depends only on the keys, so the root is
+    deterministic. A small state is a single bucket, and a large one is about
+    ``log2(len(data) / BUCKET)`` levels deep.
+    ``hash`` is then the canonical hash of the header fields, ``data_root``
+    and the previous ``hash``.
     
-    def __init__(self, name: str = "VUA-STATE"):
+    ``data`` is a ``StateData``, which tracks every top-level assignment,
+    deletion or ``update()``, so direct edits are picked up the next time the
+    hash is computed. Values are expected to be replaced rather than mutated
+    in place; call ``rehash_data()`` after editing a nested value.
+    """
+    
+    KEY_BITS = 256
+    BUCKET = 16
+    _CREDIT_TEXT = b'{"credit":' + CANONICAL.encode(CREDIT) + b',"cycle":'
+    
+    def __init__(self, name: str = "VUA-STATE", bus: Optional[EventBus] = None):
         self.name = name
         self.timestamp = datetime.now(timezone.utc).isoformat()
         self.cycle = 0
@@ -75,24 +592,80 @@ class StateVector:
         self.phi_phase = 0.0
         self.stability = 1.0
         self.hash = ""
+        self.persistence = None
+        self.bus = bus
+        self._fixed = None
         self.update_hash()
     
-    def update(self, data: Dict) -> None:
+    @property
+    def data(self) -> StateData:
+        return self._data
+    
+    @data.setter
+    def data(self, value: Dict) -> None:
+        self._data = value if isinstance(value, StateData) else StateData(value)
+        self._data.dirty = set(self._data)
+        self._points = {}
+        self._leaves = {}
+        self._ordered = []
+        self._nodes = {}
+    
+    def update(self, data: Dict, timestamp: Optional[str] = None) -> None:
         """Update state with new data."""
         self.data.update(data)
-        self.timestamp = datetime.now(timezone.utc).isoformat()
+        self.timestamp = timestamp or datetime.now(timezone.utc).isoformat()
         self.cycle += 1
         self.update_hash()
+        if self.persistence:
+            self.persistence.record(self, 'update', {
+                'data': data, 'timestamp': self.timestamp, 'hash': self.hash})
+        if self.bus:
+            self.bus.publish('state.update', {
+                'name': self.name, 'cycle': self.cycle, 'delta': dict(data),
+                'hash': self.hash, 'timestamp': self.timestamp}, key=self.name)
     
     def update_hash(self) -> None:
-        """Recalculate state hash."""
-        self.hash = CryptoEngine.hash_object(self.to_dict())
+        """Recalculate state hash from the header and data root.
+        
+        The hashed text is the canonical JSON of ``{name, timestamp, cycle,
+        phi_phase, stability, data_root, hash, credit}``. Fields that change
+        only with the name or the phase are encoded once and the rest are
+        spliced in, since on a small state this encode is most of the cost.
+        """
+        fixed = (self.name, self.phi_phase, self.stability)
+        if self._fixed != fixed:
+            self._fixed = fixed
+            self._fixed_text = b''.join((
+                b',"name":', CANONICAL.encode(self.name),
+                b',"phi_phase":', CANONICAL.encode(self.phi_phase),
+                b',"stability":', CANONICAL.encode(self.stability), b',"timestamp":'))
+        self.hash = hashlib.sha256(b''.join((
+            self._CREDIT_TEXT, b'%d' % self.cycle,
+            b',"data_root":"', self.data_root().encode(),
+            b'","hash":', encode_basestring_ascii(self.hash).encode(),
+            self._fixed_text, encode_basestring_ascii(self.timestamp).encode(), b'}'))).hexdigest()
+    
+    def data_root(self) -> str:
+        """Merkle root of ``data``, rehashing only changed keys."""
+        self._sync_tree()
+        return self._node(1, 0, len(self._ordered)).hex()
+    
+    def rehash_data(self) -> None:
+        """Rehash every key (after in-place edits to nested values) and refresh the hash."""
+        self._data.dirty.update(self._data)
+        self.update_hash()
     
     def phi_rotate(self, degrees: float) -> None:
         """Apply phi-harmonic rotation."""
         self.phi_phase = (self.phi_phase + degrees) % 360.0
         self.stability = abs(PHI * (self.phi_phase / 360.0))
         self.update_hash()
+        if self.persistence:
+            self.persistence.record(self, 'rotate', {'degrees': degrees, 'hash': self.hash})
+        if self.bus:
+            self.bus.publish('state.rotate', {
+                'name': self.name, 'phi_phase': self.phi_phase,
+                'stability': self.stability, 'hash': self.hash}, key=self.name)
     
     def to_dict(self) -> Dict:
         """Export state as dictionary."""
@@ -103,6 +676,7 @@ class StateVector:
             'phi_phase': self.phi_phase,
             'stability': self.stability,
             'data': self.data,
+            'data_root': self.data_root(),
             'hash': self.hash,
             'credit': CREDIT,
         }
@@ -112,18 +686,821 @@ class StateVector:
         if pretty:
             return json.dumps(self.to_dict(), indent=2)
         return json.dumps(self.to_dict())
+    
+    def _sync_tree(self) -> None:
+        """Rehash changed leaves and drop the cached nodes on their paths."""
+        data, leaves, ordered, nodes = self._data, self._leaves, self._ordered, self._nodes
+        bits = self.KEY_BITS
+        for key in data.dirty:
+            found = self._points.get(key)
+            if found is None:
+                encoded = CANONICAL.encode(key)
+                point = int.from_bytes(hashlib.sha256(b'\x02' + encoded).digest(), 'big')
+                found = point, b'\x00[' + encoded + b','
+            point, prefix = found
+            # Only nodes that held more than BUCKET keys before the change are cached.
+            before = 0
+            if key in data:
+                hasher = hashlib.sha256(prefix)
+                CANONICAL.update(hasher, data[key])
+                hasher.update(b']')
+                if point not in leaves:
+                    insort(ordered, point)
+                    self._points[key] = found
+                    before = -1
+                leaves[point] = hasher.digest()
+            elif leaves.pop(point, None) is not None:
+                del ordered[bisect_left(ordered, point)]
+                del self._points[key]
+                before = 1
+            
+            node, lo, hi = 1, 0, len(ordered)
+            while hi - lo + before > self.BUCKET:
+                nodes.pop(node, None)
+                depth = node.bit_length()
+                right = (node << 1 | 1) - (1 << depth) << (bits - depth)
+                mid = bisect_left(ordered, right, lo, hi)
+                if point >= right:
+                    node, lo = node << 1 | 1, mid
+                else:
+                    node, hi = node << 1, mid
+        data.dirty.clear()
+    
+    def _node(self, node: int, lo: int, hi: int) -> bytes:
+        """Digest of tree node ``node`` (heap-numbered), which holds ``_ordered[lo:hi]``."""
+        if hi - lo <= self.BUCKET:
+            return hashlib.sha256(b'\x03' + b''.join(map(self._leaves.__getitem__,
+                                                         self._ordered[lo:hi]))).digest()
+        digest = self._nodes.get(node)
+        if digest is None:
+            depth = node.bit_length()
+            # The right child's keys start at its prefix followed by zeros.
+            mid = bisect_left(self._ordered, (node << 1 | 1) - (1 << depth) << (self.KEY_BITS - depth),
+                              lo, hi)
+            digest = hashlib.sha256(b'\x01' + self._node(node << 1, lo, mid)
+                                    + self._node(node << 1 | 1, mid, hi)).digest()
+            self._nodes[node] = digest
+        return digest
+
+
+class SegmentedEventStore:
+    """Append-only, disk-backed event storage for EventLog.
+    
+    Events are written as NDJSON records to ``segment-NNNNNN.log`` files that
+    roll once they reach ``segment_size`` bytes. Each segment has a sidecar
+    ``.idx`` file of little-endian uint64 record offsets, and reads go through
+    memory-mapped segments, so only the pages actually touched stay resident.
+    Another process can open the same directory with ``readonly=True`` and
+    call ``refresh()`` to pick up records appended since it last looked.
+    """
+    
+    OFFSET = struct.Struct('<Q')
+    
+    def __init__(self, directory: str, segment_size: int = 64 * 1024 * 1024,
+                 readonly: bool = False, fsync: bool = False):
+        self.directory = Path(directory)
+        self.segment_size = segment_size
+        self.readonly = readonly
+        self.fsync = fsync
+        self.autoflush = True
+        self.segments = []  # [base_index, count, segment_number]
+        self._bases = []  # segment base indexes, for bisect
+        self.checkpoints = []
+        self._maps = {}
+        self._log_file = None
+        self._idx_file = None
+        self._active_size = 0
+        
+        if not readonly:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._recover()
+        self.refresh()
+        if not readonly:
+            self._open_active()
+    
+    def __len__(self) -> int:
+        if not self.segments:
+            return 0
+        base, count, _ = self.segments[-1]
+        return base + count
+    
+    def __getitem__(self, index: int) -> Dict:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('event index out of range')
+        base, _, number = self.segments[bisect_right(self._bases, index) - 1]
+        return self._read(number, index - base)
+    
+    def __iter__(self) -> Iterator[Dict]:
+        return self.iter_from(0)
+    
+    def iter_from(self, start: int) -> Iterator[Dict]:
+        """Stream events from ``start`` onwards, segment by segment."""
+        for base, count, number in list(self.segments):
+            if base + count <= start:
+                continue
+            log_map = self._map(self._log_path(number))
+            idx_map = self._map(self._idx_path(number))
+            for position in range(max(start - base, 0), count):
+                offset = self.OFFSET.unpack_from(idx_map, position * self.OFFSET.size)[0]
+                end = log_map.find(b'\n', offset)
+                yield json.loads(log_map[offset:end])
+    
+    def append(self, entry: Dict) -> None:
+        """Append one event record and its offset."""
+        if self.readonly:
+            raise IOError('store opened read-only')
+        line = json.dumps(entry, separators=(',', ':')).encode() + b'\n'
+        if self._active_size and self._active_size + len(line) > self.segment_size:
+            self._roll()
+        offset = self._active_size
+        self._log_file.write(line)
+        self._idx_file.write(self.OFFSET.pack(offset))
+        self._active_size += len(line)
+        self.segments[-1][1] += 1
+        if self.autoflush:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Flush the active segment (and fsync if configured)."""
+        for handle in (self._log_file, self._idx_file):
+            if handle:
+                handle.flush()
+                if self.fsync:
+                    os.fsync(handle.fileno())
+    
+    def add_checkpoint(self, checkpoint: Dict) -> None:
+        """Persist a chain checkpoint beside the segments."""
+        self.checkpoints.append(checkpoint)
+        if not self.readonly:
+            with open(self.directory / 'checkpoints.ndjson', 'a') as f:
+                f.write(json.dumps(checkpoint, separators=(',', ':')) + '\n')
+    
+    def refresh(self) -> None:
+        """Re-read segment and checkpoint metadata from disk."""
+        segments, base = [], 0
+        for path in sorted(self.directory.glob('segment-*.idx')):
+            number = int(path.stem.split('-')[1])
+            count = path.stat().st_size // self.OFFSET.size
+            segments.append([base, count, number])
+            base += count
+        self.segments = segments or [[0, 0, 0]]
+        self._bases = [segment[0] for segment in self.segments]
+        
+        cp_path = self.directory / 'checkpoints.ndjson'
+        if cp_path.exists():
+            with open(cp_path, 'r') as f:
+                self.checkpoints = [json.loads(line) for line in f if line.endswith('\n')]
+    
+    def close(self) -> None:
+        """Flush and release file handles and mappings."""
+        self.flush()
+        for handle in (self._log_file, self._idx_file):
+            if handle:
+                handle.close()
+        self._log_file = self._idx_file = None
+        for mapped in self._maps.values():
+            mapped.close()
+        self._maps = {}
+    
+    # Internal helpers
+    
+    def _log_path(self, number: int) -> Path:
+        return self.directory / f'segment-{number:06d}.log'
+    
+    def _idx_path(self, number: int) -> Path:
+        return self.directory / f'segment-{number:06d}.idx'
+    
+    def _map(self, path: Path):
+        """Return a read-only mapping of ``path`` covering its current size."""
+        size = path.stat().st_size
+        mapped = self._maps.get(path)
+        if mapped is None or len(mapped) < size:
+            # Superseded mappings are left to the GC: live iterators may hold them.
+            if size == 0:
+                return b''
+            with open(path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+            self._maps[path] = mapped
+        return mapped
+    
+    def _read(self, number: int, position: int) -> Dict:
+        idx_map = self._map(self._idx_path(number))
+        offset = self.OFFSET.unpack_from(idx_map, position * self.OFFSET.size)[0]
+        log_map = self._map(self._log_path(number))
+        return json.loads(log_map[offset:log_map.find(b'\n', offset)])
+    
+    def _open_active(self) -> None:
+        number = self.segments[-1][2]
+        self._log_file = open(self._log_path(number), 'ab')
+        self._idx_file = open(self._idx_path(number), 'ab')
+        self._active_size = self._log_file.tell()
+    
+    def _roll(self) -> None:
+        self.flush()
+        self._log_file.close()
+        self._idx_file.close()
+        base, count, number = self.segments[-1]
+        self.segments.append([base + count, 0, number + 1])
+        self._bases.append(base + count)
+        self._open_active()
+    
+    def _recover(self) -> None:
+        """Repair the tail of every segment after a crash or a damaged write."""
+        for idx_path in sorted(self.directory.glob('segment-*.idx')):
+            self._recover_segment(int(idx_path.stem.split('-')[1]))
+    
+    def _recover_segment(self, number: int) -> None:
+        """Drop index entries for torn or corrupt tail records, index complete
+        records a crash left unindexed, and truncate the log after them."""
+        log_path, idx_path = self._log_path(number), self._idx_path(number)
+        log_path.touch()
+        size = self.OFFSET.size
+        
+        with open(idx_path, 'r+b') as idx, open(log_path, 'r+b') as log:
+            entries = idx.seek(0, os.SEEK_END) // size
+            good_end = 0
+            while entries:
+                idx.seek((entries - 1) * size)
+                log.seek(self.OFFSET.unpack(idx.read(size))[0])
+                line = log.readline()
+                try:
+                    if line.endswith(b'\n'):
+                        json.loads(line)
+                        good_end = log.tell()
+                        break
+                except ValueError:
+                    pass
+                entries -= 1
+            idx.truncate(entries * size)
+            log.seek(good_end)
+            offsets = []
+            while True:
+                line = log.readline()
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    json.loads(line)
+                except ValueError:
+                    break
+                offsets.append(good_end)
+                good_end = log.tell()
+            log.truncate(good_end)
+            idx.seek(0, os.SEEK_END)
+            for offset in offsets:
+                idx.write(self.OFFSET.pack(offset))
+
+
+class TimeIndex:
+    """Time-ordered (epoch, position) index supporting bisect range queries."""
+    
+    def __init__(self):
+        self.keys = array('d')
+        self.positions = array('q')
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    def add(self, epoch: float, position: int) -> None:
+        """Insert a position; in-order timestamps append in O(1)."""
+        if not self.keys or epoch >= self.keys[-1]:
+            self.keys.append(epoch)
+            self.positions.append(position)
+        else:
+            at = bisect_right(self.keys, epoch)
+            self.keys.insert(at, epoch)
+            self.positions.insert(at, position)
+    
+    def span(self, since: Optional[float] = None, until: Optional[float] = None) -> Tuple[int, int]:
+        """Return the [lo, hi) slot range with since <= epoch <= until."""
+        lo = bisect_left(self.keys, since) if since is not None else 0
+        hi = bisect_right(self.keys, until) if until is not None else len(self.keys)
+        return lo, hi
+    
+    def after(self, epoch: float, position: int) -> int:
+        """Return the slot just past ``position`` (recorded at ``epoch``)."""
+        slot = bisect_left(self.keys, epoch)
+        while slot < len(self.keys) and self.keys[slot] == epoch:
+            slot += 1
+            if self.positions[slot - 1] == position:
+                return slot
+        return bisect_right(self.keys, epoch)
+
+
+class MerkleTree:
+    """Incremental RFC 6962 Merkle tree over event hashes.
+    
+    Leaves are ``SHA-256(0x00 || entry_hash)`` and interior nodes
+    ``SHA-256(0x01 || left || right)``. Every complete, aligned subtree root
+    is kept (one flat bytearray per level), so appends are amortised O(1)
+    and proofs need only O(log n) node lookups. Proofs and roots are hex.
+    """
+    
+    DIGEST_SIZE = 32
+    
+    def __init__(self):
+        self.levels = [bytearray()]
+    
+    def __len__(self) -> int:
+        return len(self.levels[0]) // self.DIGEST_SIZE
+    
+    def append(self, entry_hash: str) -> None:
+        """Add the leaf for an entry hash and fold completed subtrees."""
+        self.levels[0] += self.leaf_hash(entry_hash)
+        level, size = 0, len(self)
+        while size % 2 == 0:
+            if len(self.levels) == level + 1:
+                self.levels.append(bytearray())
+            nodes = self.levels[level]
+            self.levels[level + 1] += self._node(nodes[-64:-32], nodes[-32:])
+            level, size = level + 1, size // 2
+    
+    def root(self, size: Optional[int] = None) -> str:
+        """Root hash of the tree over the first ``size`` leaves."""
+        size = len(self) if size is None else size
+        if not 0 <= size <= len(self):
+            raise ValueError(f"tree size {size} out of range")
+        if size == 0:
+            return hashlib.sha256(b'').hexdigest()
+        return self._subtree(0, size).hex()
+    
+    def inclusion_proof(self, index: int, size: Optional[int] = None) -> List[str]:
+        """Audit path for leaf ``index`` in the tree of ``size`` leaves."""
+        size = len(self) if size is None else size
+        if not 0 <= index < size <= len(self):
+            raise ValueError(f"leaf {index} not in tree of size {size}")
+        return [node.hex() for node in self._path(index, 0, size)]
+    
+    def consistency_proof(self, old_size: int, new_size: Optional[int] = None) -> List[str]:
+        """Proof that the ``old_size`` tree is a prefix of the ``new_size`` tree."""
+        new_size = len(self) if new_size is None else new_size
+        if not 0 <= old_size <= new_size <= len(self):
+            raise ValueError(f"cannot prove {old_size} -> {new_size}")
+        if old_size in (0, new_size):
+            return []
+        return [node.hex() for node in self._subproof(old_size, 0, new_size, True)]
+    
+    @staticmethod
+    def leaf_hash(entry_hash: str) -> bytes:
+        """Domain-separated leaf hash for an event's hex ``hash``."""
+        return hashlib.sha256(b'\x00' + bytes.fromhex(entry_hash)).digest()
+    
+    @staticmethod
+    def verify_inclusion(entry_hash: str, index: int, size: int,
+                         proof: List[str], root: str) -> bool:
+        """Check an inclusion proof in O(log n) hashes (RFC 9162 2.1.3.2)."""
+        if not 0 <= index < size:
+            return False
+        fn, sn = index, size - 1
+        r = MerkleTree.leaf_hash(entry_hash)
+        for p in map(bytes.fromhex, proof):
+            if sn == 0:
+                return False
+            if fn & 1 or fn == sn:
+                r = MerkleTree._node(p, r)
+                while not fn & 1 and fn:
+                    fn, sn = fn >> 1, sn >> 1
+            else:
+                r = MerkleTree._node(r, p)
+            fn, sn = fn >> 1, sn >> 1
+        return sn == 0 and r.hex() == root
+    
+    @staticmethod
+    def verify_consistency(old_size: int, new_size: int, old_root: str,
+                           new_root: str, proof: List[str]) -> bool:
+        """Check a consistency proof in O(log n) hashes (RFC 9162 2.1.4.2)."""
+        if old_size == new_size:
+            return not proof and old_root == new_root
+        if old_size == 0:
+            return not proof and old_size < new_size
+        if not 0 < old_size < new_size or not proof:
+            return False
+        path = [bytes.fromhex(p) for p in proof]
+        if old_size & (old_size - 1) == 0:
+            path.insert(0, bytes.fromhex(old_root))
+        fn, sn = old_size - 1, new_size - 1
+        while fn & 1:
+            fn, sn = fn >> 1, sn >> 1
+        fr = sr = path[0]
+        for c in path[1:]:
+            if sn == 0:
+                return False
+            if fn & 1 or fn == sn:
+                fr = MerkleTree._node(c, fr)
+                sr = MerkleTree._node(c, sr)
+                while not fn & 1 and fn:
+                    fn, sn = fn >> 1, sn >> 1
+            else:
+                sr = MerkleTree._node(sr, c)
+            fn, sn = fn >> 1, sn >> 1
+        return sn == 0 and fr.hex() == old_root and sr.hex() == new_root
+    
+    # Internal helpers
+    
+    @staticmethod
+    def _node(left: bytes, right: bytes) -> bytes:
+        return hashlib.sha256(b'\x01' + left + right).digest()
+    
+    @staticmethod
+    def _split(n: int) -> int:
+        """Largest power of two strictly less than ``n``."""
+        return 1 << ((n - 1).bit_length() - 1)
+    
+    def _subtree(self, start: int, end: int) -> bytes:
+        """Root of leaves [start, end); aligned power-of-two ranges are stored."""
+        size = end - start
+        if size & (size - 1) == 0:
+            level = size.bit_length() - 1
+            at = (start >> level) * self.DIGEST_SIZE
+            return bytes(self.levels[level][at:at + self.DIGEST_SIZE])
+        k = self._split(size)
+        return self._node(self._subtree(start, start + k), self._subtree(start + k, end))
+    
+    def _path(self, index: int, start: int, end: int) -> List[bytes]:
+        if end - start == 1:
+            return []
+        k = self._split(end - start)
+        if index < k:
+            return self._path(index, start, start + k) + [self._subtree(start + k, end)]
+        return self._path(index - k, start + k, end) + [self._subtree(start, start + k)]
+    
+    def _subproof(self, m: int, start: int, end: int, complete: bool) -> List[bytes]:
+        if m == end - start:
+            return [] if complete else [self._subtree(start, end)]
+        k = self._split(end - start)
+        if m <= k:
+            return self._subproof(m, start, start + k, complete) + [self._subtree(start + k, end)]
+        return self._subproof(m - k, start + k, end, False) + [self._subtree(start, start + k)]
 
 
 class EventLog:
-    """Immutable event log with SHA-256 chaining."""
+    """Immutable event log with SHA-256 chaining.
+
+    Verification is incremental: ``verified_count``/``verified_hash`` mark the
+    prefix already checked, so ``verify_chain()`` only rehashes events appended
+    since the last call. With a checkpoint key, every ``checkpoint_interval``
+    appends a signed checkpoint ``{index, chain_hash, signature}`` is recorded;
+    a full re-verify may start from genesis or from any of those checkpoints.
+    The key is ``checkpoint_key``, else ``$VUA_CHECKPOINT_KEY``, else the
+    contents of the file named by ``$VUA_CHECKPOINT_KEY_FILE``. Without one
+    no checkpoints are signed and none are trusted.
+    
+    ``storage`` defaults to an in-memory list; pass a ``SegmentedEventStore``
+    to keep events on disk. Reopening a store resumes the chain and trusts the
+    prefix up to its latest correctly signed checkpoint; without a key the
+    whole store is left unverified.
     
-    def __init__(self, name: str = "VUA-LOG"):
+    Type and time indexes let ``query()`` answer "type X since T" with a
+    bisect instead of a scan. A ``MerkleTree`` over the entry hashes is kept
+    beside ``chain_hash`` so a single event can be proven to an auditor
+    without shipping the log. Both live in memory and are built lazily:
+    appends keep them current once they exist, but opening a stored log does
+    not replay it, so a large store only pays for them on the first query or
+    proof.
+    
+    ``append()`` is thread-safe. For many producers, ``submit()`` enqueues
+    the event and returns a Future; a single committer thread serialises
+    each batch's data outside the lock, then assigns indices, chains hashes
+    and flushes the store once per batch, so producers never wait on each
+    other's hashing and the chain cannot fork. Once ``stop_committer()`` has
+    been called, ``submit()`` refuses new events until ``start_committer()``.
+    Readers (``query``, ``verify_chain``, ``to_dict``) take a consistent
+    snapshot under the lock.
+    """
+    
+    def __init__(self, name: str = "VUA-LOG", checkpoint_interval: int = 1000,
+                 checkpoint_key: Optional[str] = None, storage=None,
+                 bus: Optional[EventBus] = None):
         self.name = name
-        self.events = []
+        self.bus = bus
+        self.events = storage if storage is not None else []
         self.chain_hash = CryptoEngine.sha256(name)
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoint_key = load_checkpoint_key(checkpoint_key)
+        self.checkpoints = list(getattr(self.events, 'checkpoints', []))
+        self.verified_count = 0
+        self.verified_hash = self.chain_hash
+        self._epochs = array('d')
+        self._type_index = defaultdict(lambda: array('q'))
+        self._time_index = TimeIndex()
+        self._type_time_index = defaultdict(TimeIndex)
+        self.merkle = MerkleTree()
+        self.persistence = None
+        self._lock = threading.RLock()
+        self._queue = None
+        self._committer = None
+        self._committer_lock = threading.Lock()
+        self._committer_stopped = False
+        self._draining = None
+        
+        if len(self.events):
+            last = self.events[-1]
+            self.chain_hash = CryptoEngine.sha256(last['previous_hash'] + last['hash'])
+        for cp in reversed(self.checkpoints):
+            if cp['index'] <= len(self.events) and self.verify_checkpoint(cp):
+                self.verified_count, self.verified_hash = cp['index'], cp['chain_hash']
+                break
     
     def append(self, event_type: str, message: str, data: Optional[Dict] = None) -> str:
         """Add immutable event to log."""
+        with self._lock:
+            entry = self._append_locked(event_type, message, data)
+        self._publish(entry)
+        return entry['hash']
+    
+    def submit(self, event_type: str, message: str, data: Optional[Dict] = None) -> Future:
+        """Queue an event for the group committer; the Future yields its hash."""
+        future = Future()
+        with self._committer_lock:
+            if self._committer is None:
+                if self._committer_stopped:
+                    raise RuntimeError("committer is stopped; call start_committer() first")
+                self._start_committer_locked(512)
+            self._queue.put((event_type, message, data, future))
+        return future
+    
+    def start_committer(self, batch_size: int = 512) -> None:
+        """Start the committer thread that drains ``submit()`` in batches."""
+        with self._committer_lock:
+            if self._committer is None:
+                self._start_committer_locked(batch_size)
+    
+    def stop_committer(self) -> None:
+        """Commit everything already submitted, then stop the committer."""
+        with self._committer_lock:
+            committer = self._committer
+            if committer is None:
+                return
+            # Nothing can be queued behind the sentinel: submit() holds the
+            # same lock and sees the committer gone.
+            self._queue.put(None)
+            self._committer = self._queue = None
+            self._committer_stopped = True
+        committer.join()
+    
+    def get_events(self, event_type: Optional[str] = None) -> List[Dict]:
+        """Get events, optionally filtered by type."""
+        if event_type:
+            with self._lock:
+                self._sync_indexes()
+                return [self.events[i] for i in self._type_index.get(event_type, ())]
+        return self.events
+    
+    def query(self, event_type: Optional[str] = None,
+              since: Union[float, str, datetime, None] = None,
+              until: Union[float, str, datetime, None] = None,
+              limit: Optional[int] = None, cursor: Optional[int] = None) -> Iterator[Dict]:
+        """Lazily yield events in time order, filtered by type and time range.
+        
+        ``since``/``until`` are inclusive bounds given as epoch seconds, ISO
+        strings or datetimes. ``cursor`` is the ``index`` of the last event a
+        previous page returned; iteration resumes just after it.
+        """
+        with self._lock:
+            self._sync_indexes()
+            if event_type:
+                if event_type not in self._type_time_index:
+                    return iter(())
+                index = self._type_time_index[event_type]
+            else:
+                index = self._time_index
+            
+            lo, hi = index.span(self._to_epoch(since), self._to_epoch(until))
+            if cursor is not None:
+                lo = max(lo, index.after(self._epochs[cursor], cursor))
+            if limit is not None:
+                hi = min(hi, lo + limit)
+            # Out-of-order inserts shift slots, so copy the matching positions.
+            positions = index.positions[lo:hi]
+        events = self.events
+        return (events[position] for position in positions)
+    
+    def checkpoint(self) -> Dict:
+        """Record a signed checkpoint of the current chain position."""
+        if not self.checkpoint_key:
+            raise ValueError("signing a checkpoint needs a key: pass checkpoint_key "
+                             "or set VUA_CHECKPOINT_KEY / VUA_CHECKPOINT_KEY_FILE")
+        cp = {'index': len(self.events), 'chain_hash': self.chain_hash}
+        cp['signature'] = self._sign_checkpoint(cp)
+        if not self.checkpoints or self.checkpoints[-1]['index'] != cp['index']:
+            self.checkpoints.append(cp)
+            if hasattr(self.events, 'add_checkpoint'):
+                self.events.add_checkpoint(cp)
+        return cp
+    
+    def verify_checkpoint(self, checkpoint: Dict) -> bool:
+        """Verify a checkpoint signature (always False without a key)."""
+        if not self.checkpoint_key:
+            return False
+        body = {'index': checkpoint.get('index'), 'chain_hash': checkpoint.get('chain_hash')}
+        return hmac.compare_digest(self._sign_checkpoint(body), checkpoint.get('signature', ''))
+    
+    def verify_chain(self, full: bool = False, from_checkpoint: Optional[int] = None) -> bool:
+        """Verify log chain integrity.
+        
+        By default only events past the verified watermark are checked. With
+        ``full=True`` the chain is re-verified from genesis, or from the
+        checkpoint whose ``index`` equals ``from_checkpoint``.
+        """
+        with self._lock:
+            origin = self._verify_origin(full, from_checkpoint)
+            count, chain_hash = len(self.events), self.chain_hash
+        if origin is None:
+            return False
+        start, hash_calc = origin
+        
+        valid = True
+        verified = None
+        for index, event in zip(range(start, count), self._iter_events(start)):
+            stored_prev = event.get('previous_hash', '')
+            if stored_prev != hash_calc:
+                valid = False
+                break
+            
+            # Verify event hash
+            verify_entry = {k: v for k, v in event.items() if k != 'hash'}
+            verify_hash = CryptoEngine.hash_object(verify_entry)
+            if verify_hash != event['hash']:
+                valid = False
+                break
+            
+            hash_calc = CryptoEngine.sha256(hash_calc + event['hash'])
+            verified = (index + 1, hash_calc)
+        
+        if verified:
+            with self._lock:
+                self.verified_count, self.verified_hash = verified
+        return valid and hash_calc == chain_hash
+    
+    def verify_chain_parallel(self, workers: Optional[int] = None, chunk_size: int = 10000,
+                              full: bool = True, from_checkpoint: Optional[int] = None) -> Dict:
+        """Verify the chain with the per-event work spread over a process pool.
+        
+        Each worker rehashes a contiguous range of events and checks the links
+        inside it (``previous_hash`` of event i is ``SHA-256(previous_hash +
+        hash)`` of event i-1), returning the range's boundary hashes. The parent
+        only stitches ranges together in order. Workers read segment files
+        themselves for a ``SegmentedEventStore``, inherit in-memory events
+        when the platform forks, and otherwise receive the events pickled.
+        If workers cannot load this module (it was loaded under a name missing
+        from ``sys.modules``), the ranges are verified in-process instead.
+        Returns a report with the first failing index, event count and
+        throughput.
+        """
+        global _PARALLEL_EVENTS
+        started = time.perf_counter()
+        workers = workers or os.cpu_count() or 1
+        report = {'valid': False, 'first_failure': None, 'reason': None,
+                  'events': 0, 'elapsed': 0.0, 'events_per_sec': 0.0, 'workers': workers}
+        
+        with self._lock:
+            origin = self._verify_origin(full, from_checkpoint)
+            total, chain_hash = len(self.events), self.chain_hash
+        if origin is None:
+            report['reason'] = 'checkpoint not found or signature invalid'
+            return report
+        start, hash_calc = origin
+        
+        if isinstance(self.events, SegmentedEventStore):
+            self.events.flush()
+            source = str(self.events.directory)
+            context = None
+        elif 'fork' in multiprocessing.get_all_start_methods():
+            _PARALLEL_EVENTS = self.events
+            source = None
+            context = multiprocessing.get_context('fork')
+        else:
+            source = context = None
+        
+        def pooled(ranges):
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                pending = deque()
+                try:
+                    for lo, hi in ranges:
+                        payload = source
+                        if source is None and context is None:
+                            payload = [self.events[i] for i in range(lo, hi)]
+                        pending.append((lo, hi, pool.submit(_verify_event_range, lo, hi, payload)))
+                        if len(pending) >= workers * 2:
+                            lo, hi, future = pending.popleft()
+                            yield lo, hi, future.result()
+                    while pending:
+                        lo, hi, future = pending.popleft()
+                        yield lo, hi, future.result()
+                finally:
+                    for _, _, future in pending:
+                        future.cancel()
+        
+        def in_process(ranges):
+            for lo, hi in ranges:
+                yield lo, hi, _verify_event_range(lo, hi, self._iter_events(lo))
+        
+        failure = None
+        verified = None
+        position = start
+        
+        def stitch(results) -> None:
+            nonlocal failure, verified, position, hash_calc
+            try:
+                for lo, hi, (bad_index, reason, first_prev, last_hash) in results:
+                    if first_prev != hash_calc:
+                        failure = (lo, 'previous_hash mismatch')
+                    elif bad_index is not None:
+                        failure = (bad_index, reason)
+                    else:
+                        hash_calc = last_hash
+                        verified = (hi, hash_calc)
+                    report['events'] += (failure[0] if failure else hi) - lo
+                    position = hi
+                    if failure:
+                        return
+            finally:
+                results.close()
+        
+        def remaining():
+            return ((lo, min(lo + chunk_size, total)) for lo in range(position, total, chunk_size))
+        
+        try:
+            try:
+                # Workers find _verify_event_range by module name; a module
+                # loaded under a name missing from sys.modules cannot be sent.
+                pickle.dumps(_verify_event_range)
+            except (pickle.PicklingError, AttributeError):
+                stitch(in_process(remaining()))
+            else:
+                try:
+                    stitch(pooled(remaining()))
+                except (pickle.PicklingError, BrokenProcessPool):
+                    # Workers could not load this module; finish in-process.
+                    stitch(in_process(remaining()))
+        finally:
+            _PARALLEL_EVENTS = None
+        
+        if verified:
+            with self._lock:
+                self.verified_count, self.verified_hash = verified
+        if failure:
+            report['first_failure'], report['reason'] = failure
+        elif hash_calc != chain_hash:
+            report['reason'] = 'chain_hash mismatch'
+        else:
+            report['valid'] = True
+        
+        report['elapsed'] = time.perf_counter() - started
+        if report['elapsed']:
+            report['events_per_sec'] = report['events'] / report['elapsed']
+        return report
+    
+    def merkle_root(self, size: Optional[int] = None) -> str:
+        """Merkle root over the first ``size`` events (default: all)."""
+        self._sync_merkle()
+        return self.merkle.root(size)
+    
+    def inclusion_proof(self, index: int, size: Optional[int] = None) -> Dict:
+        """Proof that event ``index`` is in the log of ``size`` events."""
+        self._sync_merkle()
+        size = len(self.events) if size is None else size
+        return {
+            'index': index,
+            'tree_size': size,
+            'entry_hash': self.events[index]['hash'],
+            'root': self.merkle.root(size),
+            'proof': self.merkle.inclusion_proof(index, size),
+        }
+    
+    def consistency_proof(self, old_size: int, new_size: Optional[int] = None) -> Dict:
+        """Proof that the first ``old_size`` events are a prefix of ``new_size``."""
+        self._sync_merkle()
+        new_size = len(self.events) if new_size is None else new_size
+        return {
+            'old_size': old_size,
+            'new_size': new_size,
+            'old_root': self.merkle.root(old_size),
+            'new_root': self.merkle.root(new_size),
+            'proof': self.merkle.consistency_proof(old_size, new_size),
+        }
+    
+    def to_dict(self) -> Dict:
+        """Export as dictionary (a snapshot; appends wait until it is taken)."""
+        with self._lock:
+            return {
+                'name': self.name,
+                'count': len(self.events),
+                'chain_hash': self.chain_hash,
+                'merkle_root': self.merkle_root(),
+                'verified': self.verify_chain(),
+                'checkpoints': list(self.checkpoints),
+                'events': list(self.events),
+                'credit': CREDIT,
+            }
+    
+    def _append_locked(self, event_type: str, message: str, data: Optional[Dict],
+                       frozen: Optional[FrozenJSON] = None) -> Dict:
+        """Build, hash and commit an entry; ``frozen`` is ``data`` pre-serialised.
+        
+        The caller publishes the returned entry once it has released the lock.
+        """
         entry = {
             'index': len(self.events),
             'timestamp': datetime.now(timezone.utc).isoformat(),
@@ -134,93 +1511,940 @@ class EventLog:
         }
         
         # Calculate hash for this entry
-        entry_hash = CryptoEngine.hash_object(entry)
+        if frozen is None:
+            entry_hash = CryptoEngine.hash_object(entry)
+        else:
+            # "data" sorts first among the entry keys, so the canonical form
+            # is the frozen bytes followed by the rest of the header.
+            header = CANONICAL.encode({k: v for k, v in entry.items() if k != 'data'})
+            entry_hash = hashlib.sha256(b'{"data":' + frozen.canonical + b',' + header[1:]).hexdigest()
         entry['hash'] = entry_hash
         
-        # Update chain hash
-        self.chain_hash = CryptoEngine.sha256(self.chain_hash + entry_hash)
+        self._commit_entry(entry)
+        if self.persistence:
+            self.persistence.record(self, 'append', {'entry': entry})
+        return entry
+    
+    def _publish(self, entry: Dict) -> None:
+        """Announce a committed entry; never called with the log lock held."""
+        if self.bus:
+            self.bus.publish('log.append', {'name': self.name, 'entry': entry}, key=self.name)
+    
+    def _start_committer_locked(self, batch_size: int) -> None:
+        # A committer stopped earlier may still be draining; the new one
+        # waits for it so events keep their submission order.
+        previous = self._draining
+        self._queue = queue.Queue()
+        self._committer_stopped = False
+        self._committer = self._draining = threading.Thread(
+            target=self._commit_loop, args=(self._queue, batch_size, previous),
+            name=f'{self.name}-committer', daemon=True)
+        self._committer.start()
+    
+    def _commit_loop(self, events: queue.Queue, batch_size: int,
+                     previous: Optional[threading.Thread] = None) -> None:
+        """Committer thread: chain queued events and flush once per batch."""
+        if previous is not None:
+            previous.join()
+        stopping = False
+        while not stopping:
+            batch = [events.get()]
+            while len(batch) < batch_size:
+                try:
+                    batch.append(events.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                stopping = True
+                batch = [item for item in batch if item is not None]
+            
+            # Serialise each event's data before taking the lock; only the
+            # entry header, chain link and append happen under it.
+            results = []
+            prepared = []
+            for event_type, message, data, future in batch:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    prepared.append((event_type, message, data, CANONICAL.freeze(data or {}), future))
+                except Exception as e:
+                    results.append((future, None, e))
+            
+            with self._lock:
+                autoflush = getattr(self.events, 'autoflush', None)
+                if autoflush:
+                    self.events.autoflush = False
+                try:
+                    for event_type, message, data, frozen, future in prepared:
+                        try:
+                            entry = self._append_locked(event_type, message, data, frozen)
+                            results.append((future, entry, None))
+                        except Exception as e:
+                            results.append((future, None, e))
+                    if hasattr(self.events, 'flush'):
+                        self.events.flush()
+                finally:
+                    if autoflush:
+                        self.events.autoflush = True
+            
+            # Publish with the lock released, so a slow or blocking
+            # subscriber holds up only this thread, never appenders.
+            for future, entry, error in results:
+                if error is None:
+                    future.set_result(entry['hash'])
+                else:
+                    future.set_exception(error)
+            for _, entry, error in results:
+                if error is None:
+                    self._publish(entry)
+    
+    def _commit_entry(self, entry: Dict) -> None:
+        """Chain, store and index a fully built entry."""
+        self.chain_hash = CryptoEngine.sha256(self.chain_hash + entry['hash'])
         
         self.events.append(entry)
-        return entry_hash
+        # Extend the lazy structures only while they are current.
+        if len(self._epochs) == entry['index']:
+            self._index_event(entry)
+        if len(self.merkle) == entry['index']:
+            self.merkle.append(entry['hash'])
+        
+        if (self.checkpoint_key and self.checkpoint_interval
+                and len(self.events) % self.checkpoint_interval == 0):
+            self.checkpoint()
     
-    def get_events(self, event_type: Optional[str] = None) -> List[Dict]:
-        """Get events, optionally filtered by type."""
-        if event_type:
-            return [e for e in self.events if e['type'] == event_type]
-        return self.events
+    def _verify_origin(self, full: bool, from_checkpoint: Optional[int]) -> Optional[Tuple[int, str]]:
+        """Resolve where verification starts: watermark, checkpoint or genesis."""
+        if not full and from_checkpoint is None:
+            return self.verified_count, self.verified_hash
+        if from_checkpoint:
+            cp = next((c for c in self.checkpoints if c['index'] == from_checkpoint), None)
+            if cp is None or not self.verify_checkpoint(cp):
+                return None
+            return cp['index'], cp['chain_hash']
+        return 0, CryptoEngine.sha256(self.name)
+    
+    def _sync_indexes(self) -> None:
+        """Index events the type and time indexes do not cover yet."""
+        with self._lock:
+            for event in self._iter_events(len(self._epochs)):
+                self._index_event(event)
+    
+    def _sync_merkle(self) -> None:
+        """Add leaves for events the Merkle tree does not cover yet."""
+        with self._lock:
+            for event in self._iter_events(len(self.merkle)):
+                self.merkle.append(event['hash'])
+    
+    def _index_event(self, event: Dict) -> None:
+        """Add one event to the type and time indexes."""
+        epoch = self._to_epoch(event['timestamp'])
+        self._epochs.append(epoch)
+        self._type_index[event['type']].append(event['index'])
+        self._time_index.add(epoch, event['index'])
+        self._type_time_index[event['type']].add(epoch, event['index'])
+    
+    @staticmethod
+    def _to_epoch(value: Union[float, str, datetime, None]) -> Optional[float]:
+        """Normalise a timestamp bound to epoch seconds."""
+        if value is None or isinstance(value, (int, float)):
+            return value
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    
+    def _iter_events(self, start: int = 0) -> Iterator[Dict]:
+        """Iterate events from ``start`` without copying the backing store."""
+        if hasattr(self.events, 'iter_from'):
+            return self.events.iter_from(start)
+        return (self.events[i] for i in range(start, len(self.events)))
+    
+    def _sign_checkpoint(self, checkpoint: Dict) -> str:
+        """HMAC-SHA256 over the canonical checkpoint body."""
+        return hmac.new(self.checkpoint_key, CANONICAL.encode(checkpoint),
+                        hashlib.sha256).hexdigest()
+
+
+def load_checkpoint_key(key: Union[str, bytes, None] = None) -> Optional[bytes]:
+    """Checkpoint HMAC key: ``key``, ``$VUA_CHECKPOINT_KEY`` or ``$VUA_CHECKPOINT_KEY_FILE``."""
+    if key is None:
+        key = os.environ.get('VUA_CHECKPOINT_KEY')
+    if key is None and os.environ.get('VUA_CHECKPOINT_KEY_FILE'):
+        with open(os.environ['VUA_CHECKPOINT_KEY_FILE'], 'rb') as f:
+            key = f.read().strip()
+    if isinstance(key, str):
+        key = key.encode()
+    return key or None
+
+
+# Events inherited by forked verify_chain_parallel workers.
+_PARALLEL_EVENTS = None
+_WORKER_STORES = {}
+
+
+def _verify_event_range(lo: int, hi: int, source) -> Tuple[Optional[int], Optional[str], str, str]:
+    """Worker: rehash events [lo, hi) and check the links between them.
+    
+    ``source`` is a store directory, a list of the events themselves, or
+    None for events inherited through fork. Returns ``(bad_index, reason,
+    first_previous_hash, chain_hash_after_range)``.
+    """
+    if isinstance(source, str):
+        store = _WORKER_STORES.get(source)
+        if store is None:
+            store = _WORKER_STORES[source] = SegmentedEventStore(source, readonly=True)
+        if len(store) < hi:
+            store.refresh()
+        events = store.iter_from(lo)
+    elif source is None:
+        events = (_PARALLEL_EVENTS[i] for i in range(lo, hi))
+    else:
+        events = iter(source)
     
-    def verify_chain(self) -> bool:
-        """Verify log chain integrity."""
-        hash_calc = CryptoEngine.sha256(self.name)
+    first_prev = hash_calc = None
+    for index, event in zip(range(lo, hi), events):
+        stored_prev = event.get('previous_hash', '')
+        if first_prev is None:
+            first_prev = hash_calc = stored_prev
+        elif stored_prev != hash_calc:
+            return index, 'previous_hash mismatch', first_prev, hash_calc
         
-        for event in self.events:
-            stored_prev = event.get('previous_hash', '')
-            if stored_prev != hash_calc:
-                return False
-            
-            # Verify event hash
-            verify_entry = {k: v for k, v in event.items() if k != 'hash'}
-            verify_hash = CryptoEngine.hash_object(verify_entry)
-            if verify_hash != event['hash']:
-                return False
+        verify_entry = {k: v for k, v in event.items() if k != 'hash'}
+        if CryptoEngine.hash_object(verify_entry) != event.get('hash'):
+            return index, 'event hash mismatch', first_prev, hash_calc
+        hash_calc = CryptoEngine.sha256(hash_calc + event['hash'])
+    return None, None, first_prev, hash_calc
+
+
+class PersistenceManager:
+    """Snapshot + delta journal persistence for StateVector and EventLog.
+    
+    A bound object is stored as ``<kind>-<name>.snapshot.json`` (a full
+    snapshot tagged with the last journal ``seq`` it covers) plus an
+    append-only ``<kind>-<name>.journal.ndjson`` of ``update()``/
+    ``phi_rotate()`` calls or appended log entries. Recovery loads the
+    snapshot and replays newer deltas, checking each recorded hash. After
+    ``snapshot_every`` deltas the journal is compacted into a new snapshot,
+    in a background thread unless ``background=False``. ``fsync`` is one of
+    ``'always'``, ``'interval'`` (at most every ``fsync_interval`` seconds)
+    or ``'never'``. Snapshots are written to a temp file and renamed.
+    
+    Compaction moves the journal aside to ``.journal.compacting`` (appending
+    to one left by an unfinished compaction) and rebuilds the snapshot by
+    replaying those deltas onto the previous snapshot, never from the live
+    object, so a snapshot holds exactly the deltas up to its ``seq``.
+    """
+    
+    FSYNC_POLICIES = ('always', 'interval', 'never')
+    
+    def __init__(self, directory: str, fsync: str = 'interval', fsync_interval: float = 1.0,
+                 snapshot_every: int = 10000, background: bool = True):
+        if fsync not in self.FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {self.FSYNC_POLICIES}")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.snapshot_every = snapshot_every
+        self.background = background
+        self.bindings = {}
+    
+    def load_state(self, name: str = "VUA-STATE", bind: bool = True) -> StateVector:
+        """Recover a StateVector from snapshot + journal (new if none exists)."""
+        snapshot, deltas = self._read('state', name)
+        state, seq = self._replay_state(name, snapshot, deltas)
+        if bind:
+            self._bind('state', state, seq, snapshot is None)
+        return state
+    
+    def _replay_state(self, name: str, snapshot: Optional[Dict],
+                      deltas: List[Dict]) -> Tuple[StateVector, int]:
+        """Rebuild a StateVector from a snapshot and the deltas after it."""
+        state = StateVector(name)
+        if snapshot:
+            body = snapshot['state']
+            state.timestamp = body['timestamp']
+            state.cycle = body['cycle']
+            state.phi_phase = body['phi_phase']
+            state.stability = body['stability']
+            state.data = body['data']
+            state.hash = body['hash']
+        
+        seq = snapshot['seq'] if snapshot else 0
+        for delta in deltas:
+            if delta['op'] == 'update':
+                state.update(delta['data'], timestamp=delta['timestamp'])
+            elif delta['op'] == 'rotate':
+                state.phi_rotate(delta['degrees'])
+            if state.hash != delta['hash']:
+                raise ValueError(f"state journal replay diverged at seq {delta['seq']}")
+            seq = delta['seq']
+        return state, seq
+    
+    def load_log(self, name: str = "VUA-LOG", bind: bool = True, **kwargs) -> EventLog:
+        """Recover an in-memory EventLog from snapshot + journal."""
+        log = EventLog(name, **kwargs)
+        snapshot, deltas = self._read('log', name)
+        for entry in (snapshot['events'] if snapshot else []):
+            log._commit_entry(entry)
+        
+        seq = snapshot['seq'] if snapshot else 0
+        for delta in deltas:
+            entry = delta['entry']
+            if entry['previous_hash'] != log.chain_hash:
+                raise ValueError(f"log journal replay diverged at seq {delta['seq']}")
+            log._commit_entry(entry)
+            seq = delta['seq']
+        
+        if bind:
+            self._bind('log', log, seq, snapshot is None)
+        return log
+    
+    def record(self, obj, op: str, delta: Dict) -> None:
+        """Journal one delta for a bound object (called by the object)."""
+        binding = self.bindings[id(obj)]
+        with binding['lock']:
+            binding['seq'] += 1
+            line = json.dumps(dict(delta, seq=binding['seq'], op=op), separators=(',', ':'))
+            binding['journal'].write(line + '\n')
+            binding['journal'].flush()
+            self._maybe_fsync(binding)
+            binding['pending'] += 1
+            due = binding['pending'] >= self.snapshot_every and not binding['compacting']
+            if due:
+                binding['compacting'] = True
+        
+        if due:
+            if self.background:
+                threading.Thread(target=self.compact, args=(obj,), daemon=True).start()
+            else:
+                self.compact(obj)
+    
+    def compact(self, obj) -> None:
+        """Write a fresh snapshot and retire the journal it covers."""
+        binding = self.bindings[id(obj)]
+        with binding['compact_lock']:
+            with binding['lock']:
+                binding['compacting'] = True
+                seq = binding['seq']
+                binding['journal'].close()
+                self._retire(binding['paths'])
+                binding['journal'] = open(binding['paths']['journal'], 'a')
+                binding['pending'] = 0
             
-            hash_calc = CryptoEngine.sha256(hash_calc + event['hash'])
+            try:
+                snapshot, deltas = self._read(binding['kind'], obj.name, journal=False)
+                body = self._snapshot_body(binding['kind'], obj.name, snapshot, deltas)
+                self._write_snapshot(binding, body, seq)
+                binding['paths']['retired'].unlink()
+            finally:
+                binding['compacting'] = False
+    
+    def close(self) -> None:
+        """Flush, fsync and close every journal."""
+        for binding in self.bindings.values():
+            with binding['compact_lock'], binding['lock']:
+                binding['journal'].flush()
+                if self.fsync != 'never':
+                    os.fsync(binding['journal'].fileno())
+                binding['journal'].close()
+                binding['obj'].persistence = None
+        self.bindings = {}
+    
+    # Internal helpers
+    
+    def _paths(self, kind: str, name: str) -> Dict[str, Path]:
+        safe = ''.join(c if c.isalnum() or c in '-_.' else '_' for c in name)
+        base = self.directory / f'{kind}-{safe}'
+        return {
+            'snapshot': base.with_name(base.name + '.snapshot.json'),
+            'journal': base.with_name(base.name + '.journal.ndjson'),
+            'retired': base.with_name(base.name + '.journal.compacting'),
+        }
+    
+    def _read(self, kind: str, name: str, journal: bool = True) -> Tuple[Optional[Dict], List[Dict]]:
+        """Load the snapshot and every newer delta, ignoring a torn tail.
+        
+        With ``journal=False`` only the retired journal is read.
+        """
+        paths = self._paths(kind, name)
+        snapshot = None
+        if paths['snapshot'].exists():
+            with open(paths['snapshot'], 'r') as f:
+                snapshot = json.load(f)
+        seq = snapshot['seq'] if snapshot else 0
         
-        return hash_calc == self.chain_hash
+        deltas = []
+        for path in (paths['retired'], paths['journal']) if journal else (paths['retired'],):
+            if not path.exists():
+                continue
+            with open(path, 'r') as f:
+                for line in f:
+                    try:
+                        delta = json.loads(line)
+                    except ValueError:
+                        break
+                    if delta['seq'] > seq:
+                        deltas.append(delta)
+                        seq = delta['seq']
+        return snapshot, deltas
+    
+    def _bind(self, kind: str, obj, seq: int, needs_snapshot: bool) -> None:
+        paths = self._paths(kind, obj.name)
+        binding = {
+            'kind': kind, 'obj': obj, 'paths': paths, 'seq': seq, 'pending': 0,
+            'lock': threading.Lock(), 'compact_lock': threading.Lock(),
+            'compacting': False, 'last_fsync': time.monotonic(),
+        }
+        # New deltas must not land after a torn record, where _read() stops.
+        self._truncate_torn(paths['retired'])
+        self._truncate_torn(paths['journal'])
+        binding['journal'] = open(paths['journal'], 'a')
+        self.bindings[id(obj)] = binding
+        obj.persistence = self
+        if needs_snapshot:
+            # Nothing is journaled yet, so the fresh object is the first snapshot.
+            self._write_snapshot(binding, self._object_body(kind, obj), seq)
+        if paths['retired'].exists():
+            self.compact(obj)
+    
+    def _retire(self, paths: Dict[str, Path]) -> None:
+        """Move the journal aside for compaction, keeping any unfinished retired one."""
+        if not paths['retired'].exists():
+            os.replace(paths['journal'], paths['retired'])
+            return
+        # A compaction that never finished: its deltas are not in any snapshot yet.
+        with open(paths['journal'], 'rb') as src, open(paths['retired'], 'ab') as dst:
+            shutil.copyfileobj(src, dst)
+            dst.flush()
+            if self.fsync != 'never':
+                os.fsync(dst.fileno())
+        paths['journal'].unlink()
+    
+    @staticmethod
+    def _truncate_torn(path: Path) -> None:
+        """Cut a journal back to the end of its last complete record."""
+        if not path.exists():
+            return
+        with open(path, 'r+b') as f:
+            good = 0
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    json.loads(line)
+                except ValueError:
+                    break
+                good += len(line)
+            f.truncate(good)
+    
+    def _snapshot_body(self, kind: str, name: str, snapshot: Optional[Dict],
+                       deltas: List[Dict]) -> Dict:
+        """Replay retired deltas onto the previous snapshot."""
+        if kind == 'state':
+            return self._object_body(kind, self._replay_state(name, snapshot, deltas)[0])
+        events = snapshot['events'] if snapshot else []
+        return {'name': name, 'events': events + [delta['entry'] for delta in deltas]}
+    
+    @staticmethod
+    def _object_body(kind: str, obj) -> Dict:
+        """Snapshot body of an object nothing else is changing."""
+        if kind == 'state':
+            return {'state': {
+                'name': obj.name,
+                'timestamp': obj.timestamp,
+                'cycle': obj.cycle,
+                'phi_phase': obj.phi_phase,
+                'stability': obj.stability,
+                'data': dict(obj.data),
+                'hash': obj.hash,
+            }}
+        return {'name': obj.name, 'events': list(obj.events)}
+    
+    def _write_snapshot(self, binding: Dict, body: Dict, seq: int) -> None:
+        path = binding['paths']['snapshot']
+        tmp = path.with_name(path.name + '.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(dict(body, seq=seq, kind=binding['kind']), f, separators=(',', ':'))
+            f.flush()
+            if self.fsync != 'never':
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    
+    def _maybe_fsync(self, binding: Dict) -> None:
+        if self.fsync == 'always' or (
+                self.fsync == 'interval'
+                and time.monotonic() - binding['last_fsync'] >= self.fsync_interval):
+            os.fsync(binding['journal'].fileno())
+            binding['last_fsync'] = time.monotonic()
+
+
+class MetricRing:
+    """Fixed-size ring of samples for one metric with O(1) running stats.
+    
+    Values and epoch timestamps live in preallocated ``array('d')`` buffers.
+    A running sum gives avg in O(1) (re-summed exactly each time the ring
+    wraps, to stop float drift), and monotonic deques of ``(seq, value)``
+    give the window min and max in amortised O(1).
+    """
+    
+    def __init__(self, size: int):
+        self.size = size
+        self.values = array('d', bytes(8 * size))
+        self.times = array('d', bytes(8 * size))
+        self.tag_ids = array('l', bytes(array('l').itemsize * size))
+        self.head = 0
+        self.count = 0
+        self.total = 0.0
+        self.seq = 0
+        self.min_queue = deque()
+        self.max_queue = deque()
+    
+    def add(self, value: float, epoch: float, tag_id: int = 0) -> None:
+        """Write one sample, evicting the oldest once the ring is full."""
+        head = self.head
+        if self.count == self.size:
+            self.total -= self.values[head]
+        else:
+            self.count += 1
+        self.values[head] = value
+        self.times[head] = epoch
+        self.tag_ids[head] = tag_id
+        self.total += value
+        self.head = head = (head + 1) % self.size
+        if head == 0:
+            self.total = math.fsum(self.values[:self.count])
+        
+        seq, self.seq = self.seq, self.seq + 1
+        oldest = self.seq - self.size
+        min_queue, max_queue = self.min_queue, self.max_queue
+        while min_queue and min_queue[-1][1] >= value:
+            min_queue.pop()
+        min_queue.append((seq, value))
+        while min_queue[0][0] < oldest:
+            min_queue.popleft()
+        while max_queue and max_queue[-1][1] <= value:
+            max_queue.pop()
+        max_queue.append((seq, value))
+        while max_queue[0][0] < oldest:
+            max_queue.popleft()
+    
+    def latest(self) -> float:
+        return self.values[(self.head - 1) % self.size]
+    
+    def samples(self) -> Iterator[Tuple[float, float, int]]:
+        """Yield ``(epoch, value, tag_id)`` from oldest to newest."""
+        start = (self.head - self.count) % self.size
+        for i in range(self.count):
+            slot = (start + i) % self.size
+            yield self.times[slot], self.values[slot], self.tag_ids[slot]
+
+
+class QuantileSketch:
+    """Mergeable DDSketch-style quantile sketch with bounded memory.
+    
+    Values fall into logarithmic bins ``ceil(log_gamma(|v|))`` with
+    ``gamma = (1 + a) / (1 - a)``, so any quantile is returned within
+    relative accuracy ``a``. When a store exceeds ``max_bins`` its lowest
+    bins are collapsed together. Sketches with the same accuracy merge by
+    adding bin counts.
+    """
+    
+    MIN_INDEXABLE = 1e-9
+    
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048):
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.positive = {}
+        self.negative = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+    
+    def add(self, value: float, weight: int = 1) -> None:
+        """Add a value (``weight`` times)."""
+        if value > self.MIN_INDEXABLE:
+            store = self.positive
+            key = math.ceil(math.log(value) / self._log_gamma)
+        elif value < -self.MIN_INDEXABLE:
+            store = self.negative
+            key = math.ceil(math.log(-value) / self._log_gamma)
+        else:
+            store = None
+            self.zero_count += weight
+        if store is not None:
+            store[key] = store.get(key, 0) + weight
+            if len(store) > self.max_bins:
+                self._collapse(store)
+        self.count += weight
+        self.sum += value * weight
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+    
+    def add_many(self, values: List[float]) -> None:
+        """Add a batch of values; bin keys are computed with C-level maps."""
+        if not values:
+            return
+        floor = self.MIN_INDEXABLE
+        positive = [v for v in values if v > floor]
+        negative = [-v for v in values if v < -floor]
+        for store, batch in ((self.positive, positive), (self.negative, negative)):
+            if batch:
+                keys = map(math.ceil, map(float.__truediv__, map(math.log, batch),
+                                          repeat(self._log_gamma)))
+                for key, count in Counter(keys).items():
+                    store[key] = store.get(key, 0) + count
+                if len(store) > self.max_bins:
+                    self._collapse(store)
+        self.zero_count += len(values) - len(positive) - len(negative)
+        self.count += len(values)
+        self.sum += sum(values)
+        self.min = min(self.min, min(values))
+        self.max = max(self.max, max(values))
+    
+    def merge(self, other: 'QuantileSketch') -> None:
+        """Fold another sketch with the same accuracy into this one."""
+        if other.gamma != self.gamma:
+            raise ValueError("cannot merge sketches with different relative accuracy")
+        for mine, theirs in ((self.positive, other.positive), (self.negative, other.negative)):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+            if len(mine) > self.max_bins:
+                self._collapse(mine)
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+    
+    def copy(self) -> 'QuantileSketch':
+        clone = QuantileSketch(self.relative_accuracy, self.max_bins)
+        clone.merge(self)
+        return clone
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the ``q`` quantile (0 <= q <= 1)."""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return max(-self._value(key), self.min)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return min(self._value(key), self.max)
+        return self.max
     
     def to_dict(self) -> Dict:
-        """Export as dictionary."""
         return {
-            'name': self.name,
-            'count': len(self.events),
-            'chain_hash': self.chain_hash,
-            'verified': self.verify_chain(),
-            'events': self.events,
-            'credit': CREDIT,
+            'relative_accuracy': self.relative_accuracy,
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None,
+            'zero_count': self.zero_count,
+            'positive': {str(k): v for k, v in self.positive.items()},
+            'negative': {str(k): v for k, v in self.negative.items()},
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict, max_bins: int = 2048) -> 'QuantileSketch':
+        sketch = cls(data['relative_accuracy'], max_bins)
+        sketch.positive = {int(k): v for k, v in data['positive'].items()}
+        sketch.negative = {int(k): v for k, v in data['negative'].items()}
+        sketch.zero_count = data['zero_count']
+        sketch.count = data['count']
+        sketch.sum = data['sum']
+        if data['count']:
+            sketch.min, sketch.max = data['min'], data['max']
+        return sketch
+    
+    def _value(self, key: int) -> float:
+        """Representative value of a bin (relative error <= accuracy)."""
+        return 2 * self.gamma ** key / (self.gamma + 1)
+    
+    def _collapse(self, store: Dict[int, int]) -> None:
+        """Merge the lowest bins so the store holds at most ``max_bins``."""
+        keys = sorted(store)
+        excess = len(keys) - self.max_bins
+        folded = sum(store.pop(key) for key in keys[:excess])
+        store[keys[excess]] += folded
+
+
+class MetricRollups:
+    """Downsampled 1s / 1m / 1h buckets plus a lifetime sketch for a metric.
+    
+    ``add()`` only buffers the sample; every ``BATCH`` samples (or before any
+    read) the buffer is folded into the open 1s bucket a second at a time,
+    with the sketch bin keys computed in one batch. When the open bucket
+    closes it is filed into the 1s level and merged into the 1m and 1h
+    buckets with the same start and the lifetime sketch. Each level keeps a
+    bounded number of buckets, ordered by start.
+    """
+    
+    RESOLUTIONS = (('1s', 1, 300), ('1m', 60, 1440), ('1h', 3600, 720))
+    BATCH = 4096
+    
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self.levels = {name: deque(maxlen=keep) for name, _, keep in self.RESOLUTIONS}
+        self.lifetime = QuantileSketch(relative_accuracy)
+        self.current = None
+        self._values = []
+        self._epochs = []
+    
+    def add(self, value: float, epoch: float) -> None:
+        self._values.append(value)
+        self._epochs.append(epoch)
+        if len(self._values) >= self.BATCH:
+            self._fold()
+    
+    def sketch(self) -> QuantileSketch:
+        """Lifetime sketch including the open bucket."""
+        self._fold()
+        sketch = self.lifetime.copy()
+        if self.current:
+            sketch.merge(self.current['sketch'])
+        return sketch
+    
+    def buckets(self, resolution: str) -> List[Dict]:
+        """Buckets for one resolution, oldest first, with the open second folded in."""
+        self._fold()
+        seconds = dict((name, secs) for name, secs, _ in self.RESOLUTIONS)[resolution]
+        buckets = [dict(b, sketch=b['sketch'].copy()) for b in self.levels[resolution]]
+        if self.current:
+            start = self.current['start'] - self.current['start'] % seconds
+            self._bucket_merge(self._find(buckets, start), self.current)
+        return buckets
+    
+    def merge(self, other: 'MetricRollups') -> None:
+        """Fold another metric's rollups in, combining buckets by start time.
+        
+        The open second stays open; the other side's open second joins it,
+        or is filed like a closed one if it is older.
+        """
+        self._fold()
+        other._fold()
+        for name, _, _ in self.RESOLUTIONS:
+            for bucket in other.levels[name]:
+                self._bucket_merge(self._level_bucket(name, bucket['start']), bucket)
+        self.lifetime.merge(other.lifetime)
+        
+        theirs = other.current
+        if theirs is None:
+            return
+        if self.current is None or theirs['start'] > self.current['start']:
+            self._close()
+            self.current = self._bucket(theirs['start'])
+        if theirs['start'] == self.current['start']:
+            self._bucket_merge(self.current, theirs)
+        else:
+            closed = self._bucket(theirs['start'])
+            self._bucket_merge(closed, theirs)
+            self._file(closed)
+    
+    def _fold(self) -> None:
+        """Fold buffered samples into buckets, one second's run at a time."""
+        values, epochs = self._values, self._epochs
+        if not values:
+            return
+        self._values, self._epochs = [], []
+        # A sample from an earlier second than the open bucket joins it.
+        seconds = map(int, epochs)
+        if self.current:
+            seconds = accumulate(seconds, max, initial=self.current['start'])
+            next(seconds)
+        else:
+            seconds = accumulate(seconds, max)
+        seconds = list(seconds)
+        i, n = 0, len(values)
+        while i < n:
+            start = seconds[i]
+            j = bisect_left(seconds, start + 1, i)
+            if self.current is None or start > self.current['start']:
+                self._close()
+                self.current = self._bucket(start)
+            self._bucket_merge_values(self.current, values[i:j])
+            i = j
+    
+    def _close(self) -> None:
+        closed, self.current = self.current, None
+        if closed is not None:
+            self._file(closed)
+    
+    def _file(self, closed: Dict) -> None:
+        """Merge a closed 1s bucket into every level and the lifetime sketch."""
+        self._bucket_merge(self._level_bucket('1s', closed['start']), closed)
+        for name, seconds, _ in self.RESOLUTIONS[1:]:
+            start = closed['start'] - closed['start'] % seconds
+            self._bucket_merge(self._level_bucket(name, start), closed)
+        self.lifetime.merge(closed['sketch'])
+    
+    def _level_bucket(self, name: str, start: int) -> Dict:
+        """The bucket starting at ``start`` in a level, created in order if missing."""
+        level = self.levels[name]
+        if level and level[-1]['start'] == start:
+            return level[-1]
+        if not level or level[-1]['start'] < start:
+            level.append(self._bucket(start))
+            return level[-1]
+        buckets = list(level)
+        bucket = self._find(buckets, start)
+        self.levels[name] = deque(buckets, maxlen=level.maxlen)
+        return bucket
+    
+    def _find(self, buckets: List[Dict], start: int) -> Dict:
+        """The bucket starting at ``start`` in a sorted list, inserted if missing."""
+        at = bisect_left([b['start'] for b in buckets], start)
+        if at == len(buckets) or buckets[at]['start'] != start:
+            buckets.insert(at, self._bucket(start))
+        return buckets[at]
+    
+    def _bucket(self, start: int) -> Dict:
+        return {'start': start, 'count': 0, 'sum': 0.0, 'min': math.inf,
+                'max': -math.inf, 'sketch': QuantileSketch(self.relative_accuracy)}
+    
+    @staticmethod
+    def _bucket_merge_values(bucket: Dict, values: List[float]) -> None:
+        bucket['count'] += len(values)
+        bucket['sum'] += sum(values)
+        bucket['min'] = min(bucket['min'], min(values))
+        bucket['max'] = max(bucket['max'], max(values))
+        bucket['sketch'].add_many(values)
+    
+    @staticmethod
+    def _bucket_merge(bucket: Dict, other: Dict) -> None:
+        bucket['count'] += other['count']
+        bucket['sum'] += other['sum']
+        bucket['min'] = min(bucket['min'], other['min'])
+        bucket['max'] = max(bucket['max'], other['max'])
+        bucket['sketch'].merge(other['sketch'])
 
 
 class MetricsCollector:
-    """Collect and aggregate system metrics."""
+    """Collect and aggregate system metrics.
+    
+    Each metric keeps its last ``window_size`` samples in a ``MetricRing``;
+    tag dicts are interned once and referenced by id. Every sample also
+    feeds the metric's ``MetricRollups`` (1s/1m/1h buckets and a lifetime
+    quantile sketch), so long-horizon percentiles need no raw samples.
+    """
     
-    def __init__(self, window_size: int = 100):
+    QUANTILES = (0.5, 0.95, 0.99)
+    
+    def __init__(self, window_size: int = 100, relative_accuracy: float = 0.01,
+                 bus: Optional[EventBus] = None):
         self.window_size = window_size
-        self.metrics = defaultdict(list)
+        self.bus = bus
+        self.relative_accuracy = relative_accuracy
+        self.metrics = {}
+        self.rollups = {}
         self.timestamp = datetime.now(timezone.utc).isoformat()
+        self._tags = [{}]
+        self._tag_ids = {(): 0}
     
     def record(self, metric_name: str, value: float, tags: Optional[Dict] = None) -> None:
         """Record a metric value."""
-        entry = {
-            'timestamp': datetime.now(timezone.utc).isoformat(),
-            'value': value,
-            'tags': tags or {},
-        }
-        
-        self.metrics[metric_name].append(entry)
-        
-        # Keep only window_size entries
-        if len(self.metrics[metric_name]) > self.window_size:
-            self.metrics[metric_name].pop(0)
+        ring = self.metrics.get(metric_name)
+        if ring is None:
+            ring = self.metrics[metric_name] = MetricRing(self.window_size)
+            self.rollups[metric_name] = MetricRollups(self.relative_accuracy)
+        epoch = time.time()
+        ring.add(value, epoch, self._intern_tags(tags) if tags else 0)
+        self.rollups[metric_name].add(value, epoch)
+        if self.bus:
+            self.bus.publish('metrics.record', {
+                'metric': metric_name, 'value': value, 'epoch': epoch, 'tags': tags or {}},
+                key=metric_name)
     
     def get_metric(self, metric_name: str) -> List[Dict]:
         """Get metric values."""
-        return self.metrics.get(metric_name, [])
+        ring = self.metrics.get(metric_name)
+        if ring is None:
+            return []
+        return [
+            {
+                'timestamp': datetime.fromtimestamp(epoch, timezone.utc).isoformat(),
+                'value': value,
+                'tags': self._tags[tag_id],
+            }
+            for epoch, value, tag_id in ring.samples()
+        ]
     
     def get_stats(self, metric_name: str) -> Dict:
         """Get statistics for a metric."""
-        values = [e['value'] for e in self.metrics.get(metric_name, [])]
+        ring = self.metrics.get(metric_name)
         
-        if not values:
+        if not ring or not ring.count:
             return {}
         
         return {
-            'count': len(values),
-            'min': min(values),
-            'max': max(values),
-            'avg': sum(values) / len(values),
-            'latest': values[-1] if values else None,
+            'count': ring.count,
+            'min': ring.min_queue[0][1],
+            'max': ring.max_queue[0][1],
+            'avg': ring.total / ring.count,
+            'latest': ring.latest(),
         }
     
+    def get_quantiles(self, metric_name: str, quantiles: Tuple[float, ...] = QUANTILES) -> Dict:
+        """Lifetime quantile estimates, keyed ``p50``, ``p95``, ..."""
+        rollups = self.rollups.get(metric_name)
+        if rollups is None:
+            return {}
+        sketch = rollups.sketch()
+        return {f"p{q * 100:g}": sketch.quantile(q) for q in quantiles}
+    
+    def get_rollup(self, metric_name: str, resolution: str = '1m',
+                   quantiles: Tuple[float, ...] = QUANTILES) -> List[Dict]:
+        """Downsampled buckets (``'1s'``, ``'1m'`` or ``'1h'``), oldest first."""
+        rollups = self.rollups.get(metric_name)
+        if rollups is None:
+            return []
+        return [
+            dict(
+                {
+                    'timestamp': datetime.fromtimestamp(b['start'], timezone.utc).isoformat(),
+                    'count': b['count'],
+                    'min': b['min'],
+                    'max': b['max'],
+                    'avg': b['sum'] / b['count'],
+                },
+                **{f"p{q * 100:g}": b['sketch'].quantile(q) for q in quantiles}
+            )
+            for b in rollups.buckets(resolution)
+        ]
+    
+    def get_sketch(self, metric_name: str) -> Optional[QuantileSketch]:
+        """A copy of the metric's lifetime sketch (mergeable across collectors)."""
+        rollups = self.rollups.get(metric_name)
+        return rollups.sketch() if rollups else None
+    
+    def merge(self, other: 'MetricsCollector') -> None:
+        """Merge another collector's sketches and rollups into this one.
+        
+        Raw sample windows are per-collector and are not merged.
+        """
+        for metric_name, theirs in other.rollups.items():
+            mine = self.rollups.get(metric_name)
+            if mine is None:
+                self.metrics[metric_name] = MetricRing(self.window_size)
+                mine = self.rollups[metric_name] = MetricRollups(self.relative_accuracy)
+            mine.merge(theirs)
+    
     def to_dict(self) -> Dict:
         """Export metrics."""
         stats = {}
@@ -229,16 +2453,88 @@ class MetricsCollector:
         
         return {
             'timestamp': self.timestamp,
-            'metrics': dict(self.metrics),
+            'metrics': {name: self.get_metric(name) for name in self.metrics},
             'stats': stats,
+            'quantiles': {name: self.get_quantiles(name) for name in self.rollups},
             'credit': CREDIT,
         }
+    
+    def _intern_tags(self, tags: Dict) -> int:
+        """Return the id of an interned copy of ``tags``."""
+        try:
+            key = tuple(sorted(tags.items()))
+            hash(key)
+        except TypeError:
+            key = json.dumps(tags, sort_keys=True, default=str)
+        tag_id = self._tag_ids.get(key)
+        if tag_id is None:
+            tag_id = self._tag_ids[key] = len(self._tags)
+            self._tags.append(dict(tags))
+        return tag_id
 
 
-if __name__ == '__main__':
+def benchmark_canonical(iterations: int = 20000) -> List[Dict]:
+    """Time the legacy ``json.dumps`` + SHA-256 idiom against CANONICAL.
+    
+    Cases mirror the project's call sites: a small event entry, a state
+    export, and a build seal that hashes ``build_info`` and then the entry
+    embedding it (the frozen case serialises ``build_info`` once).
+    """
+    def legacy(obj):
+        canonical = json.dumps(obj, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+    
+    entry = {'index': 1, 'timestamp': datetime.now(timezone.utc).isoformat(), 'type': 'bench',
+             'message': 'benchmark', 'data': {'k': 1}, 'previous_hash': '0' * 64}
+    state = {'name': 'VUA-STATE', 'cycle': 7, 'data': {f'key{i}': i for i in range(200)}}
+    build_info = {'artifacts': [{'name': f'mod{i}', 'sha256': '0' * 64} for i in range(100)]}
+    
+    def legacy_build():
+        seal = dict(entry, build_hash=legacy(build_info), build_info=build_info)
+        return legacy(seal)
+    
+    def frozen_build():
+        frozen = CANONICAL.freeze(build_info)
+        return CANONICAL.hexdigest(dict(entry, build_hash=frozen.digest, build_info=frozen))
+    
+    cases = [
+        ('event entry', lambda: legacy(entry), lambda: CANONICAL.hexdigest(entry)),
+        ('state export', lambda: legacy(state), lambda: CANONICAL.hexdigest(state)),
+        ('build seal', legacy_build, frozen_build),
+    ]
+    results = []
+    for name, old, new in cases:
+        assert old() == new()
+        timings = []
+        for func in (old, new):
+            started = time.perf_counter()
+            for _ in range(iterations):
+                func()
+            timings.append(time.perf_counter() - started)
+        results.append({
+            'case': name,
+            'legacy_us': timings[0] / iterations * 1e6,
+            'engine_us': timings[1] / iterations * 1e6,
+            'speedup': timings[0] / timings[1],
+        })
+    return results
+
+
+def main():
+    """CLI interface."""
+    if len(sys.argv) > 1 and sys.argv[1] == 'bench':
+        print(f"{'case':15} {'legacy µs':>10} {'engine µs':>10} {'speedup':>8}")
+        for row in benchmark_canonical():
+            print(f"{row['case']:15} {row['legacy_us']:10.2f} {row['engine_us']:10.2f} {row['speedup']:7.2f}x")
+        return
+    
     print(f"""
 VUA Core Library — Pure Python Implementation
 
 Credit: {CREDIT}
 Eternal Binding: 𓁚 A FORTIORI • SUI GENERIS
 """)
+
+
+if __name__ == '__main__':
+    main()
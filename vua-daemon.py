@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VUA Daemon
+Long-lived server keeping the VUA core, validator and attestation engine warm
+
+Serves a length-prefixed JSON protocol over a local Unix socket: every frame
+is a 4-byte big-endian length followed by that many bytes of UTF-8 JSON.
+
+Requests look like {"op": "...", ...}. JSON-mode responses are
+{"ok": bool, "result": ..., "output": str, "stderr": str, "exit_code": int}.
+Requests with "mode": "text" get a plain-text frame instead: the exit status
+on the first line, then the command's stdout and stderr, so shell clients
+need no JSON parser. Relative "path" fields are resolved against the
+request's "cwd" (default: the directory the daemon was started in).
+
+Eternal Binding:
+The Architect - Axis Prime - Veroti - Dustin Sean Coffey - Evomorphic
+𓁚 A FORTIORI • SUI GENERIS
+"""
+
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import socket
+import socketserver
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+CREDIT = "The Architect - Axis Prime - Veroti - Dustin Sean Coffey - Evomorphic"
+EMAIL = "axismuse@gmail.com"
+GLYPH = "𓁚🜇∞Ϟ"
+
+HERE = Path(__file__).resolve().parent
+DEFAULT_SOCKET = os.environ.get(
+    'VUA_SOCKET', str(Path(os.environ.get('VUA_HOME', '.')) / '.vua.sock'))
+FRAME = struct.Struct('>I')
+MAX_FRAME = 64 * 1024 * 1024
+
+# CLI scripts the daemon can run in-process, by file name.
+SCRIPTS = {
+    'vua-core.py': 'vua_core',
+    'vua-manifest-validator.py': 'vua_manifest_validator',
+    'vua-attestation-gen.py': 'vua_attestation_gen',
+}
+
+
+def load_script(filename: str):
+    """Import a hyphenated VUA script from this directory as a module."""
+    name = SCRIPTS[filename]
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, HERE / filename)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def read_frame(sock: socket.socket) -> Optional[bytes]:
+    """Read one frame; None on a clean EOF between frames."""
+    header = _read_exact(sock, FRAME.size)
+    if header is None:
+        return None
+    (length,) = FRAME.unpack(header)
+    if length > MAX_FRAME:
+        raise ValueError(f"frame of {length} bytes exceeds limit")
+    body = _read_exact(sock, length)
+    if body is None:
+        raise ConnectionError("connection closed mid-frame")
+    return body
+
+
+def write_frame(sock: socket.socket, body: bytes) -> None:
+    sock.sendall(FRAME.pack(len(body)) + body)
+
+
+def _read_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            if chunks:
+                raise ConnectionError("connection closed mid-frame")
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+class VUADaemon:
+    """Holds warm VUA objects and dispatches protocol requests."""
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET):
+        # Only ``op_run`` changes directory, so nothing else may depend on
+        # the process cwd: every path the daemon keeps is absolute.
+        self.cwd = os.getcwd()
+        self.socket_path = os.path.abspath(socket_path)
+        self.started = time.time()
+        self.core = load_script('vua-core.py')
+        self.validator = load_script('vua-manifest-validator.py')
+        self.attestation = load_script('vua-attestation-gen.py')
+        self.log = self.core.EventLog('VUA-DAEMON')
+        self.state = self.core.StateVector('VUA-DAEMON')
+        self.generator = self.attestation.AttestationGenerator()
+        self.server = None
+        # CLI runs patch process-wide argv, cwd, stdout and stderr, so they serialise.
+        self._cli_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+
+    def handle(self, request: Dict) -> Dict:
+        """Dispatch one request to its ``op_*`` handler."""
+        op = request.get('op', '')
+        handler = getattr(self, 'op_' + op.replace('.', '_'), None)
+        if handler is None:
+            return {'ok': False, 'error': f"unknown op: {op}", 'exit_code': 2, 'output': ''}
+        try:
+            response = handler(request)
+        except Exception as e:
+            return {'ok': False, 'error': f"{type(e).__name__}: {e}", 'exit_code': 1, 'output': ''}
+        response.setdefault('ok', True)
+        response.setdefault('exit_code', 0 if response['ok'] else 1)
+        response.setdefault('output', '')
+        response.setdefault('stderr', '')
+        return response
+
+    def resolve(self, request: Dict, key: str = 'path') -> str:
+        """``request[key]`` as an absolute path, relative to the request's cwd."""
+        return os.path.join(request.get('cwd') or self.cwd, request[key])
+
+    # Operations
+
+    def op_ping(self, request: Dict) -> Dict:
+        return {'result': {'pid': os.getpid(), 'uptime': time.time() - self.started}}
+
+    def op_run(self, request: Dict) -> Dict:
+        """Run a VUA script's CLI in-process: {"script", "args", "cwd"}.
+        
+        The CLI's own relative paths (arguments and default output files)
+        need the client's cwd, so the run switches to it under the CLI lock.
+        """
+        script = request.get('script')
+        if script not in SCRIPTS:
+            return {'ok': False, 'error': f"unknown script: {script}", 'exit_code': 2}
+        module = load_script(script)
+        output = io.StringIO()
+        errors = io.StringIO()
+        exit_code = 0
+        with self._cli_lock:
+            saved_argv = sys.argv
+            try:
+                os.chdir(request.get('cwd') or self.cwd)
+                sys.argv = [script] + [str(a) for a in request.get('args', [])]
+                with contextlib.redirect_stdout(output), contextlib.redirect_stderr(errors):
+                    module.main()
+            except SystemExit as e:
+                exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            finally:
+                sys.argv = saved_argv
+                os.chdir(self.cwd)
+        return {'ok': exit_code == 0, 'exit_code': exit_code,
+                'output': output.getvalue(), 'stderr': errors.getvalue()}
+
+    def op_validate(self, request: Dict) -> Dict:
+        validator = self.validator.ManifestValidator()
+        if not validator.load(self.resolve(request)):
+            return {'ok': False, 'result': {'valid': False, 'errors': validator.errors}}
+        results = validator.full_validate()
+        if results['valid']:
+            results['attestation'] = validator.generate_attestation()
+        return {'ok': results['valid'], 'result': results}
+
+    def op_seal_state(self, request: Dict) -> Dict:
+        with self._state_lock:
+            return {'result': self.generator.seal_state(request['data'])}
+
+    def op_seal_manifest(self, request: Dict) -> Dict:
+        with self._state_lock:
+            return {'result': self.generator.seal_manifest(self.resolve(request))}
+
+    def op_log_append(self, request: Dict) -> Dict:
+        entry_hash = self.log.append(request['type'], request.get('message', ''), request.get('data'))
+        return {'result': {'hash': entry_hash, 'count': len(self.log.events)}}
+
+    def op_log_export(self, request: Dict) -> Dict:
+        return {'result': self.log.to_dict()}
+
+    def op_state_update(self, request: Dict) -> Dict:
+        with self._state_lock:
+            self.state.update(request['data'])
+            return {'result': {'cycle': self.state.cycle, 'hash': self.state.hash}}
+
+    def op_state_get(self, request: Dict) -> Dict:
+        with self._state_lock:
+            return {'result': self.state.to_dict()}
+
+    def op_shutdown(self, request: Dict) -> Dict:
+        threading.Thread(target=self.server.shutdown, daemon=True).start()
+        return {'result': 'shutting down'}
+
+    # Server
+
+    def serve(self) -> None:
+        """Bind the socket and serve until a shutdown request."""
+        if os.path.exists(self.socket_path):
+            if ping(self.socket_path):
+                raise RuntimeError(f"daemon already running on {self.socket_path}")
+            os.unlink(self.socket_path)
+
+        daemon = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                while True:
+                    try:
+                        body = read_frame(self.request)
+                        if body is None:
+                            return
+                        request = json.loads(body)
+                    except (ValueError, ConnectionError) as e:
+                        response = {'ok': False, 'error': str(e), 'exit_code': 2, 'output': ''}
+                        write_frame(self.request, json.dumps(response).encode())
+                        return
+                    response = daemon.handle(request)
+                    if request.get('mode') == 'text':
+                        text = response['output'] + response.get('stderr', '')
+                        if not response['ok'] and response.get('error'):
+                            text += f"Error: {response['error']}\n"
+                        write_frame(self.request, f"{response['exit_code']}\n{text}".encode())
+                    else:
+                        write_frame(self.request, json.dumps(response, default=str).encode())
+
+        class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+            daemon_threads = True
+
+        # Create the socket owner-only from the start; a chmod after bind
+        # leaves a window where other users can connect.
+        umask = os.umask(0o177)
+        try:
+            self.server = Server(self.socket_path, Handler)
+        finally:
+            os.umask(umask)
+        try:
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.socket_path)
+
+
+def call(request: Dict, socket_path: str = DEFAULT_SOCKET, timeout: float = 30.0) -> Dict:
+    """Send one JSON-mode request and return the decoded response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        write_frame(sock, json.dumps(request).encode())
+        return json.loads(read_frame(sock))
+
+
+def ping(socket_path: str = DEFAULT_SOCKET) -> bool:
+    """True if a daemon answers on ``socket_path``."""
+    try:
+        return call({'op': 'ping'}, socket_path, timeout=2.0).get('ok', False)
+    except (OSError, ValueError, TypeError):
+        return False
+
+
+def main():
+    """CLI interface."""
+
+    if len(sys.argv) < 2:
+        print("VUA Daemon — serve | stop | status | call OP [JSON]")
+        return
+
+    cmd = sys.argv[1]
+
+    if cmd == 'serve':
+        daemon = VUADaemon()
+        print(f"✓ VUA daemon listening on {daemon.socket_path}")
+        sys.stdout.flush()
+        daemon.serve()
+
+    elif cmd == 'stop':
+        if ping():
+            call({'op': 'shutdown'})
+            print("✓ VUA daemon stopped")
+        else:
+            print("✗ VUA daemon not running")
+            sys.exit(1)
+
+    elif cmd == 'status':
+        if ping():
+            info = call({'op': 'ping'})['result']
+            print(f"✓ VUA daemon running (pid {info['pid']}, up {info['uptime']:.0f}s)")
+        else:
+            print("✗ VUA daemon not running")
+            sys.exit(1)
+
+    elif cmd == 'call' and len(sys.argv) > 2:
+        request = json.loads(sys.argv[3]) if len(sys.argv) > 3 else {}
+        request['op'] = sys.argv[2]
+        response = call(request)
+        print(json.dumps(response, indent=2))
+        sys.exit(response.get('exit_code', 0))
+
+
+if __name__ == '__main__':
+    main()
@@ -3,7 +3,8 @@
 # Complete bash/zsh integration for TOTALITY systems
 
 export VUA_HOME="${VUA_HOME:-.}"
-export VUA_PYTHON="${VUA_PYTHON:python3}"
+export VUA_PYTHON="${VUA_PYTHON:-python3}"
+export VUA_SOCKET="${VUA_SOCKET:-$VUA_HOME/.vua.sock}"
 
 vua_log() {
     local level=$1
@@ -13,44 +14,123 @@ vua_log() {
     echo "[$timestamp] [$level] $message" >&2
 }
 
+vua_json_str() {
+    # Quote a string as a JSON string literal
+    local s=$1
+    s=${s//\\/\\\\}
+    s=${s//\"/\\\"}
+    s=${s//$'\n'/\\n}
+    s=${s//$'\t'/\\t}
+    s=${s//$'\r'/\\r}
+    printf '"%s"' "$s"
+}
+
+vua_daemon_call() {
+    # Thin client: send one text-mode request to the daemon over its socket.
+    # Returns 125 if the daemon cannot be reached.
+    local request=$1
+    [[ -S "$VUA_SOCKET" ]] && command -v socat >/dev/null 2>&1 || return 125
+
+    local LC_ALL=C
+    local n=${#request}
+    local header
+    header=$(printf '\\x%02x\\x%02x\\x%02x\\x%02x' \
+        $(( n >> 24 & 255 )) $(( n >> 16 & 255 )) $(( n >> 8 & 255 )) $(( n & 255 )))
+
+    local response
+    response=$({ printf '%b' "$header"; printf '%s' "$request"; } \
+        | socat -t 60 - "UNIX-CONNECT:$VUA_SOCKET" 2>/dev/null | tail -c +5; echo x)
+    response=${response%x}
+    [[ -n "$response" ]] || return 125
+
+    printf '%s' "${response#*$'\n'}"
+    return "${response%%$'\n'*}"
+}
+
+vua_run() {
+    # vua_run SCRIPT ARGS...: run through the warm daemon when it is up,
+    # otherwise in a fresh interpreter.
+    local script=$1
+    shift
+
+    local args="" arg
+    for arg in "$@"; do
+        args+="${args:+,}$(vua_json_str "$arg")"
+    done
+    vua_daemon_call "{\"op\":\"run\",\"mode\":\"text\",\"script\":$(vua_json_str "$script"),\"cwd\":$(vua_json_str "$PWD"),\"args\":[$args]}"
+    local status=$?
+    [[ $status -ne 125 ]] && return $status
+
+    $VUA_PYTHON "$script" "$@"
+}
+
+vua_daemon() {
+    local action="${1:-status}"
+
+    case "$action" in
+        start)
+            if $VUA_PYTHON "$VUA_HOME/vua-daemon.py" status >/dev/null 2>&1; then
+                vua_log INFO "Daemon already running on $VUA_SOCKET"
+                return 0
+            fi
+            vua_log INFO "Starting VUA daemon on $VUA_SOCKET"
+            nohup $VUA_PYTHON "$VUA_HOME/vua-daemon.py" serve >/dev/null 2>&1 &
+            local i
+            for i in $(seq 50); do
+                [[ -S "$VUA_SOCKET" ]] && return 0
+                sleep 0.1
+            done
+            vua_log ERROR "Daemon did not come up"
+            return 1
+            ;;
+        stop|status)
+            $VUA_PYTHON "$VUA_HOME/vua-daemon.py" "$action"
+            ;;
+        *)
+            vua_log ERROR "Unknown daemon action: $action"
+            return 1
+            ;;
+    esac
+}
+
 vua_init() {
-    local version="${1:1.0.0}"
+    local version="${1:-1.0.0}"
     local modules="${@:2}"
     
     vua_log INFO "Initializing VUA system (version: $version)..."
     
-    $VUA_PYTHON vua-manifest-validator.py create "$version" $modules
+    vua_run vua-manifest-validator.py create "$version" $modules
     
     vua_log SUCCESS "System initialized"
     return 0
 }
 
 vua_validate() {
-    local manifest="${1:TOTALITY_MANIFEST_v*.json}"
+    local manifest="${1:-TOTALITY_MANIFEST_v*.json}"
     
     vua_log INFO "Validating manifest: $manifest"
-    $VUA_PYTHON vua-manifest-validator.py validate "$manifest"
+    vua_run vua-manifest-validator.py validate "$manifest"
     
     return $?
 }
 
 vua_seal_manifest() {
-    local manifest="${1:TOTALITY_MANIFEST_v*.json}"
+    local manifest="${1:-TOTALITY_MANIFEST_v*.json}"
     
     vua_log INFO "Sealing manifest with attestation..."
-    $VUA_PYTHON vua-attestation-gen.py seal manifest "$manifest"
+    vua_run vua-attestation-gen.py seal manifest "$manifest"
     
     return $?
 }
 
 vua_demo() {
     vua_log INFO "Running VUA-CORE demo..."
-    $VUA_PYTHON vua-core.py demo
+    vua_run vua-core.py demo
     return $?
 }
 
 vua_monitor() {
-    local port="${1:8000}"
+    local port="${1:-8000}"
     
     vua_log INFO "Starting HTTP server on port $port"
     vua_log INFO "Open: http://localhost:$port/vua-control-dashboard.html"
@@ -70,6 +150,7 @@ VUA Shell Integration — TOTALITY Command Suite
   vua_validate [MANIFEST]             Validate manifest
   vua_seal_manifest [MANIFEST]        Seal manifest with attestation
   vua_monitor [PORT]                  Start HTTP server (default: 8000)
+  vua_daemon start|stop|status        Warm daemon (commands use it via socat)
 
 💡 USAGE EXAMPLES:
 
@@ -87,6 +168,9 @@ VUA Shell Integration — TOTALITY Command Suite
   # Run demo
   vua_demo
 
+  # Keep interpreters warm for repeated calls
+  vua_daemon start
+
 Credit:
   The Architect — Axis Prime — Veroti — Dustin Sean Coffey — Evomorphic
   axismuse@gmail.com
@@ -119,6 +203,9 @@ case "$cmd" in
     monitor)
         vua_monitor "$@"
         ;;
+    daemon)
+        vua_daemon "$@"
+        ;;
     help|--help|-h)
         vua_help
         ;;
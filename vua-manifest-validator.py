@@ -11,30 +11,303 @@ The Architect - Axis Prime - Veroti - Dustin Sean Coffey - Evomorphic
 
 import json
 import hashlib
+import bisect
+import codecs
+import ctypes
+import ctypes.util
+import fnmatch
+import functools
+import importlib.util
+import mmap
+import multiprocessing
+import os
+import re
+import select
+import signal
+import sqlite3
+import struct
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 CREDIT = "The Architect - Axis Prime - Veroti - Dustin Sean Coffey - Evomorphic"
 GLYPH = "𓁚🜇∞Ϟ"
 EMAIL = "axismuse@gmail.com"
 
 
+
+def _load_core():
+    """Import vua-core.py from this directory."""
+    if 'vua_core' in sys.modules:
+        return sys.modules['vua_core']
+    spec = importlib.util.spec_from_file_location('vua_core', Path(__file__).resolve().parent / 'vua-core.py')
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['vua_core'] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# Canonical JSON for manifest hashes; attestation seals keep json.dumps' default separators.
+CANONICAL = _load_core().CANONICAL
+ATTESTATION_CANONICAL = _load_core().CanonicalJSON(separators=(', ', ': '))
+
+# Bump whenever checks or result format change; invalidates ValidationCache.
+VALIDATOR_VERSION = '2'
+
+HASH_CHUNK = 8 << 20
+
+_ARRAY_SEPARATOR = re.compile(r'[ \t\n\r]*([,\]])[ \t\n\r]*')
+
+
+class StreamedArray:
+    """Stand-in for a top-level array that was counted but not kept in memory."""
+
+    def __init__(self, offset: int, count: int):
+        self.offset = offset
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class JSONStream:
+    """Incremental JSON reader: raw_decode over a sliding window of a UTF-8 file.
+
+    Tracks absolute character offsets and records a (char offset, byte offset)
+    checkpoint at every chunk so a later reader can resume near any position.
+    """
+
+    CHUNK = 1 << 20
+    LOOKAHEAD = 4096
+    MAX_VALUE = 64 << 20
+
+    def __init__(self, f: BinaryIO, skip_bom: bool = True, hasher=None):
+        self.f = f
+        self.decoder = codecs.getincrementaldecoder('utf-8-sig' if skip_bom else 'utf-8')()
+        self.json = json.JSONDecoder()
+        self.hasher = hasher
+        self.buf = ''
+        self.pos = 0
+        self.base = 0
+        self.chars = 0
+        self.bytes = f.tell()
+        self.eof = False
+        self.checkpoints: List[Tuple[int, int]] = []
+
+    @property
+    def offset(self) -> int:
+        return self.base + self.pos
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        raw = self.f.read(self.CHUNK)
+        pending = self.decoder.getstate()[0]
+        self.checkpoints.append((self.chars, self.bytes - len(pending)))
+        self.bytes += len(raw)
+        if self.hasher:
+            self.hasher.update(raw)
+        text = self.decoder.decode(raw, final=not raw)
+        self.chars += len(text)
+        self.eof = not raw
+        self.base += self.pos
+        self.buf = self.buf[self.pos:] + text
+        self.pos = 0
+        return bool(raw)
+
+    def peek(self) -> str:
+        """Next non-whitespace character without consuming it; '' at EOF."""
+        while True:
+            buf, pos = self.buf, self.pos
+            while pos < len(buf) and buf[pos] in ' \t\n\r':
+                pos += 1
+            self.pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"expected {char!r} at char {self.offset}, found {found or 'EOF'!r}")
+        self.pos += 1
+
+    def skip(self, count: int) -> None:
+        while len(self.buf) - self.pos < count and self._fill():
+            pass
+        self.pos += count
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while len(self.buf) - self.pos < self.LOOKAHEAD and self._fill():
+            pass
+        while True:
+            try:
+                value, end = self.json.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                if len(self.buf) - self.pos > self.MAX_VALUE or not self._fill():
+                    raise ValueError(f"{e.msg} at char {self.base + e.pos}") from None
+                continue
+            if end == len(self.buf) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def array(self) -> Iterator[List[Any]]:
+        """Yield the elements of the array at the current position, in batches."""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        decode = self.json.scan_once
+        separator = _ARRAY_SEPARATOR.match
+        bulk = True
+        while True:
+            buf, pos = self.buf, self.pos
+            limit = len(buf) - self.LOOKAHEAD
+
+            # Bulk path: everything up to the window's last comma, in one call.
+            # That only parses if the comma is between elements (one inside an
+            # element leaves a bracket or quote open), so success is exact.
+            cut = buf.rfind(',', pos, limit) if bulk else -1
+            if cut > pos:
+                try:
+                    batch = self.json.decode('[' + buf[pos:cut] + ']')
+                except json.JSONDecodeError:
+                    bulk = False
+                else:
+                    self.pos = cut + 1
+                    self.peek()
+                    yield batch
+                    continue
+
+            # Element path: decode in place while well inside the window. An
+            # element longer than the lookahead can still run off its end.
+            batch = []
+            char = ','
+            while pos < limit:
+                try:
+                    value, end = decode(buf, pos)
+                except (StopIteration, json.JSONDecodeError):
+                    break
+                match = separator(buf, end)
+                if match is None or end == len(buf):
+                    break
+                batch.append(value)
+                pos = match.end()
+                char = match.group(1)
+                if char == ']':
+                    break
+            self.pos = pos
+            if batch:
+                yield batch
+            if char == ']':
+                return
+
+            # Slow path: one element across a window boundary, or an error.
+            yield [self.value()]
+            char = self.peek()
+            self.pos += 1
+            if char == ']':
+                return
+            if char != ',':
+                raise ValueError(f"expected ',' or ']' at char {self.offset - 1}")
+            self.peek()
+
+    def items(self) -> Iterator[Tuple[str, 'JSONStream']]:
+        """Yield (key, self) for each member of a top-level object; the caller consumes the value."""
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+        else:
+            while True:
+                key = self.value()
+                if not isinstance(key, str):
+                    raise ValueError(f"object key must be a string at char {self.offset}")
+                self.expect(':')
+                yield key, self
+                char = self.peek()
+                self.pos += 1
+                if char == '}':
+                    break
+                if char != ',':
+                    raise ValueError(f"expected ',' or '}}' at char {self.offset - 1}")
+        if self.peek():
+            raise ValueError(f"extra data at char {self.offset}")
+
+    @classmethod
+    def resume(cls, f: BinaryIO, checkpoints: List[Tuple[int, int]], offset: int) -> 'JSONStream':
+        """Reader positioned at char ``offset`` using checkpoints from an earlier pass."""
+        i = bisect.bisect_right(checkpoints, (offset, float('inf'))) - 1
+        chars, byte = checkpoints[i]
+        f.seek(byte)
+        stream = cls(f, skip_bom=byte == 0)
+        stream.base = stream.chars = chars
+        stream.skip(offset - chars)
+        return stream
+
+
+def hash_file(path: str, chunk_size: int = HASH_CHUNK) -> str:
+    """SHA-256 of a file, fed from a memory map in chunks."""
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    for offset in range(0, size, chunk_size):
+                        hasher.update(view[offset:offset + chunk_size])
+                finally:
+                    view.release()
+    return hasher.hexdigest()
+
+
+def hash_files(paths: List[str], workers: Optional[int] = None) -> List[str]:
+    """hash_file() over many files on a thread pool (hashlib releases the GIL)."""
+    if len(paths) <= 1:
+        return [hash_file(p) for p in paths]
+    with ThreadPoolExecutor(workers) as pool:
+        return list(pool.map(hash_file, paths))
+
+
+def digest_artifacts(artifacts: Dict[str, str], workers: Optional[int] = None) -> Dict[str, Dict]:
+    """Build the manifest ``artifacts`` field from {module: path}."""
+    modules = list(artifacts)
+    digests = hash_files([artifacts[m] for m in modules], workers)
+    return {m: {'path': artifacts[m], 'size': os.path.getsize(artifacts[m]), 'sha256': d}
+            for m, d in zip(modules, digests)}
+
+
 class ManifestValidator:
     """Validates VUA-CORE manifest files with SHA-256 chain verification."""
 
     def __init__(self, manifest_path: Optional[str] = None):
         self.manifest_path = Path(manifest_path) if manifest_path else None
         self.manifest = None
+        self.digest = None
+        self.stat = None
+        self.checkpoints = None
+        self.artifact_cache = None
+        self.artifact_report = None
+        self.artifact_stats = []
+        self.hash_workers = None
         self.errors = []
         self.warnings = []
 
     def load(self, path: str) -> bool:
         """Load manifest from JSON file."""
         try:
-            with open(path, 'r') as f:
-                self.manifest = json.load(f)
+            with open(path, 'rb') as f:
+                self.stat = os.fstat(f.fileno())
+                raw = f.read()
+            self.digest = hashlib.sha256(raw).hexdigest()
+            self.manifest = json.loads(raw)
             self.manifest_path = Path(path)
             return True
         except FileNotFoundError:
@@ -44,6 +317,32 @@ class ManifestValidator:
             self.errors.append(f"Invalid JSON: {e}")
             return False
 
+    def load_stream(self, path: str) -> bool:
+        """Load manifest incrementally: scalars are kept, top-level arrays only counted."""
+        hasher = hashlib.sha256()
+        manifest = {}
+        try:
+            with open(path, 'rb') as f:
+                self.stat = os.fstat(f.fileno())
+                stream = JSONStream(f, hasher=hasher)
+                for key, _ in stream.items():
+                    if stream.peek() == '[':
+                        offset = stream.offset
+                        manifest[key] = StreamedArray(offset, sum(map(len, stream.array())))
+                    else:
+                        manifest[key] = stream.value()
+        except FileNotFoundError:
+            self.errors.append(f"Manifest not found: {path}")
+            return False
+        except ValueError as e:
+            self.errors.append(f"Invalid JSON: {e}")
+            return False
+        self.manifest = manifest
+        self.manifest_path = Path(path)
+        self.digest = hasher.hexdigest()
+        self.checkpoints = stream.checkpoints
+        return True
+
     def validate_structure(self) -> bool:
         """Validate required manifest fields."""
         if not self.manifest:
@@ -56,7 +355,7 @@ class ManifestValidator:
                 self.errors.append(f"Missing required field: {field}")
                 return False
 
-        if not isinstance(self.manifest.get('modules'), list):
+        if not isinstance(self.manifest.get('modules'), (list, StreamedArray)):
             self.errors.append("Field 'modules' must be a list")
             return False
 
@@ -98,8 +397,32 @@ class ManifestValidator:
         data_copy = {k: v for k, v in data.items() 
                      if k not in ['sha256_manifest', 'signature']}
         
-        canonical = json.dumps(data_copy, sort_keys=True, separators=(',', ':'))
-        return hashlib.sha256(canonical.encode()).hexdigest()
+        return CANONICAL.hexdigest(data_copy)
+
+    def calculate_sha256_stream(self) -> str:
+        """calculate_sha256() for a load_stream() manifest, re-reading arrays from disk."""
+        encode = CANONICAL.encode
+        hasher = hashlib.sha256()
+        keys = sorted(k for k in self.manifest if k not in ['sha256_manifest', 'signature'])
+
+        with open(self.manifest_path, 'rb') as f:
+            for i, key in enumerate(keys):
+                value = self.manifest[key]
+                hasher.update((b'{' if i == 0 else b',') + encode(key) + b':')
+                if not isinstance(value, StreamedArray):
+                    CANONICAL.update(hasher, value)
+                    continue
+
+                hasher.update(b'[')
+                stream = JSONStream.resume(f, self.checkpoints, value.offset)
+                sep = b''
+                for elements in stream.array():
+                    hasher.update(sep + b','.join(map(encode, elements)))
+                    sep = b','
+                hasher.update(b']')
+
+        hasher.update(b'}' if keys else b'{}')
+        return hasher.hexdigest()
 
     def verify_sha256(self) -> bool:
         """Verify SHA-256 integrity."""
@@ -109,7 +432,10 @@ class ManifestValidator:
             self.warnings.append("No SHA-256 hash found in manifest")
             return False
 
-        calculated = self.calculate_sha256(self.manifest)
+        if self.checkpoints is not None:
+            calculated = self.calculate_sha256_stream()
+        else:
+            calculated = self.calculate_sha256(self.manifest)
         
         if calculated == stored_hash:
             return True
@@ -117,6 +443,57 @@ class ManifestValidator:
             self.errors.append(f"SHA-256 mismatch")
             return False
 
+    def verify_artifacts(self) -> bool:
+        """Verify size and SHA-256 of each module artifact; paths are relative to the manifest."""
+        artifacts = self.manifest.get('artifacts')
+        if not isinstance(artifacts, dict):
+            self.errors.append("Field 'artifacts' must be an object")
+            return False
+
+        base = self.manifest_path.parent if self.manifest_path else Path('.')
+        modules = self.manifest.get('modules', [])
+        listed = set(modules) if isinstance(modules, list) else None
+        report, pending = {}, []
+
+        for module, entry in artifacts.items():
+            if listed is not None and module not in listed:
+                self.warnings.append(f"Artifact for unlisted module: {module}")
+            if not (isinstance(entry, dict) and isinstance(entry.get('path'), str)
+                    and isinstance(entry.get('size'), int) and isinstance(entry.get('sha256'), str)):
+                report[module] = 'invalid'
+                self.errors.append(f"Malformed artifact entry: {module}")
+                continue
+
+            path = str(base / entry['path'])
+            try:
+                st = os.stat(path)
+            except OSError:
+                report[module] = 'missing'
+                self.errors.append(f"Artifact missing: {module} ({entry['path']})")
+                continue
+            if st.st_size != entry['size']:
+                report[module] = 'size'
+                self.errors.append(f"Artifact size mismatch: {module} ({entry['path']})")
+                continue
+
+            cached = None
+            if self.artifact_cache:
+                cached = self.artifact_cache.artifact(path, st.st_size, st.st_mtime_ns)
+            pending.append((module, entry, path, st, cached))
+
+        digests = iter(hash_files([p for _, _, p, _, c in pending if c is None], self.hash_workers))
+        for module, entry, path, st, cached in pending:
+            digest = cached or next(digests)
+            self.artifact_stats.append([os.path.abspath(path), st.st_size, st.st_mtime_ns, digest])
+            if digest == entry['sha256']:
+                report[module] = 'ok'
+            else:
+                report[module] = 'mismatch'
+                self.errors.append(f"Artifact digest mismatch: {module} ({entry['path']})")
+
+        self.artifact_report = report
+        return all(status == 'ok' for status in report.values())
+
     def validate_timestamp(self) -> bool:
         """Check timestamp format if present."""
         ts = self.manifest.get('timestamp')
@@ -148,6 +525,8 @@ class ManifestValidator:
             ('sha256', self.verify_sha256),
             ('timestamp', self.validate_timestamp),
         ]
+        if self.manifest and 'artifacts' in self.manifest:
+            checks.append(('artifacts', self.verify_artifacts))
 
         for name, check_func in checks:
             try:
@@ -162,6 +541,8 @@ class ManifestValidator:
 
         results['errors'] = self.errors
         results['warnings'] = self.warnings
+        if self.artifact_report is not None:
+            results['artifacts'] = self.artifact_report
 
         return results
 
@@ -196,9 +577,10 @@ class ManifestValidator:
             'modules_count': len(self.manifest.get('modules', [])),
             'manifest_sha256': self.manifest.get('sha256_manifest'),
         }
+        if 'artifacts' in self.manifest:
+            attestation['artifacts_count'] = len(self.manifest['artifacts'])
 
-        attestation_json = json.dumps(attestation, sort_keys=True)
-        seal = hashlib.sha256(attestation_json.encode()).hexdigest()
+        seal = ATTESTATION_CANONICAL.hexdigest(attestation)
         attestation['seal'] = seal
 
         return attestation
@@ -208,8 +590,9 @@ class ManifestGenerator:
     """Generates valid VUA manifests with proper SHA-256 binding."""
 
     @staticmethod
-    def create(package: str, version: str, modules: List[str], timestamp: Optional[str] = None) -> Dict:
-        """Create a new manifest."""
+    def create(package: str, version: str, modules: List[str], timestamp: Optional[str] = None,
+               artifacts: Optional[Dict[str, str]] = None) -> Dict:
+        """Create a new manifest; ``artifacts`` maps module names to files to digest."""
         
         if not timestamp:
             timestamp = datetime.now(timezone.utc).isoformat()
@@ -222,9 +605,10 @@ class ManifestGenerator:
             'modules': modules,
             'glyph': GLYPH,
         }
+        if artifacts:
+            manifest['artifacts'] = digest_artifacts(artifacts)
 
-        canonical = json.dumps(manifest, sort_keys=True, separators=(',', ':'))
-        sha256 = hashlib.sha256(canonical.encode()).hexdigest()
+        sha256 = CANONICAL.hexdigest(manifest)
         manifest['sha256_manifest'] = sha256
 
         return manifest
@@ -241,16 +625,478 @@ class ManifestGenerator:
             return False
 
 
+class ValidationCache:
+    """SQLite cache of validation results keyed by path, size, mtime and content digest."""
+
+    COMMIT_EVERY = 500
+
+    def __init__(self, path: str, version: str = VALIDATOR_VERSION):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+        self.conn.execute('''CREATE TABLE IF NOT EXISTS results (
+            path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER,
+            sha256 TEXT, result TEXT)''')
+        self.conn.execute('''CREATE TABLE IF NOT EXISTS artifacts (
+            path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, sha256 TEXT)''')
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != version:
+            self.conn.execute('DELETE FROM results')
+            self.conn.execute('DELETE FROM artifacts')
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (version,))
+            self.conn.commit()
+        self._pending = 0
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, path: str) -> Optional[Dict]:
+        """Cached result for ``path`` if the file is unchanged, else None."""
+        key = os.path.abspath(path)
+        row = self.conn.execute(
+            'SELECT size, mtime_ns, sha256, result FROM results WHERE path = ?', (key,)).fetchone()
+        try:
+            st = os.stat(path)
+        except OSError:
+            row = None
+        if row is None or row[0] != st.st_size:
+            self.misses += 1
+            return None
+
+        if row[1] != st.st_mtime_ns:
+            # Touched but possibly unchanged: fall back to the content digest.
+            if hash_file(path) != row[2]:
+                self.misses += 1
+                return None
+            self.conn.execute('UPDATE results SET mtime_ns = ? WHERE path = ?',
+                              (st.st_mtime_ns, key))
+            self._written()
+
+        result = json.loads(row[3])
+        for artifact, size, mtime_ns, _ in result.pop('_artifacts', []):
+            try:
+                st = os.stat(artifact)
+            except OSError:
+                st = None
+            if st is None or (st.st_size, st.st_mtime_ns) != (size, mtime_ns):
+                self.misses += 1
+                return None
+
+        self.hits += 1
+        result['path'] = path
+        result['cached'] = True
+        return result
+
+    def store(self, result: Dict, size: int, mtime_ns: int,
+              artifacts: Optional[List[List]] = None) -> None:
+        """Record a result produced by validate_file().
+
+        ``artifacts`` rows are [path, size, mtime_ns, sha256]; the result stays
+        valid only while every one of them is unchanged.
+        """
+        for row in artifacts or []:
+            self.conn.execute('INSERT OR REPLACE INTO artifacts VALUES (?, ?, ?, ?)', row)
+        if not result.get('sha256'):
+            return
+        record = dict(result, _artifacts=artifacts or [])
+        self.conn.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)', (
+            os.path.abspath(result['path']), size, mtime_ns, result['sha256'],
+            json.dumps(record, ensure_ascii=False)))
+        self._written()
+
+    def artifact(self, path: str, size: int, mtime_ns: int) -> Optional[str]:
+        """Cached digest of an artifact file whose size and mtime are unchanged."""
+        row = self.conn.execute('SELECT size, mtime_ns, sha256 FROM artifacts WHERE path = ?',
+                                (os.path.abspath(path),)).fetchone()
+        if row and row[0] == size and row[1] == mtime_ns:
+            return row[2]
+        return None
+
+    @classmethod
+    def reader(cls, path: str) -> 'ValidationCache':
+        """Read-only handle for worker processes; the parent does all writes."""
+        cache = cls.__new__(cls)
+        cache.path = path
+        cache.conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, timeout=30)
+        cache._pending = cache.hits = cache.misses = 0
+        return cache
+
+    def _written(self) -> None:
+        self._pending += 1
+        if self._pending >= self.COMMIT_EVERY:
+            self.conn.commit()
+            self._pending = 0
+
+    def flush(self) -> None:
+        self.conn.commit()
+        self._pending = 0
+
+    def close(self) -> None:
+        self.flush()
+        self.conn.close()
+
+
+def discover_manifests(roots: Iterable[str], pattern: str = '*.json') -> Iterator[str]:
+    """Yield files matching ``pattern`` under each root, skipping hidden dirs."""
+    for root in roots:
+        if os.path.isfile(root):
+            yield root
+            continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+            for name in sorted(filenames):
+                if fnmatch.fnmatch(name, pattern):
+                    yield os.path.join(dirpath, name)
+
+
+_CACHE_READERS: Dict[str, ValidationCache] = {}
+
+
+def validate_file(path: str, stream: bool = False, cache_path: Optional[str] = None) -> Dict:
+    """Validate one manifest in a fresh validator; never raises.
+
+    Valid results carry the attestation; ``_stat`` holds the (size, mtime_ns)
+    the file had when read and ``_artifacts`` the artifact files checked, for
+    ValidationCache.store(). ``stream`` uses load_stream() so memory stays
+    flat regardless of manifest size. ``cache_path`` supplies cached artifact
+    digests.
+    """
+    validator = ManifestValidator()
+    if cache_path:
+        if cache_path not in _CACHE_READERS:
+            _CACHE_READERS[cache_path] = ValidationCache.reader(cache_path)
+        validator.artifact_cache = _CACHE_READERS[cache_path]
+    try:
+        if (validator.load_stream if stream else validator.load)(path):
+            results = validator.full_validate()
+            if results['valid']:
+                results['attestation'] = validator.generate_attestation()
+        else:
+            results = {'valid': False, 'checks': {'load': 'FAIL'},
+                       'errors': validator.errors, 'warnings': validator.warnings}
+    except (OSError, UnicodeDecodeError) as e:
+        results = {'valid': False, 'checks': {'load': 'ERROR'},
+                   'errors': [f"Unreadable manifest: {e}"], 'warnings': []}
+    results['path'] = path
+    results['sha256'] = validator.digest
+    if validator.stat:
+        results['_stat'] = (validator.stat.st_size, validator.stat.st_mtime_ns)
+    results['_artifacts'] = validator.artifact_stats
+    return results
+
+
+def validate_cached(path: str, cache: Optional[ValidationCache] = None,
+                    stream: bool = False) -> Dict:
+    """validate_file() through an optional cache."""
+    result = cache.lookup(path) if cache else None
+    if result is None:
+        result = _finish(validate_file(path, stream, cache.path if cache else None), cache)
+    return result
+
+
+def validate_tree(roots: Iterable[str], pattern: str = '*.json',
+                  workers: Optional[int] = None, chunksize: int = 16,
+                  cache: Optional[ValidationCache] = None,
+                  stream: bool = False) -> Iterator[Dict]:
+    """Validate every discovered manifest on a process pool, yielding results as they finish.
+
+    With a cache, unchanged manifests are yielded straight away and only the
+    rest are sent to the pool.
+    """
+    paths = discover_manifests(roots, pattern)
+    if cache:
+        misses = []
+        for path in paths:
+            result = cache.lookup(path)
+            if result is None:
+                misses.append(path)
+            else:
+                yield result
+        paths = misses
+
+    validate = functools.partial(validate_file, stream=stream,
+                                 cache_path=cache.path if cache else None)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        results = map(validate, paths)
+    else:
+        pool = multiprocessing.Pool(workers)
+        results = pool.imap_unordered(validate, paths, chunksize)
+    try:
+        for result in results:
+            yield _finish(result, cache)
+    finally:
+        if workers > 1:
+            pool.terminate()
+
+
+def _finish(result: Dict, cache: Optional[ValidationCache]) -> Dict:
+    """Store a fresh result in the cache and strip internal fields."""
+    stat = result.pop('_stat', None)
+    artifacts = result.pop('_artifacts', [])
+    if cache and stat:
+        cache.store(result, *stat, artifacts)
+    result['cached'] = False
+    return result
+
+
+class PollingBackend:
+    """Change detection by rescanning the tree and comparing (size, mtime_ns)."""
+
+    def __init__(self, roots: List[str], pattern: str):
+        self.roots = roots
+        self.pattern = pattern
+        self.snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        for path in discover_manifests(self.roots, self.pattern):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            snapshot[path] = (st.st_size, st.st_mtime_ns)
+        return snapshot
+
+    def changes(self, timeout: float) -> Optional[Set[str]]:
+        """Paths created, modified or removed since the last call."""
+        time.sleep(timeout)
+        current = self._scan()
+        changed = {p for p, ident in current.items() if self.snapshot.get(p) != ident}
+        changed.update(p for p in self.snapshot if p not in current)
+        self.snapshot = current
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyBackend:
+    """Change detection through Linux inotify (via ctypes), watching directories recursively.
+
+    A root that is a single file watches only its parent directory, not
+    recursively, and reports events for that exact file alone.
+    """
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_CLOEXEC = 0o2000000
+    MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    EVENT = struct.Struct('iIII')
+
+    def __init__(self, roots: List[str], pattern: str):
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = self.libc.inotify_init1(self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs: Dict[int, str] = {}
+        # wd -> {file name: root as given} for directories watched only for single-file roots
+        self.files: Dict[int, Dict[str, str]] = {}
+        for root in roots:
+            if os.path.isdir(root):
+                self._watch_tree(root)
+        for root in roots:
+            if not os.path.isdir(root):
+                self._watch_file(root)
+
+    def _watch_file(self, path: str) -> None:
+        parent = os.path.dirname(path) or '.'
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(parent), self.MASK)
+        if wd < 0 or (wd in self.dirs and wd not in self.files):
+            return  # already watched as part of a directory root
+        self.dirs[wd] = parent
+        self.files.setdefault(wd, {})[os.path.basename(path)] = path
+
+    def _watch_tree(self, root: str) -> Set[str]:
+        """Watch ``root`` and its subdirectories; return files already inside."""
+        found = set()
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(dirpath), self.MASK)
+            if wd >= 0:
+                self.dirs[wd] = dirpath
+                self.files.pop(wd, None)
+            found.update(os.path.join(dirpath, name) for name in filenames)
+        return found
+
+    def changes(self, timeout: float) -> Optional[Set[str]]:
+        """Paths touched within ``timeout``; None if the kernel queue overflowed."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        data = os.read(self.fd, 1 << 16)
+        changed, offset = set(), 0
+        while offset < len(data):
+            wd, mask, _, length = self.EVENT.unpack_from(data, offset)
+            name = data[offset + self.EVENT.size:offset + self.EVENT.size + length].rstrip(b'\0')
+            offset += self.EVENT.size + length
+            if mask & self.IN_Q_OVERFLOW:
+                return None
+            if mask & self.IN_IGNORED:
+                self.dirs.pop(wd, None)
+                self.files.pop(wd, None)
+                continue
+            if wd not in self.dirs or not name:
+                continue
+            if wd in self.files:
+                path = self.files[wd].get(os.fsdecode(name))
+                if path is not None and not mask & self.IN_ISDIR:
+                    changed.add(path)
+                continue
+            path = os.path.join(self.dirs[wd], os.fsdecode(name))
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO) and not os.path.basename(path).startswith('.'):
+                    changed.update(self._watch_tree(path))
+            elif mask & (self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_MOVED_FROM | self.IN_DELETE):
+                changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class ManifestWatcher:
+    """Revalidates manifests as they change, coalescing bursts of writes.
+
+    Uses inotify where available and mtime polling otherwise. Results are
+    printed as NDJSON and, with ``log``, appended to a vua-core EventLog.
+    """
+
+    def __init__(self, roots: List[str], pattern: str = '*.json', debounce: float = 0.25,
+                 poll_interval: float = 1.0, cache: Optional[ValidationCache] = None,
+                 stream: bool = False, log=None, polling: bool = False):
+        self.roots = roots
+        self.pattern = pattern
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.cache = cache
+        self.stream = stream
+        self.log = log
+        self.known: Set[str] = set()
+        self.backend = None
+        if not polling and sys.platform.startswith('linux'):
+            try:
+                self.backend = InotifyBackend(roots, pattern)
+            except (OSError, AttributeError):
+                self.backend = None
+        if self.backend is None:
+            self.backend = PollingBackend(roots, pattern)
+
+    def _matches(self, path: str) -> bool:
+        parts = Path(path).parts
+        return fnmatch.fnmatch(parts[-1], self.pattern) and not any(
+            p.startswith('.') and p not in ('.', '..') for p in parts[:-1])
+
+    def emit(self, record: Dict) -> None:
+        print(json.dumps(record, ensure_ascii=False), flush=True)
+        if self.log is None:
+            return
+        if record['type'] == 'removed':
+            self.log.append('MANIFEST_REMOVED', record['path'])
+        else:
+            self.log.append('MANIFEST_VALID' if record['valid'] else 'MANIFEST_INVALID',
+                            record['path'], {'sha256': record.get('sha256'),
+                                             'checks': record['checks'],
+                                             'errors': record['errors']})
+
+    def revalidate(self, paths: Iterable[str]) -> None:
+        """Validate the given paths; report those that disappeared."""
+        for path in sorted(paths):
+            if os.path.isfile(path):
+                self.known.add(path)
+                self.emit({'type': 'result', **validate_cached(path, self.cache, self.stream)})
+            elif path in self.known:
+                self.known.discard(path)
+                self.emit({'type': 'removed', 'path': path})
+        if self.cache:
+            self.cache.flush()
+
+    def run(self, initial: bool = True) -> None:
+        """Watch until interrupted."""
+        if initial:
+            for result in validate_tree(self.roots, self.pattern, cache=self.cache, stream=self.stream):
+                self.known.add(result['path'])
+                self.emit({'type': 'result', **result})
+            if self.cache:
+                self.cache.flush()
+
+        pending: Set[str] = set()
+        deadline = 0.0
+        while True:
+            timeout = self.poll_interval if not pending else max(0.0, deadline - time.monotonic())
+            changed = self.backend.changes(timeout)
+            if changed is None:
+                changed = set(discover_manifests(self.roots, self.pattern)) | self.known
+            changed = {p for p in changed if self._matches(p)}
+            if changed:
+                pending |= changed
+                deadline = time.monotonic() + self.debounce
+            elif pending and time.monotonic() >= deadline:
+                self.revalidate(pending)
+                pending = set()
+
+    def close(self) -> None:
+        self.backend.close()
+
+
+def _pop_option(args: List[str], name: str, default: Optional[str] = None) -> Optional[str]:
+    """Remove ``name VALUE`` from args and return VALUE."""
+    if name in args:
+        i = args.index(name)
+        value = args[i + 1]
+        del args[i:i + 2]
+        return value
+    return default
+
+
+def _pop_flag(args: List[str], name: str) -> bool:
+    """Remove ``name`` from args and report whether it was there."""
+    if name in args:
+        args.remove(name)
+        return True
+    return False
+
+
 def main():
     """CLI interface."""
     
     if len(sys.argv) < 2:
-        print("""VUA Manifest Validator — Pure Python""")
+        print("""VUA Manifest Validator — Pure Python
+
+  validate MANIFEST [--cache DB] [--stream]
+  validate-tree ROOT... [--workers N] [--pattern GLOB] [--cache DB] [--stream]
+  watch ROOT... [--pattern GLOB] [--debounce S] [--interval S] [--cache DB]
+        [--log DIR] [--stream] [--poll] [--no-initial]
+  create VERSION MODULE[=ARTIFACT]...
+  attestation MANIFEST""")
         return
 
     cmd = sys.argv[1]
 
-    if cmd == 'validate' and len(sys.argv) > 2:
+    if cmd == 'validate' and {'--cache', '--stream'} & set(sys.argv) and len(sys.argv) > 3:
+        args = sys.argv[2:]
+        cache_path = _pop_option(args, '--cache')
+        stream = _pop_flag(args, '--stream')
+        cache = ValidationCache(cache_path) if cache_path else None
+        try:
+            results = validate_cached(args[0], cache, stream)
+        finally:
+            if cache:
+                cache.close()
+        ManifestValidator().print_report(results)
+
+        if results['valid']:
+            print("Attestation:")
+            print(json.dumps(results['attestation'], indent=2))
+
+    elif cmd == 'validate' and len(sys.argv) > 2:
         validator = ManifestValidator()
         if validator.load(sys.argv[2]):
             results = validator.full_validate()
@@ -261,14 +1107,75 @@ def main():
                 print("Attestation:")
                 print(json.dumps(attestation, indent=2))
 
+    elif cmd == 'validate-tree' and len(sys.argv) > 2:
+        args = sys.argv[2:]
+        workers = _pop_option(args, '--workers')
+        pattern = _pop_option(args, '--pattern', '*.json')
+        cache_path = _pop_option(args, '--cache')
+        stream = _pop_flag(args, '--stream')
+        cache = ValidationCache(cache_path) if cache_path else None
+        started = time.time()
+        summary = {'type': 'summary', 'total': 0, 'valid': 0, 'invalid': 0, 'warnings': 0}
+
+        try:
+            for result in validate_tree(args, pattern, int(workers) if workers else None,
+                                        cache=cache, stream=stream):
+                summary['total'] += 1
+                summary['valid' if result['valid'] else 'invalid'] += 1
+                summary['warnings'] += len(result['warnings'])
+                print(json.dumps({'type': 'result', **result}, ensure_ascii=False), flush=True)
+        finally:
+            if cache:
+                summary['cache_hits'] = cache.hits
+                cache.close()
+
+        summary['elapsed'] = round(time.time() - started, 3)
+        print(json.dumps(summary), flush=True)
+        sys.exit(1 if summary['invalid'] else 0)
+
+    elif cmd == 'watch' and len(sys.argv) > 2:
+        args = sys.argv[2:]
+        pattern = _pop_option(args, '--pattern', '*.json')
+        debounce = float(_pop_option(args, '--debounce', '0.25'))
+        interval = float(_pop_option(args, '--interval', '1.0'))
+        cache_path = _pop_option(args, '--cache')
+        log_dir = _pop_option(args, '--log')
+        stream = _pop_flag(args, '--stream')
+        polling = _pop_flag(args, '--poll')
+        initial = not _pop_flag(args, '--no-initial')
+
+        log = None
+        if log_dir:
+            core = _load_core()
+            log = core.EventLog('VUA-WATCH', storage=core.SegmentedEventStore(log_dir))
+        cache = ValidationCache(cache_path) if cache_path else None
+        watcher = ManifestWatcher(args, pattern, debounce, interval, cache, stream, log, polling)
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        try:
+            watcher.run(initial)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            watcher.close()
+            if cache:
+                cache.close()
+            if log is not None:
+                log.events.close()
+
     elif cmd == 'create' and len(sys.argv) > 3:
         version = sys.argv[2]
-        modules = sys.argv[3:]
+        modules, artifacts = [], {}
+        for arg in sys.argv[3:]:
+            module, _, artifact = arg.partition('=')
+            modules.append(module)
+            if artifact:
+                artifacts[module] = artifact
         
         manifest = ManifestGenerator.create(
             package='Veroti Unified Architecture — TOTALITY',
             version=version,
-            modules=modules
+            modules=modules,
+            artifacts=artifacts
         )
         
         filename = f'TOTALITY_MANIFEST_v{version}.json'